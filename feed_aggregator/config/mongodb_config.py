@@ -2,7 +2,7 @@
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 @dataclass
@@ -15,6 +15,27 @@ class MongoDBConfig:
     password: Optional[str]
     database: str
     auth_source: Optional[str]
+    max_pool_size: int = 32
+    min_pool_size: int = 4
+    server_selection_timeout_ms: int = 5000
+    socket_timeout_ms: int = 30000
+    compressors: Optional[str] = None
+    app_name: str = "feed-aggregator"
+    write_concurrency: int = 4
+
+    def get_client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for MongoClient: pool size, timeouts, compression."""
+        options = {
+            "appname": self.app_name,
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "socketTimeoutMS": self.socket_timeout_ms,
+            "retryWrites": True,
+        }
+        if self.compressors:
+            options["compressors"] = self.compressors
+        return options
 
     def get_uri(self) -> str:
         """Construct MongoDB URI from configuration."""
@@ -45,6 +66,11 @@ class EnvironmentMongoDBConfigProvider(MongoDBConfigProvider):
         password = os.getenv("MONGODB_PASSWORD", "")
         database = os.getenv("MONGODB_DATABASE", "feeddb")
         auth_source = os.getenv("MONGODB_AUTH_SOURCE", database)
+        # e.g. "zstd,snappy,zlib"; useful when the server is not on localhost
+        compressors = os.getenv("MONGODB_COMPRESSORS")
+        # Bulk writes in flight at once; past a few, server contention
+        # lowers total throughput
+        write_concurrency = int(os.getenv("MONGODB_WRITE_CONCURRENCY", "4"))
 
         # Handle empty string as None for optional fields
         username = username if username else None
@@ -58,6 +84,8 @@ class EnvironmentMongoDBConfigProvider(MongoDBConfigProvider):
             password=password,
             database=database,
             auth_source=auth_source,
+            compressors=compressors or None,
+            write_concurrency=write_concurrency,
         )
 
 
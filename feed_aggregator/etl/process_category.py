@@ -1,5 +1,7 @@
+import asyncio
 import os
 import subprocess  # nosec B404 - Used for controlled git operations
+import threading
 from datetime import datetime
 from typing import Optional
 
@@ -14,6 +16,9 @@ from feed_aggregator.storage.mongodb_client import MongoDBClient
 # Set up logger
 logger = setup_logging(__name__)
 
+# Serializes feed.xml regeneration and git pushes across category threads
+_publish_lock = threading.Lock()
+
 
 def git_commit_and_push():
     """Commit and push feed.xml changes with timestamp."""
@@ -33,6 +38,17 @@ def git_commit_and_push():
         logger.error(f"Error during git operations: {e}")
 
 
+def _update_feed_and_push():
+    """Regenerate feed.xml and push it.
+
+    Categories may be processed in parallel threads; the lock keeps their
+    feed writes and git commits from interleaving.
+    """
+    with _publish_lock:
+        update_feed.main()
+        git_commit_and_push()
+
+
 def _initialize_components(category_key: str, category_config: CategoryConfig):
     """Initialize fetcher, analyzers, and database client.
 
@@ -90,31 +106,17 @@ def _get_category_data(
     return data
 
 
-def _process_single_item(
-    item, content_analyzer, llm_filter, mongo_client, quality_threshold: float
-):
-    """Process a single feed item.
+def _combine_item_content(item):
+    """Combine an item's Feedly content with its fetched URL content.
 
-    Args:
-        item: Feed item to process
-        content_analyzer: Content analyzer instance
-        llm_filter: LLM filter instance
-        mongo_client: MongoDB client
-        quality_threshold: Quality threshold for the category
+    Returns:
+        Tuple of the combined content and the URL content
     """
-    # Check if item exists and has been analyzed
-    existing_item = mongo_client.get_item(item["id"])
-    if existing_item and "llm_analysis" in existing_item:
-        logger.debug("Item already analyzed, skipping...")
-        return None
-
-    # Get all available content
-    feedly_content = item.get("content", {}).get(
-        "content", item.get("summary", {}).get("content", "")
-    )
+    feedly_content = (item.get("content") or {}).get("content") or (
+        item.get("summary") or {}
+    ).get("content", "")
     url_content = item.get("url_content", {})
 
-    # Combine content for analysis
     combined_content = feedly_content
     if url_content:
         if url_content.get("main_content"):
@@ -122,20 +124,17 @@ def _process_single_item(
         if url_content.get("description"):
             combined_content = f"{combined_content}\n\n{url_content['description']}"
 
-    # Run content analysis
-    content_analysis = content_analyzer.analyze_item(
-        {"content": combined_content, "llm_analysis": {}}
-    )
+    return combined_content, url_content
 
-    # Run LLM analysis with all available content
-    llm_analysis = llm_filter.analyze_item(
-        {
-            "title": item.get("title", ""),
-            "content": combined_content,
-            "url_content_available": bool(url_content),
-        }
-    )
 
+def _apply_analyses(
+    item, content_analysis, llm_analysis, mongo_client, quality_threshold: float
+) -> int:
+    """Store analyses on an item and classify it.
+
+    Returns:
+        1 if the item is high quality, 0 otherwise
+    """
     # Add analyses to item
     item["content_analysis"] = content_analysis
     item["llm_analysis"] = llm_analysis
@@ -157,8 +156,103 @@ def _process_single_item(
     return 0  # Not high quality
 
 
-def _clean_item_data(item):
-    """Clean up item data before storing and fetch URL content."""
+def _skip_analyzed_items(items: list, mongo_client) -> list:
+    """Drop items that already have an LLM analysis, checked in one query."""
+    if not items:
+        return items
+    analyzed_ids = mongo_client.get_analyzed_ids(item["id"] for item in items)
+    if analyzed_ids:
+        logger.debug(f"Skipping {len(analyzed_ids)} already analyzed items")
+    return [item for item in items if item["id"] not in analyzed_ids]
+
+
+def _process_single_item(
+    item, content_analyzer, llm_filter, mongo_client, quality_threshold: float
+):
+    """Process a single feed item.
+
+    Callers drop already analyzed items first with _skip_analyzed_items.
+
+    Args:
+        item: Feed item to process
+        content_analyzer: Content analyzer instance
+        llm_filter: LLM filter instance
+        mongo_client: MongoDB client
+        quality_threshold: Quality threshold for the category
+    """
+    # Get all available content
+    combined_content, url_content = _combine_item_content(item)
+
+    # Run content analysis
+    content_analysis = content_analyzer.analyze_item(
+        {"content": combined_content, "llm_analysis": {}}
+    )
+
+    # Run LLM analysis with all available content
+    llm_analysis = llm_filter.analyze_item(
+        {
+            "title": item.get("title", ""),
+            "content": combined_content,
+            "url_content_available": bool(url_content),
+        }
+    )
+
+    return _apply_analyses(
+        item, content_analysis, llm_analysis, mongo_client, quality_threshold
+    )
+
+
+async def _aprocess_single_item(
+    item,
+    content_analyzer,
+    llm_filter,
+    llm_client,
+    mongo_client,
+    quality_threshold: float,
+):
+    """Process a single feed item without blocking the event loop.
+
+    Content analysis runs in a worker thread while the LLM request goes
+    through the shared async client. Callers drop already analyzed items
+    first with _skip_analyzed_items.
+
+    Args:
+        item: Feed item to process
+        content_analyzer: Content analyzer instance
+        llm_filter: LLM filter instance
+        llm_client: Async client from llm_filter.async_client
+        mongo_client: MongoDB client
+        quality_threshold: Quality threshold for the category
+    """
+    combined_content, url_content = _combine_item_content(item)
+    content_analysis, llm_analysis = await asyncio.gather(
+        asyncio.to_thread(
+            content_analyzer.analyze_item,
+            {"content": combined_content, "llm_analysis": {}},
+        ),
+        llm_filter.aanalyze_item(
+            {
+                "title": item.get("title", ""),
+                "content": combined_content,
+                "url_content_available": bool(url_content),
+            },
+            llm_client,
+        ),
+    )
+
+    return _apply_analyses(
+        item, content_analysis, llm_analysis, mongo_client, quality_threshold
+    )
+
+
+def _clean_item_data(item, url_fetcher: Optional[URLFetcher] = None):
+    """Clean up item data before storing and fetch URL content.
+
+    Args:
+        item: Feed item to clean in place
+        url_fetcher: Fetcher to reuse across items; a temporary one is
+            created and closed if not given
+    """
     # Clean up leoSummary if present
     if "leoSummary" in item and "sentences" in item["leoSummary"]:
         # Convert sentence objects to strings
@@ -175,14 +269,16 @@ def _clean_item_data(item):
             else None
         )
         if url:
+            fetcher = url_fetcher or URLFetcher()
             try:
-                url_fetcher = URLFetcher()
-                url_content = url_fetcher.fetch_url_content(url)
+                url_content = fetcher.fetch_url_content(url)
                 if url_content:
                     item["url_content"] = url_content
-                url_fetcher.close()
             except Exception as e:
                 logger.error(f"Error fetching URL content: {e}", exc_info=True)
+            finally:
+                if url_fetcher is None:
+                    fetcher.close()
 
 
 def fetch_category_articles(category_key: str, category_config: CategoryConfig) -> int:
@@ -213,20 +309,32 @@ def fetch_category_articles(category_key: str, category_config: CategoryConfig)
         # Get category data
         data = _get_category_data(fetcher, user_id, category_key, category_config)
 
-        new_articles = 0
-        for item in data["items"]:
-            # Check if item already exists
-            if mongo_client.item_exists(item["id"]):
-                continue
-
-            # Add category and processing status
-            item["category"] = category_key
-            item["processing_status"] = mongo_client.STATUS_PENDING
+        # Check which items already exist in one query
+        existing_ids = mongo_client.get_existing_ids(
+            item["id"] for item in data["items"]
+        )
 
-            # Clean up and store item
-            _clean_item_data(item)
-            mongo_client.store_feed_items([item])
-            new_articles += 1
+        new_items = []
+        # One fetcher keeps connections to article hosts alive across items
+        url_fetcher = URLFetcher()
+        try:
+            for item in data["items"]:
+                if item["id"] in existing_ids:
+                    continue
+
+                # Add category and processing status
+                item["category"] = category_key
+                item["processing_status"] = mongo_client.STATUS_PENDING
+
+                # Clean up item
+                _clean_item_data(item, url_fetcher)
+                new_items.append(item)
+        finally:
+            url_fetcher.close()
+            # Store everything cleaned so far in one bulk write
+            if new_items:
+                mongo_client.store_feed_items(new_items)
+        new_articles = len(new_items)
 
         logger.info(f"Fetched {new_articles} new articles from {category_key}")
         mongo_client.close()
@@ -273,6 +381,21 @@ def _initialize_category_components(categories: list, category_config: CategoryC
     return category_components, category_stats
 
 
+def _save_item_analysis(item, mongo_client) -> None:
+    """Write an analyzed item's results back to MongoDB."""
+    update_data = {
+        "content_analysis": item.get("content_analysis"),
+        "llm_analysis": item.get("llm_analysis"),
+        "processing_status": item.get("processing_status"),
+    }
+
+    # Include URL content if available
+    if "url_content" in item:
+        update_data["url_content"] = item["url_content"]
+
+    mongo_client.update_item(item["id"], update_data)
+
+
 def _process_category_batch(
     category_key: str, components: dict, category_stats: dict, batch_size: int
 ) -> int:
@@ -280,8 +403,11 @@ def _process_category_batch(
     mongo_client = components["mongo_client"]
 
     # Get pending articles for this category
-    pending_articles = mongo_client.get_items_by_status(
-        status=mongo_client.STATUS_PENDING, category=category_key, limit=batch_size
+    pending_articles = _skip_analyzed_items(
+        mongo_client.get_items_by_status(
+            status=mongo_client.STATUS_PENDING, category=category_key, limit=batch_size
+        ),
+        mongo_client,
     )
 
     if not pending_articles:
@@ -300,21 +426,7 @@ def _process_category_batch(
                 components["quality_threshold"],
             )
 
-            if quality_result is None:
-                continue
-
-            # Update item in database
-            update_data = {
-                "content_analysis": item.get("content_analysis"),
-                "llm_analysis": item.get("llm_analysis"),
-                "processing_status": item.get("processing_status"),
-            }
-
-            # Include URL content if available
-            if "url_content" in item:
-                update_data["url_content"] = item["url_content"]
-
-            mongo_client.update_item(item["id"], update_data)
+            _save_item_analysis(item, mongo_client)
 
             # Update stats
             category_stats[category_key]["processed"] += 1
@@ -329,8 +441,7 @@ def _process_category_batch(
                         f"{category_key}: Found {target} high quality articles - "
                         "updating feed..."
                     )
-                    update_feed.main()
-                    git_commit_and_push()
+                    _update_feed_and_push()
                     components["high_quality_count"] = 0
             else:
                 category_stats[category_key]["filtered"] += 1
@@ -423,9 +534,20 @@ def _print_final_stats(mongo_client):
 
 
 def _process_pending_articles_step(
-    category_key: str, category_config: CategoryConfig, mongo_client
+    category_key: str,
+    category_config: CategoryConfig,
+    mongo_client,
+    max_concurrency: Optional[int] = None,
 ) -> None:
-    """Step 2: Process all pending articles from MongoDB."""
+    """Step 2: Process all pending articles from MongoDB.
+
+    Args:
+        category_key: Category to process
+        category_config: Category configuration
+        mongo_client: MongoDB client
+        max_concurrency: LLM requests this category may have in flight,
+            defaults to OLLAMA_NUM_PARALLEL
+    """
     logger.info(f"{'='*50}")
     logger.info("STEP 2: PROCESSING PENDING ARTICLES FROM MONGODB")
     logger.info(f"{'='*50}")
@@ -450,33 +572,76 @@ def _process_pending_articles_step(
 
     quality_threshold = category_config.get_quality_threshold(category_key)
     high_quality_target = category_config.get_high_quality_target(category_key)
-    high_quality_count = 0
 
-    # Process each pending article
-    for i, item in enumerate(pending_articles, 1):
-        logger.info(f"Processing item {i}/{len(pending_articles)}")
-        logger.info(f"Title: {item.get('title', 'No title')}")
+    asyncio.run(
+        _aprocess_pending_articles(
+            pending_articles,
+            content_analyzer,
+            llm_filter,
+            mongo_client,
+            quality_threshold,
+            high_quality_target,
+            max_concurrency,
+        )
+    )
+
 
-        try:
-            quality_result = _process_single_item(
-                item, content_analyzer, llm_filter, mongo_client, quality_threshold
+async def _aprocess_pending_articles(
+    pending_articles: list,
+    content_analyzer,
+    llm_filter,
+    mongo_client,
+    quality_threshold: float,
+    high_quality_target: int,
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """Analyze pending articles concurrently, at most max_concurrency at once.
+
+    All requests share one async LLM client. Results are saved and counted
+    as they complete, so the feed is still updated each time
+    high_quality_target high quality articles are found.
+    """
+    pending_articles = await asyncio.to_thread(
+        _skip_analyzed_items, pending_articles, mongo_client
+    )
+    if max_concurrency is None:
+        max_concurrency = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(pending_articles)
+
+    async def process(index, item, llm_client):
+        async with semaphore:
+            logger.info(f"Processing item {index}/{total}")
+            logger.info(f"Title: {item.get('title', 'No title')}")
+            quality_result = await _aprocess_single_item(
+                item,
+                content_analyzer,
+                llm_filter,
+                llm_client,
+                mongo_client,
+                quality_threshold,
             )
+            return item, quality_result
 
-            if quality_result is None:  # Item was skipped (already analyzed)
-                continue
+    async with llm_filter.async_client() as llm_client:
+        tasks = [
+            asyncio.ensure_future(process(index, item, llm_client))
+            for index, item in enumerate(pending_articles, 1)
+        ]
+        await _save_completed_items(tasks, mongo_client, high_quality_target)
 
-            # Update the item in MongoDB with analysis results
-            update_data = {
-                "content_analysis": item.get("content_analysis"),
-                "llm_analysis": item.get("llm_analysis"),
-                "processing_status": item.get("processing_status"),
-            }
 
-            # Include URL content if available
-            if "url_content" in item:
-                update_data["url_content"] = item["url_content"]
+async def _save_completed_items(
+    tasks: list, mongo_client, high_quality_target: int
+) -> None:
+    """Save analyzed items as they complete and update the feed periodically."""
+    high_quality_count = 0
+    for next_result in asyncio.as_completed(tasks):
+        try:
+            item, quality_result = await next_result
 
-            mongo_client.update_item(item["id"], update_data)
+            # Update the item in MongoDB with analysis results
+            await asyncio.to_thread(_save_item_analysis, item, mongo_client)
 
             if quality_result == 1:  # High quality
                 high_quality_count += 1
@@ -489,8 +654,7 @@ def _process_pending_articles_step(
                     logger.info(
                         f"Found {high_quality_target} high quality articles - updating feed..."
                     )
-                    update_feed.main()
-                    git_commit_and_push()
+                    await asyncio.to_thread(_update_feed_and_push)
                     high_quality_count = 0  # Reset counter
 
         except Exception as e:
@@ -517,18 +681,19 @@ def _publish_unpublished_articles_step(
             f"Found {len(unpublished_articles)} unpublished high-quality articles"
         )
         logger.info("Updating feed with pending articles...")
-        update_feed.main()
-        git_commit_and_push()
+        _update_feed_and_push()
     else:
         logger.info("No unpublished high-quality articles found")
 
 
-def main(category_key: Optional[str] = None):
+def main(category_key: Optional[str] = None, max_concurrency: Optional[int] = None):
     """Main processing function.
 
     Args:
         category_key: Category to process (e.g., 'ML', 'Tech').
                      If None, defaults to 'ML' for backward compatibility.
+        max_concurrency: LLM requests this category may have in flight,
+                     defaults to OLLAMA_NUM_PARALLEL.
     """
     if category_key is None:
         category_key = "ML"  # Default for backward compatibility
@@ -561,7 +726,9 @@ def main(category_key: Optional[str] = None):
         _, _, _, mongo_client = _initialize_components(category_key, category_config)
 
         # Step 2: Process all pending articles from MongoDB
-        _process_pending_articles_step(category_key, category_config, mongo_client)
+        _process_pending_articles_step(
+            category_key, category_config, mongo_client, max_concurrency
+        )
 
         # Step 3: Publish any unpublished high-quality articles
         _publish_unpublished_articles_step(category_key, category_config, mongo_client)
@@ -1,9 +1,54 @@
 """Feed fetcher package."""
+import asyncio
 import os
+from typing import Any, Dict, List, Optional, Union
 
 from feedly.api_client.session import FeedlySession
+from requests.adapters import HTTPAdapter
 
+from feed_aggregator import json_utils
 from feed_aggregator.fetcher.url_fetcher import URLFetcher
+from feed_aggregator.processing.llm_cache import (
+    DEFAULT_CACHE_DIR,
+    CacheBackend,
+    LLMCache,
+)
+
+# Keep-alive connections kept per Feedly host, enough for parallel fetches
+FEEDLY_POOL_MAXSIZE = 16
+
+# Where development runs keep cached stream contents
+DEFAULT_FEEDLY_CACHE_DIR = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "feedly")
+
+# Streams fetched at once by aget_streams_contents
+FEEDLY_FETCH_CONCURRENCY = 8
+
+
+class _FeedlySession(FeedlySession):
+    """FeedlySession that decodes responses with json_utils (orjson if present).
+
+    Stream responses can be hundreds of KB; orjson parses the raw bytes
+    without decoding them to str first.
+    """
+
+    def do_api_request(
+        self,
+        relative_url: str,
+        method: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict] = None,
+        timeout: Optional[int] = None,
+        max_tries: Optional[int] = None,
+    ) -> Union[Dict[str, Any], List[Any], None]:
+        resp = self.make_api_request(
+            relative_url=relative_url,
+            method=method,
+            params=params,
+            data=data,
+            timeout=timeout,
+            max_tries=max_tries,
+        )
+        return json_utils.loads(resp.content) if resp.content else None
 
 
 class FeedlyFetcher:
@@ -14,7 +59,18 @@ class FeedlyFetcher:
         token: str | None = None,
         user_id: str | None = None,
         demo_mode: bool = False,
+        cache: Optional[CacheBackend] = None,
     ):
+        """Initialize the fetcher.
+
+        Args:
+            token: Feedly access token, defaults to FEEDLY_TOKEN
+            user_id: Feedly user id, defaults to FEEDLY_USER
+            demo_mode: Return sample data instead of calling Feedly
+            cache: Optional backend storing stream contents by stream id and
+                count, for example a DiskBackend with a ttl during development
+        """
+        self.cache = cache
         self.token = token or os.environ.get("FEEDLY_TOKEN")
         self.user_id = user_id or os.environ.get("FEEDLY_USER")
         self.demo_mode = demo_mode
@@ -25,10 +81,27 @@ class FeedlyFetcher:
             )
 
         if not self.demo_mode:
-            self.session = FeedlySession(auth=self.token, user_id=self.user_id)
+            self.session = _FeedlySession(auth=self.token, user_id=self.user_id)
+            # FeedlySession already reuses connections through a
+            # requests.Session and retries in make_api_request, so only the
+            # pool is enlarged; max_retries=1 matches the adapter it replaces
+            self.session.session.mount(
+                self.session.api_host,
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=FEEDLY_POOL_MAXSIZE,
+                    max_retries=1,
+                ),
+            )
         else:
             self.session = None
 
+    def close(self) -> None:
+        """Close the Feedly session and its pooled connections."""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
     def _get_category_stream(self, count: int) -> list:
         """Get stream contents from the first available category."""
         print("Fetching stream from Feedly API...")
@@ -93,7 +166,18 @@ class FeedlyFetcher:
         """Return contents for a given stream id."""
         if self.demo_mode:
             return self._get_demo_data(stream_id, count)
-
+        if self.cache is None:
+            return self._fetch_stream_contents(stream_id, count)
+
+        key = LLMCache.make_key({"stream_id": stream_id, "count": count})
+        contents = self.cache.get(key)
+        if contents is None:
+            contents = self._fetch_stream_contents(stream_id, count)
+            self.cache.set(key, contents)
+        return contents
+
+    def _fetch_stream_contents(self, stream_id: str, count: int) -> dict:
+        """Fetch contents for a stream id from the Feedly API."""
         try:
             # Extract category name from stream ID
             if "category/" in stream_id:
@@ -124,6 +208,41 @@ class FeedlyFetcher:
             msg = f"Feedly API call failed: {err}"
             raise RuntimeError(msg) from err
 
+    async def aget_stream_contents(self, stream_id: str, count: int = 10) -> dict:
+        """Async variant of get_stream_contents.
+
+        The Feedly client is synchronous, so the fetch runs in a worker
+        thread over the shared connection pool.
+        """
+        return await asyncio.to_thread(self.get_stream_contents, stream_id, count)
+
+    async def aget_streams_contents(
+        self,
+        stream_ids: List[str],
+        count: int = 10,
+        concurrency: int = FEEDLY_FETCH_CONCURRENCY,
+    ) -> List[dict]:
+        """Fetch several streams concurrently.
+
+        Args:
+            stream_ids: Stream ids to fetch
+            count: Number of items to fetch per stream
+            concurrency: Maximum streams fetched at once
+
+        Returns:
+            Stream contents in the order of stream_ids
+
+        Raises:
+            RuntimeError: If any stream fails to load
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(stream_id: str) -> dict:
+            async with semaphore:
+                return await self.aget_stream_contents(stream_id, count)
+
+        return await asyncio.gather(*(fetch(stream_id) for stream_id in stream_ids))
+
     def _find_entry_in_stream(self, stream, entry_id: str) -> dict | None:
         """Search for an entry in a stream by its ID.
 
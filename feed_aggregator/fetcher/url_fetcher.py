@@ -4,21 +4,42 @@ from typing import Dict, Optional
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Pages larger than this are skipped rather than downloaded and parsed
+MAX_CONTENT_BYTES = 2_000_000
+
+# Content-Type prefixes worth parsing as HTML
+PARSEABLE_CONTENT_TYPES = ("text/", "application/xhtml")
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# Keep-alive connections kept per host and across hosts, so one fetcher can
+# be reused for a whole run of articles
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
 
 class URLFetcher:
     """Fetches and extracts content from URLs."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_bytes: int = MAX_CONTENT_BYTES):
         """Initialize URL fetcher.
 
         Args:
             timeout: Request timeout in seconds
+            max_bytes: Largest response body to download and parse
         """
         self.timeout = timeout
+        self.max_bytes = max_bytes
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         # Set a reasonable user agent
         self.session.headers.update(
             {
@@ -29,6 +50,9 @@ class URLFetcher:
     def fetch_url_content(self, url: str) -> Optional[Dict]:
         """Fetch content from a URL.
 
+        Non-HTML responses and bodies over max_bytes are skipped. The body
+        is streamed, so both checks happen before a large download.
+
         Args:
             url: URL to fetch content from
 
@@ -36,11 +60,14 @@ class URLFetcher:
             Dictionary containing extracted content or None if failed
         """
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                body = self._read_body(url, response)
+            if body is None:
+                return None
 
             # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(body, "html.parser", from_encoding=response.encoding)
 
             # Remove script and style elements
             for element in soup(["script", "style"]):
@@ -60,6 +87,27 @@ class URLFetcher:
             logger.warning(f"Failed to fetch URL {url}: {str(e)}")
             return None
 
+    def _read_body(self, url: str, response: requests.Response) -> Optional[bytes]:
+        """Read a response body if it is HTML and within max_bytes."""
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.startswith(PARSEABLE_CONTENT_TYPES):
+            logger.info(f"Skipping {url}: unsupported content type {content_type}")
+            return None
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            logger.info(f"Skipping {url}: {content_length} bytes")
+            return None
+
+        # Content-Length may be absent or wrong, so cap the bytes read too
+        body = bytearray()
+        for chunk in response.iter_content(READ_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > self.max_bytes:
+                logger.info(f"Skipping {url}: larger than {self.max_bytes} bytes")
+                return None
+        return bytes(body)
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract title from HTML."""
         # Try og:title first
@@ -1,13 +1,115 @@
 import hashlib
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _SourceHandler:
+    """Default field extraction, used as-is for the test source."""
+
+    REQUIRED_FIELDS: Tuple[str, ...] = ("id", "title")
+
+    def source_id(self, item: Dict[str, Any]) -> str:
+        """Get source-specific ID."""
+        return item["id"]
+
+    def content(self, item: Dict[str, Any]) -> str:
+        """Extract content from item."""
+        return item.get("content", "")
+
+    def url(self, item: Dict[str, Any]) -> Optional[str]:
+        """Get item URL."""
+        return None
+
+    def published_date(self, item: Dict[str, Any]) -> datetime:
+        """Convert published date to UTC datetime."""
+        return datetime.now(timezone.utc)
+
+    def tags(self, item: Dict[str, Any]) -> List[str]:
+        """Get item tags."""
+        return []
+
+    def metadata(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Get source-specific metadata."""
+        return {}
+
+
+class _FeedlyHandler(_SourceHandler):
+    """Field extraction for Feedly API entries."""
+
+    def content(self, item: Dict[str, Any]) -> str:
+        content = item.get("content", {}).get("content")
+        if not content:
+            content = item.get("summary", {}).get("content", "")
+        return content
+
+    def url(self, item: Dict[str, Any]) -> Optional[str]:
+        alternates = item.get("alternate", [])
+        if alternates and "href" in alternates[0]:
+            return alternates[0]["href"]
+        return None
+
+    def published_date(self, item: Dict[str, Any]) -> datetime:
+        # Feedly uses milliseconds since epoch
+        if "published" in item:
+            return datetime.fromtimestamp(item["published"] / 1000, tz=timezone.utc)
+        return super().published_date(item)
+
+    def tags(self, item: Dict[str, Any]) -> List[str]:
+        return item.get("keywords", [])
+
+    def metadata(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = {}
+        origin = item.get("origin", {})
+        if "title" in origin:
+            metadata["source_feed"] = origin["title"]
+        return metadata
+
+
+class _RSSHandler(_SourceHandler):
+    """Field extraction for RSS items."""
+
+    # RSS items are identified by guid/link rather than an id field
+    REQUIRED_FIELDS = ("title",)
+
+    def source_id(self, item: Dict[str, Any]) -> str:
+        return item.get("guid", item.get("link", ""))
+
+    def content(self, item: Dict[str, Any]) -> str:
+        return item.get("description", "")
+
+    def url(self, item: Dict[str, Any]) -> Optional[str]:
+        return item.get("link")
+
+    def published_date(self, item: Dict[str, Any]) -> datetime:
+        # RSS uses RFC 2822 format
+        if "pubDate" in item:
+            try:
+                return datetime.strptime(
+                    item["pubDate"], "%a, %d %b %Y %H:%M:%S %Z"
+                ).replace(tzinfo=timezone.utc)
+            except ValueError:
+                pass
+        return super().published_date(item)
+
+    def tags(self, item: Dict[str, Any]) -> List[str]:
+        categories = item.get("category", [])
+        if isinstance(categories, str):
+            return [categories]
+        return categories
 
 
 class DataNormalizer:
     """Normalizes data from various sources into a standard format."""
 
-    SUPPORTED_SOURCES = ["feedly", "rss", "test"]
-    REQUIRED_FIELDS = ["id", "title"]
+    # Handlers are selected once per item instead of re-checking the source
+    # inside every field extractor.
+    _HANDLERS: Dict[str, _SourceHandler] = {
+        "feedly": _FeedlyHandler(),
+        "rss": _RSSHandler(),
+        "test": _SourceHandler(),
+    }
+
+    SUPPORTED_SOURCES = list(_HANDLERS)
 
     def normalize(self, item: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Normalize an item from a specific source into standard format.
@@ -23,26 +125,27 @@ class DataNormalizer:
             ValueError: If source is invalid or required fields are missing
         """
         # Validate source
-        if source not in self.SUPPORTED_SOURCES:
+        handler = self._HANDLERS.get(source)
+        if handler is None:
             raise ValueError(f"Unsupported source: {source}")
 
         # Validate required fields
-        for field in self.REQUIRED_FIELDS:
-            if field not in item and (source != "rss" or field != "id"):
+        for field in handler.REQUIRED_FIELDS:
+            if field not in item:
                 raise ValueError(f"Missing required field: {field}")
 
         # Create base normalized item
         normalized = {
             "source": source,
-            "source_id": self._get_source_id(item, source),
+            "source_id": handler.source_id(item),
             "title": item["title"],
-            "content": self._get_content(item, source),
-            "url": self._get_url(item, source),
+            "content": handler.content(item),
+            "url": handler.url(item),
             "author": self._get_author(item),
-            "published_date": self._get_published_date(item, source),
+            "published_date": handler.published_date(item),
             "ingested_date": datetime.now(timezone.utc),
-            "tags": self._get_tags(item, source),
-            "metadata": self._get_metadata(item, source),
+            "tags": handler.tags(item),
+            "metadata": handler.metadata(item),
             "processing_status": "pending",
         }
 
@@ -51,76 +154,10 @@ class DataNormalizer:
 
         return normalized
 
-    def _get_source_id(self, item: Dict[str, Any], source: str) -> str:
-        """Get source-specific ID."""
-        if source == "rss":
-            return item.get("guid", item.get("link", ""))
-        return item["id"]
-
-    def _get_content(self, item: Dict[str, Any], source: str) -> str:
-        """Extract content from item."""
-        if source == "feedly":
-            content = item.get("content", {}).get("content")
-            if not content:
-                content = item.get("summary", {}).get("content", "")
-            return content
-        elif source == "rss":
-            return item.get("description", "")
-        return item.get("content", "")
-
-    def _get_url(self, item: Dict[str, Any], source: str) -> Optional[str]:
-        """Get item URL."""
-        if source == "feedly":
-            alternates = item.get("alternate", [])
-            if alternates and "href" in alternates[0]:
-                return alternates[0]["href"]
-        elif source == "rss":
-            return item.get("link")
-        return None
-
     def _get_author(self, item: Dict[str, Any]) -> Optional[str]:
         """Get item author."""
         return item.get("author")
 
-    def _get_published_date(
-        self, item: Dict[str, Any], source: str
-    ) -> Optional[datetime]:
-        """Convert published date to UTC datetime."""
-        if source == "feedly":
-            # Feedly uses milliseconds since epoch
-            if "published" in item:
-                return datetime.fromtimestamp(item["published"] / 1000, tz=timezone.utc)
-        elif source == "rss":
-            # RSS uses RFC 2822 format
-            if "pubDate" in item:
-                try:
-                    return datetime.strptime(
-                        item["pubDate"], "%a, %d %b %Y %H:%M:%S %Z"
-                    ).replace(tzinfo=timezone.utc)
-                except ValueError:
-                    pass
-        return datetime.now(timezone.utc)
-
-    def _get_tags(self, item: Dict[str, Any], source: str) -> List[str]:
-        """Get item tags."""
-        if source == "feedly":
-            return item.get("keywords", [])
-        elif source == "rss":
-            categories = item.get("category", [])
-            if isinstance(categories, str):
-                return [categories]
-            return categories
-        return []
-
-    def _get_metadata(self, item: Dict[str, Any], source: str) -> Dict[str, Any]:
-        """Get source-specific metadata."""
-        metadata = {}
-        if source == "feedly":
-            origin = item.get("origin", {})
-            if "title" in origin:
-                metadata["source_feed"] = origin["title"]
-        return metadata
-
     def _generate_id(self, item: Dict[str, Any]) -> str:
         """Generate unique ID based on item content."""
         # Create a string combining key fields
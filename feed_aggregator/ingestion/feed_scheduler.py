@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 from feed_aggregator.fetcher import FeedlyFetcher
 from feed_aggregator.ingestion.data_normalizer import DataNormalizer
@@ -11,6 +12,9 @@ logger = logging.getLogger(__name__)
 class FeedScheduler:
     """Coordinates fetching and storing feed items."""
 
+    # Number of recently seen items remembered to skip overlapping fetches
+    SEEN_CACHE_SIZE = 100_000
+
     def __init__(
         self,
         mongodb_client: Optional[MongoDBClient] = None,
@@ -25,6 +29,58 @@ class FeedScheduler:
         self.mongodb = mongodb_client or MongoDBClient()
         self.fetcher = FeedlyFetcher(demo_mode=demo_mode)
         self.normalizer = DataNormalizer()
+        self._seen: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def _item_key(item: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Identify a raw item across fetches."""
+        return (item.get("id"), item.get("title"))
+
+    def _is_new(self, item: Dict[str, Any]) -> bool:
+        """Check an item against items stored by earlier fetches.
+
+        Args:
+            item: Raw item from source
+
+        Returns:
+            False if the item was already stored by this scheduler
+        """
+        key = self._item_key(item)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
+        return True
+
+    def _remember(self, keys: Iterable[Tuple[Any, Any]]) -> None:
+        """Record stored items, evicting the oldest beyond SEEN_CACHE_SIZE.
+
+        Args:
+            keys: Keys returned by _item_key for the stored items
+        """
+        for key in keys:
+            self._seen[key] = None
+        while len(self._seen) > self.SEEN_CACHE_SIZE:
+            self._seen.popitem(last=False)
+
+    def _normalize_new_items(
+        self, items: Iterable[Dict[str, Any]], keys: Dict[Tuple[Any, Any], Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Normalize unseen items lazily, collecting their keys.
+
+        Args:
+            items: Raw items from source
+            keys: Filled in order with the keys of the yielded items, mapped
+                to the id each normalized item is stored under
+
+        Yields:
+            Normalized items not stored by an earlier fetch
+        """
+        for item in items:
+            key = self._item_key(item)
+            if key not in keys and self._is_new(item):
+                normalized = self.normalizer.normalize(item, source="feedly")
+                keys[key] = normalized.get("id")
+                yield normalized
 
     def fetch_and_store(self, batch_size: int = 50) -> int:
         """Fetch items from sources and store in MongoDB.
@@ -61,13 +117,19 @@ class FeedScheduler:
                 )
                 return 0
 
-            # Normalize items
-            normalized_items = [
-                self.normalizer.normalize(item, source="feedly") for item in items
-            ]
+            # Normalize lazily so items are stored as they are normalized,
+            # skipping items already stored by an earlier fetch
+            new_keys: Dict[Tuple[Any, Any], Any] = {}
+            stored_ids: Set[str] = set()
+            stored_count = self.mongodb.store_feed_items(
+                self._normalize_new_items(items, new_keys), stored_ids
+            )
 
-            # Store items
-            stored_count = self.mongodb.store_feed_items(normalized_items)
+            # Only remember items that were written, so skipped items and
+            # failed writes are retried on the next fetch
+            self._remember(
+                key for key, item_id in new_keys.items() if item_id in stored_ids
+            )
 
             # Record success metric
             self.mongodb.record_metric(
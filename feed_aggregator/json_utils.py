@@ -0,0 +1,53 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from str or bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Whether to sort dictionary keys
+        default: Called for objects that are not natively serializable
+
+    Returns:
+        JSON document as bytes
+
+    Raises:
+        TypeError: If obj contains values that cannot be serialized
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, sort_keys=sort_keys, default=default, separators=(",", ":")
+    ).encode("utf-8")
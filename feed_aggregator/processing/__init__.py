@@ -1,6 +1,9 @@
 """Feed processing package."""
 
 from feed_aggregator.processing.content_analyzer import ContentAnalyzer
+from feed_aggregator.processing.llm_cache import LLMCache
 from feed_aggregator.processing.llm_filter import LLMFilter
+from feed_aggregator.processing.rate_limiter import RateLimiter
+from feed_aggregator.processing.tuner_cache import TunerCache
 
-__all__ = ["ContentAnalyzer", "LLMFilter"]
+__all__ = ["ContentAnalyzer", "LLMCache", "LLMFilter", "RateLimiter", "TunerCache"]
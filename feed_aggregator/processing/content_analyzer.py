@@ -1,28 +1,38 @@
+import functools
 import logging
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import nltk
 from nltk import ne_chunk, pos_tag, word_tokenize
-from nltk.chunk import RegexpParser
 from nltk.corpus import stopwords
 from textblob import TextBlob
 
-# Download required NLTK data
-try:
-    nltk.data.find("tokenizers/punkt")
-    nltk.data.find("taggers/averaged_perceptron_tagger")
-    nltk.data.find("chunkers/maxent_ne_chunker")
-    nltk.data.find("corpora/words")
-except LookupError:
-    nltk.download("punkt")
-    nltk.download("averaged_perceptron_tagger")
-    nltk.download("maxent_ne_chunker")
-    nltk.download("words")
-    nltk.download("stopwords")
-
 logger = logging.getLogger(__name__)
 
+# Any single POS tag, as matched by "<.\w*>" in an NLTK tag pattern
+_ANY_TAG = re.compile(r"[^{}<>]\w*")
+
+# NLTK resources used by the analyzer, keyed by download name
+_NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "maxent_ne_chunker": "chunkers/maxent_ne_chunker",
+    "words": "corpora/words",
+    "stopwords": "corpora/stopwords",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_nltk_data() -> None:
+    """Download required NLTK data if missing, at most once per process."""
+    try:
+        for path in _NLTK_RESOURCES.values():
+            nltk.data.find(path)
+    except LookupError:
+        for name in _NLTK_RESOURCES:
+            nltk.download(name)
+
 
 class ContentAnalyzer:
     """Analyzes content for readability, keywords, and other metrics."""
@@ -30,16 +40,6 @@ class ContentAnalyzer:
     REQUIRED_FIELDS = ["content", "llm_analysis"]
     WORDS_PER_MINUTE = 200  # Average reading speed
 
-    # Custom grammar for technical terms
-    GRAMMAR = r"""
-        VERSION: {<CD>(<.\w*>)?<CD>?}     # Version numbers like "2.0"
-        TECH_TERM: {<NN.*>+(<HYPH>?<CD>*|<VERSION>|<CD>)}  # Terms like "GPT-4", "Python3"
-        VERSIONED_TERM: {<NN.*>+<VERSION>}  # Terms like "PyTorch 2.0"
-        NP: {<JJ.*>*<NN.*>+}              # Noun phrases with optional adjectives
-        TECH_NP: {<NP>(<IN><NP>)+}        # Technical phrases with prepositions
-        ML_TERM: {<NN.*><NN.*>}           # Common two-word technical terms
-    """
-
     # Common technical phrases to preserve
     TECH_PHRASES = [
         r"principle of least privilege",
@@ -90,8 +90,8 @@ class ContentAnalyzer:
     ]
 
     def __init__(self):
-        """Initialize the analyzer with custom chunker."""
-        self.chunk_parser = RegexpParser(self.GRAMMAR)
+        """Initialize the analyzer."""
+        _ensure_nltk_data()
         self.stop_words = set(stopwords.words("english"))
 
     def _extract_entities(self, text: str) -> Set[str]:
@@ -114,6 +114,52 @@ class ContentAnalyzer:
                 entities.add(entity)
         return entities
 
+    @staticmethod
+    def _extract_chunks(
+        pos_tags: List[Tuple[str, str]]
+    ) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        r"""Group tagged tokens into technical-term chunks in a single pass.
+
+        Produces the same chunks as the cascaded grammar this replaced:
+
+            VERSION: {<CD>(<.\w*>)?<CD>?}
+            TECH_TERM: {<NN.*>+(<HYPH>?<CD>*|<VERSION>|<CD>)}
+            VERSIONED_TERM / NP / TECH_NP / ML_TERM
+
+        VERSION claims every number first, so TECH_TERM reduces to a noun run
+        with an optional trailing hyphen. Because TECH_TERM then consumes
+        every noun, the remaining rules can never match and are omitted.
+
+        Args:
+            pos_tags: List of (word, tag) tuples
+
+        Returns:
+            List of (label, leaves) tuples in text order
+        """
+        chunks = []
+        n = len(pos_tags)
+        i = 0
+        while i < n:
+            tag = pos_tags[i][1]
+            if tag == "CD":
+                j = i + 1
+                if j < n and _ANY_TAG.fullmatch(pos_tags[j][1]):
+                    j += 1
+                if j < n and pos_tags[j][1] == "CD":
+                    j += 1
+                chunks.append(("VERSION", pos_tags[i:j]))
+            elif tag.startswith("NN"):
+                j = i + 1
+                while j < n and pos_tags[j][1].startswith("NN"):
+                    j += 1
+                if j < n and pos_tags[j][1] == "HYPH":
+                    j += 1
+                chunks.append(("TECH_TERM", pos_tags[i:j]))
+            else:
+                j = i + 1
+            i = j
+        return chunks
+
     def _extract_technical_terms(self, text: str) -> Set[str]:
         """Extract technical terms using custom grammar rules.
 
@@ -125,37 +171,16 @@ class ContentAnalyzer:
         """
         tokens = word_tokenize(text)
         pos_tags = pos_tag(tokens)
-        chunks = self.chunk_parser.parse(pos_tags)
 
         terms = set()
-        for chunk in chunks:
-            if hasattr(chunk, "label"):
-                if chunk.label() in (
-                    "TECH_TERM",
-                    "VERSIONED_TERM",
-                    "NP",
-                    "TECH_NP",
-                    "ML_TERM",
-                ):
-                    term = " ".join(c[0] for c in chunk.leaves())
-                    # Filter out terms that are just stopwords
-                    term_words = set(term.lower().split())
-                    if not term_words.issubset(self.stop_words):
-                        # Special handling for version numbers
-                        if chunk.label() in ("TECH_TERM", "VERSIONED_TERM") and any(
-                            c[1].startswith("CD") for c in chunk.leaves()
-                        ):
-                            terms.add(
-                                term
-                            )  # Preserve original case for versioned terms
-                        # Special handling for multi-word technical terms
-                        elif len(term.split()) > 1:
-                            terms.add(term.lower())
-                            # Add common variations
-                            if chunk.label() == "ML_TERM":
-                                terms.add(term.lower())
-                        else:
-                            terms.add(term.lower())
+        for label, leaves in self._extract_chunks(pos_tags):
+            if label != "TECH_TERM":
+                continue  # Bare version numbers are not keywords
+            term = " ".join(word for word, _ in leaves)
+            # Filter out terms that are just stopwords
+            term_words = set(term.lower().split())
+            if not term_words.issubset(self.stop_words):
+                terms.add(term.lower())
         return terms
 
     def _normalize_technical_phrases(self, text: str) -> Set[str]:
@@ -238,11 +263,19 @@ class ContentAnalyzer:
 
         return sorted(cleaned)
 
-    def analyze_readability(self, text: str) -> Dict[str, float]:
+    def analyze_readability(
+        self,
+        text: str,
+        *,
+        words: Optional[Sequence[str]] = None,
+        sentences: Optional[Sequence[Any]] = None,
+    ) -> Dict[str, float]:
         """Calculate readability metrics.
 
         Args:
             text: Text to analyze
+            words: Optional pre-tokenized words of text
+            sentences: Optional pre-split sentences of text
 
         Returns:
             Dictionary of readability metrics
@@ -254,9 +287,11 @@ class ContentAnalyzer:
                 "avg_word_length": 0.0,
             }
 
-        blob = TextBlob(text)
-        sentences = blob.sentences
-        words = blob.words
+        # Tokenize only if the caller has not already done so
+        if words is None or sentences is None:
+            blob = TextBlob(text)
+            sentences = blob.sentences
+            words = blob.words
 
         # Calculate metrics
         word_count = len(words)
@@ -334,12 +369,14 @@ class ContentAnalyzer:
         if isinstance(content, dict):
             content = content.get("content", "")
 
-        # Create TextBlob for analysis
+        # Tokenize once and share the result with readability analysis
         blob = TextBlob(content)
+        words = blob.words
+        sentences = blob.sentences
 
         # Calculate word and sentence counts
-        word_count = len(blob.words)
-        sentence_count = len(blob.sentences)
+        word_count = len(words)
+        sentence_count = len(sentences)
 
         # Calculate reading time
         reading_time = word_count / self.WORDS_PER_MINUTE
@@ -348,7 +385,9 @@ class ContentAnalyzer:
         keywords = self.extract_keywords(content) if content.strip() else []
 
         # Analyze readability
-        readability = self.analyze_readability(content)
+        readability = self.analyze_readability(
+            content, words=words, sentences=sentences
+        )
 
         return {
             "keywords": keywords,
@@ -0,0 +1,164 @@
+import copy
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol
+
+from feed_aggregator import json_utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "feed_aggregator", "llm"
+)
+
+
+class CacheBackend(Protocol):
+    """Storage for cached LLM analysis results."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if absent or expired."""
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key."""
+
+
+class MemoryBackend:
+    """In-process LRU cache backend."""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        """Initialize memory backend.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the oldest
+            ttl: Optional time to live in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class DiskBackend:
+    """Cache backend storing one JSON file per entry."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = None):
+        """Initialize disk backend.
+
+        Args:
+            directory: Directory to store cache files in
+            ttl: Optional time to live in seconds, checked against file mtime
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return None
+            with open(path, "rb") as f:
+                return json_utils.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, json_utils.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json_utils.dumps(value))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+
+
+class LLMCache:
+    """Memoizes LLM analysis results keyed by a hash of the request."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """Initialize LLM cache.
+
+        Args:
+            backend: Storage backend, defaults to an in-memory LRU
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Hash the model, messages and options of a request.
+
+        Args:
+            request: Keyword arguments sent to the provider's chat API
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json_utils.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result with a fresh analysis timestamp.
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            Analysis result, or None on a miss
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        result = copy.deepcopy(value)
+        if "_analysis_metadata" in result:
+            result["_analysis_metadata"]["timestamp"] = str(int(time.time()))
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result without its per-call timestamp.
+
+        Args:
+            key: Key returned by make_key
+            result: Analysis result to cache
+        """
+        value = copy.deepcopy(result)
+        value.get("_analysis_metadata", {}).pop("timestamp", None)
+        self.backend.set(key, value)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts since the cache was created."""
+        return {"hits": self.hits, "misses": self.misses}
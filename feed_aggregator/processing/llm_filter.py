@@ -1,29 +1,303 @@
+import asyncio
+import copy
+import functools
+import importlib.util
 import json
 import logging
 import os
-from typing import Any, Dict, List, Literal, Optional
+import re
+import string
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
+import httpx
 import ollama
 import yaml
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI, RateLimitError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is optional
+    tiktoken = None
+
+from feed_aggregator import json_utils
 from feed_aggregator.config.category_config import CategoryConfig
+from feed_aggregator.processing.llm_cache import LLMCache
+from feed_aggregator.processing.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# OpenAI Batch API endpoint and the statuses after which a job stops changing
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Items whose stripped content is shorter than this are not sent to the LLM
+DEFAULT_MIN_CONTENT_LENGTH = 1
+
+# Characters-per-token ratio used to estimate prompt sizes when no
+# tiktoken encoding is available for the model
+CHARS_PER_TOKEN = 4
+
+# Packed requests analyze several items in one completion, up to this many
+# estimated prompt tokens
+MAX_PACKED_PROMPT_TOKENS = 12_000
+PACKED_PROMPT_INSTRUCTION = (
+    "Several articles follow, each introduced by a line of the form "
+    '"### Article id=N". Analyze each article independently. Respond with a '
+    'JSON object of the form {"results": [...]} containing one analysis per '
+    'article, each with an additional "id" field set to the article id.'
+)
+
+# Parsed prompts files are cached as JSON next to the YAML source
+CONFIG_SIDECAR_SUFFIX = ".cache.json"
+
+# Retries for 429 responses in async batches, backing off exponentially
+# unless the server sends Retry-After
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# Connection pool shared by every OpenAI client in the process
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Decoder used to pull JSON objects out of free-form model output
+_JSON_DECODER = json.JSONDecoder()
+
+# Markdown code fences that models wrap JSON output in
+_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client used for OpenAI requests.
+
+    Sharing one pooled client lets LLMFilter instances (e.g. one per
+    category) reuse keep-alive connections instead of each paying for TCP
+    and TLS setup. HTTP/2 is enabled when the h2 package is installed.
+    """
+    return DefaultHttpxClient(
+        limits=HTTP_POOL_LIMITS,
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _encoder(model: str) -> Any:
+    """Return the tiktoken encoding for a model, loaded once per model.
+
+    Returns None when tiktoken is not installed or the encoding cannot be
+    loaded (e.g. its BPE file cannot be downloaded), in which case callers
+    fall back to a characters-per-token estimate.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Model names tiktoken does not know yet use the newest encoding
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding for {model}: {str(e)}")
+        return None
+
+
+def _retry_after(error: RateLimitError) -> Optional[float]:
+    """Return the Retry-After delay in seconds from a 429 response, if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _ollama_message_content(response: Any) -> str:
+    """Get the message content from an Ollama chat response or chunk."""
+    if hasattr(response, "message"):
+        return response.message.content
+    if isinstance(response, dict) and "message" in response:
+        return response["message"]["content"]
+    raise ValueError(f"No content found in Ollama response: {response}")
+
+
+class _OllamaStreamParser:
+    """Accumulates streamed Ollama chunks until the JSON object is complete."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.last_chunk: Any = None
+        self.result: Optional[Dict[str, Any]] = None
+
+    @property
+    def content(self) -> str:
+        return "".join(self.parts)
+
+    def feed(self, chunk: Any) -> bool:
+        """Add a chunk and report whether the first JSON object has closed.
+
+        Only the first opening brace is tried, so a prefix can never be
+        mistaken for a complete object. Content with stray braces before
+        the JSON is read to the end and decoded by the caller instead.
+        """
+        self.last_chunk = chunk
+        text = _ollama_message_content(chunk)
+        self.parts.append(text)
+        if "}" not in text:
+            return False
+
+        content = self.content
+        start = content.find("{")
+        if start == -1:
+            return False
+        try:
+            self.result, _ = _JSON_DECODER.raw_decode(content, start)
+        except json.JSONDecodeError:
+            return False
+        return True
+
+
+def canonical_prompt(prompt: str) -> str:
+    """Normalize line endings and trailing whitespace in a prompt."""
+    return "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Pre-parse a str.format template into a reusable formatter.
+
+    Templates made only of literal text and plain {name} fields are split
+    once and joined directly on each call. Anything else (format specs,
+    conversions, attribute or index lookups) falls back to str.format.
+
+    Args:
+        template: Template string in str.format syntax
+
+    Returns:
+        Callable taking the template fields as keyword arguments
+    """
+    segments: List[Tuple[bool, str]] = []
+    try:
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if literal:
+                segments.append((True, literal))
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conversion:
+                return template.format
+            segments.append((False, field))
+    except ValueError:
+        return template.format
+
+    def format_template(**fields: Any) -> str:
+        return "".join(
+            [text if is_literal else str(fields[text]) for is_literal, text in segments]
+        )
+
+    return format_template
+
+
+def _read_sidecar(sidecar_path: str, path: str) -> Any:
+    """Return sidecar contents if the sidecar is at least as new as path."""
+    try:
+        if os.path.getmtime(sidecar_path) < os.path.getmtime(path):
+            return None
+        with open(sidecar_path, "rb") as f:
+            return json_utils.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(sidecar_path: str, data: Any) -> None:
+    """Atomically write data as JSON if it round-trips without loss."""
+    try:
+        serialized = json_utils.dumps(data)
+        if json_utils.loads(serialized) != data:
+            return
+        tmp_path = f"{sidecar_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(serialized)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not writing config sidecar {sidecar_path}: {str(e)}")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime: float) -> Any:
+    """Parse a YAML file once per (path, mtime) pair.
+
+    The parsed document is also written to a JSON sidecar next to the file,
+    which later processes load instead of re-parsing the YAML.
+    """
+    sidecar_path = f"{path}{CONFIG_SIDECAR_SUFFIX}"
+    data = _read_sidecar(sidecar_path, path)
+    if data is None:
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        _write_sidecar(sidecar_path, data)
+    return MappingProxyType(data) if isinstance(data, dict) else data
+
+
+def load_llm_filter_section(path: str) -> Optional[Dict[str, Any]]:
+    """Return a private copy of the llm_filter section of a prompts file.
+
+    Parsed files are cached and invalidated when their mtime changes.
+
+    Args:
+        path: Path to the prompts YAML file
+
+    Returns:
+        The llm_filter section, or None if the file has no such section
+    """
+    path = os.path.abspath(path)
+    config = _load_yaml_cached(path, os.stat(path).st_mtime)
+    if not config or "llm_filter" not in config:
+        return None
+    return copy.deepcopy(config["llm_filter"])
+
 
 class LLMFilter:
     """Uses LLM to analyze and filter feed items."""
 
-    REQUIRED_FIELDS = ["relevance_score", "summary", "key_topics"]
+    REQUIRED_FIELDS = frozenset(("relevance_score", "summary", "key_topics"))
     PROVIDERS = Literal["openai", "ollama"]
 
+    # Filters are created per category and per worker, so avoid a __dict__
+    __slots__ = (
+        "provider",
+        "cache",
+        "rate_limiter",
+        "category",
+        "config_path",
+        "config",
+        "api_key",
+        "_client",
+        "_system_prompt",
+        "_format_user_prompt",
+        "_model",
+        "_temperature",
+        "_min_content_length",
+        "_system_message",
+        "_response_format",
+        "_ollama_prompt_prefix",
+        "_ollama_options",
+        "_ollama_keep_alive",
+    )
+
     def __init__(
         self,
         provider: PROVIDERS = "openai",
         config_path: Optional[str] = None,
         category: Optional[str] = None,
         api_key: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        config_dict: Optional[Dict[str, Any]] = None,
     ):
         """Initialize LLM filter.
 
@@ -32,11 +306,27 @@ class LLMFilter:
             config_path: Path to prompts config file (overrides category)
             category: Category key to load prompts for (e.g., 'Tech', 'ML')
             api_key: Optional API key for OpenAI
+            cache: Optional response cache, used when temperature is 0
+            rate_limiter: Optional limiter applied to async OpenAI requests
+            config_dict: Already parsed prompts config with an llm_filter
+                section (overrides config_path and category)
+
+        Raises:
+            ValueError: If the config is invalid or no OpenAI API key is set
         """
         self.provider = provider
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self._client = None
         self.category = category
         self.config_path = config_path
-        self.config = self._load_config(config_path, category)
+        if config_dict is not None:
+            if "llm_filter" not in config_dict:
+                raise ValueError("Invalid config format: missing llm_filter section")
+            self.config = copy.deepcopy(config_dict["llm_filter"])
+        else:
+            self.config = self._load_config(config_path, category)
+        self._prepare_requests()
 
         if provider == "openai":
             self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -44,10 +334,66 @@ class LLMFilter:
                 raise ValueError(
                     "OPENAI_API_KEY environment variable not set and no API key provided"
                 )
-            self.client = OpenAI(api_key=self.api_key)
         else:
             # Ollama runs locally, no auth needed
-            self.client = None
+            self.api_key = None
+
+    @property
+    def client(self) -> Optional[OpenAI]:
+        """OpenAI client, created on first use."""
+        if self._client is None and self.provider == "openai":
+            self._client = OpenAI(
+                api_key=self.api_key, http_client=_shared_http_client()
+            )
+        return self._client
+
+    @client.setter
+    def client(self, client: Optional[OpenAI]) -> None:
+        self._client = client
+
+    def _prepare_requests(self) -> None:
+        """Resolve the per-instance request fields used on every call.
+
+        Raises:
+            ValueError: If the config has no section for the provider
+        """
+        if self.provider not in self.config:
+            raise ValueError(f"Invalid config format: missing {self.provider} section")
+        provider_config = self.config[self.provider]
+
+        # Providers cache shared prompt prefixes, so the system prompt must
+        # be byte-identical on every call and never include item data
+        self._system_prompt = canonical_prompt(self.config["system_prompt"])
+        self._format_user_prompt = _compile_template(self.config["user_prompt"])
+        self._model = provider_config["model"]
+        self._temperature = provider_config["temperature"]
+        self._min_content_length = self.config.get(
+            "min_content_length", DEFAULT_MIN_CONTENT_LENGTH
+        )
+
+        if self.provider == "openai":
+            self._system_message = {"role": "system", "content": self._system_prompt}
+            self._response_format = provider_config["response_format"]
+        else:
+            self._system_message = {
+                "role": "system",
+                "content": "You are a JSON-only responder",
+            }
+            self._ollama_prompt_prefix = (
+                f"{self._system_prompt}\n\n"
+                "You must respond with a valid JSON object.\n\n"
+            )
+            # Pin the shared prefix in the KV cache when the context shifts
+            prefix_tokens = self._estimate_tokens(
+                self._system_message["content"] + self._ollama_prompt_prefix
+            )
+            self._ollama_options = {
+                "temperature": self._temperature,
+                "format": provider_config["format"],
+                "num_keep": provider_config.get("num_keep", prefix_tokens),
+            }
+            # Keeping the model loaded lets Ollama reuse the prompt prefix
+            self._ollama_keep_alive = provider_config.get("keep_alive")
 
     def _load_config(
         self, config_path: Optional[str] = None, category: Optional[str] = None
@@ -64,13 +410,12 @@ class LLMFilter:
         # If config_path is provided, use it directly (backward compatibility)
         if config_path:
             try:
-                with open(config_path, "r") as f:
-                    config = yaml.safe_load(f)
-                    if not config or "llm_filter" not in config:
-                        raise ValueError(
-                            "Invalid config format: missing llm_filter section"
-                        )
-                    return config["llm_filter"]
+                config = load_llm_filter_section(config_path)
+                if config is None:
+                    raise ValueError(
+                        "Invalid config format: missing llm_filter section"
+                    )
+                return config
             except (OSError, yaml.YAMLError, ValueError) as e:
                 error_msg = f"Error loading config: {str(e)}"
                 logger.error(error_msg)
@@ -82,13 +427,12 @@ class LLMFilter:
                 category_config = CategoryConfig()
                 prompts_path = category_config.get_prompts_path(category)
 
-                with open(prompts_path, "r") as f:
-                    config = yaml.safe_load(f)
-                    if not config or "llm_filter" not in config:
-                        raise ValueError(
-                            f"Invalid config format in {prompts_path}: missing llm_filter section"
-                        )
-                    return config["llm_filter"]
+                config = load_llm_filter_section(prompts_path)
+                if config is None:
+                    raise ValueError(
+                        f"Invalid config format in {prompts_path}: missing llm_filter section"
+                    )
+                return config
             except (OSError, yaml.YAMLError, ValueError) as e:
                 error_msg = f"Error loading category config for '{category}': {str(e)}"
                 logger.error(error_msg)
@@ -102,13 +446,10 @@ class LLMFilter:
         )
 
         try:
-            with open(default_config_path, "r") as f:
-                config = yaml.safe_load(f)
-                if not config or "llm_filter" not in config:
-                    raise ValueError(
-                        "Invalid config format: missing llm_filter section"
-                    )
-                return config["llm_filter"]
+            config = load_llm_filter_section(default_config_path)
+            if config is None:
+                raise ValueError("Invalid config format: missing llm_filter section")
+            return config
         except (OSError, yaml.YAMLError, ValueError) as e:
             error_msg = (
                 f"Error loading config: {str(e)}. "
@@ -131,13 +472,11 @@ class LLMFilter:
             ValueError: If API response is invalid
             Exception: If API call fails
         """
+        if self._is_trivial(item):
+            return self._trivial_result()
+
         try:
-            # Format prompts
-            system_prompt = self.config["system_prompt"]
-            user_prompt = self.config["user_prompt"].format(
-                title=item["title"],
-                content=item["content"],
-            )
+            system_prompt, user_prompt = self._format_prompts(item)
 
             if self.provider == "openai":
                 return self._analyze_with_openai(system_prompt, user_prompt)
@@ -148,35 +487,327 @@ class LLMFilter:
             logger.error(f"Error analyzing item {item.get('_id')}: {str(e)}")
             raise
 
+    async def _analyze_item_async(
+        self, item: Dict[str, Any], client: Any
+    ) -> Dict[str, Any]:
+        """Analyze a single feed item using an async provider client.
+
+        Args:
+            item: Feed item to analyze
+            client: Async client returned by async_client
+
+        Returns:
+            Analysis results including relevance score, summary, and topics
+        """
+        if self._is_trivial(item):
+            return self._trivial_result()
+
+        try:
+            system_prompt, user_prompt = self._format_prompts(item)
+
+            if self.provider == "openai":
+                return await self._analyze_with_openai_async(
+                    client, system_prompt, user_prompt
+                )
+            else:
+                return await self._analyze_with_ollama_async(
+                    client, system_prompt, user_prompt
+                )
+
+        except Exception as e:
+            logger.error(f"Error analyzing item {item.get('_id')}: {str(e)}")
+            raise
+
+    async def aanalyze_item(
+        self, item: Dict[str, Any], client: Any = None
+    ) -> Dict[str, Any]:
+        """Analyze a single feed item without blocking the event loop.
+
+        Args:
+            item: Feed item to analyze
+            client: Optional client from async_client, reused by the caller
+                across requests; a temporary one is created if not given
+
+        Returns:
+            Analysis results including relevance score, summary, and topics
+
+        Raises:
+            ValueError: If API response is invalid
+            Exception: If API call fails
+        """
+        if self._is_trivial(item):
+            return self._trivial_result()
+
+        if client is not None:
+            return await self._analyze_item_async(item, client)
+        async with self.async_client() as client:
+            return await self._analyze_item_async(item, client)
+
+    def analyze_items_batch(
+        self, items: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several feed items in a single LLM request.
+
+        Args:
+            items: Feed items to analyze together
+
+        Returns:
+            Results aligned with items, with None for items the model did not
+            return a valid analysis for
+
+        Raises:
+            ValueError: If the request fails or the response cannot be parsed
+        """
+        return asyncio.run(self.aanalyze_items_batch(items))
+
+    async def aanalyze_items_batch(
+        self, items: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several feed items in one request without blocking the loop.
+
+        Trivial items are answered without the LLM, and a single remaining
+        item is sent as an ordinary unpacked request.
+
+        Args:
+            items: Feed items to analyze together
+
+        Returns:
+            Results aligned with items, with None for items the model did not
+            return a valid analysis for
+
+        Raises:
+            ValueError: If the request fails or the response cannot be parsed
+        """
+        results: List[Optional[Dict[str, Any]]] = [
+            self._trivial_result() if self._is_trivial(item) else None for item in items
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            async with self.async_client() as client:
+                if len(pending) == 1:
+                    packed = [await self._analyze_item_async(items[pending[0]], client)]
+                else:
+                    packed = await self._analyze_batch(
+                        client, [items[index] for index in pending]
+                    )
+            for index, result in zip(pending, packed):
+                results[index] = result
+        return results
+
+    def _is_trivial(self, item: Dict[str, Any]) -> bool:
+        """Check whether an item has nothing worth sending to the LLM.
+
+        Items with (near-)empty content or content that only repeats the
+        title are answered directly without a model call.
+        """
+        content = str(item.get("content") or "").strip()
+        return (
+            len(content) < self._min_content_length
+            or content == str(item.get("title") or "").strip()
+        )
+
+    def _trivial_result(self) -> Dict[str, Any]:
+        """Build the canonical low-relevance result for trivial items."""
+        return {
+            "relevance_score": 0.0,
+            "summary": "",
+            "key_topics": [],
+            "filtered_reason": "Item has no content to analyze",
+            "_analysis_metadata": {
+                "prompt_version": self.config.get("version", "1.0"),
+                "system_prompt": self._system_prompt,
+                "user_prompt_template": self.config["user_prompt"],
+                "model": None,
+                "temperature": None,
+                "timestamp": str(int(time.time())),
+                "provider": "shortcircuit",
+                "category": self.category,
+                "config_path": self.config_path,
+            },
+        }
+
+    def _format_prompts(self, item: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the system and user prompts for an item."""
+        user_prompt = self._format_user_prompt(
+            title=item["title"],
+            content=item["content"],
+        )
+        return self._system_prompt, user_prompt
+
+    async def awarm_up(self) -> None:
+        """Prefill the shared prompt prefix before a run of requests.
+
+        Ollama reuses the KV cache of the previous prompt, so a one-token
+        generation over the stable prefix lets the first real request start
+        from a warm cache. OpenAI caches prefixes on its own, so this does
+        nothing there. Failures are logged and ignored.
+        """
+        if self.provider != "ollama":
+            return
+
+        request = self._ollama_request("")
+        request["options"] = {**self._ollama_options, "num_predict": 1}
+        try:
+            async with self.async_client() as client:
+                await client.chat(**request)
+        except Exception as e:
+            logger.warning(f"Ollama warm-up failed: {str(e)}")
+
+    def async_client(self) -> Any:
+        """Create an async client for the configured provider.
+
+        The client is an async context manager bound to the event loop it is
+        used in. Pass it to aanalyze_item to share one connection pool across
+        the requests of a run.
+        """
+        if self.provider == "openai":
+            return AsyncOpenAI(api_key=self.api_key)
+        return ollama.AsyncClient()
+
+    def _openai_request(
+        self, user_prompt: str, system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build chat completion arguments for OpenAI.
+
+        The precomputed fields are reused unless a different system prompt is
+        given or the filter was built for another provider.
+        """
+        if self.provider != "openai" or system_prompt not in (
+            None,
+            self._system_prompt,
+        ):
+            openai_config = self.config["openai"]
+            return {
+                "model": openai_config["model"],
+                "messages": [
+                    {"role": "system", "content": system_prompt or self._system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": openai_config["temperature"],
+                "response_format": openai_config["response_format"],
+            }
+        return {
+            "model": self._model,
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": self._temperature,
+            "response_format": self._response_format,
+        }
+
     def _analyze_with_openai(
         self, system_prompt: str, user_prompt: str
     ) -> Dict[str, Any]:
         """Call OpenAI API for analysis."""
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
+        request = self._openai_request(user_prompt, system_prompt)
+        key = self._cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        response = self.client.chat.completions.create(**request)
+        return self._cache_set(
+            key, self._parse_openai_response(response, system_prompt)
+        )
+
+    async def _analyze_with_openai_async(
+        self, client: Any, system_prompt: str, user_prompt: str
+    ) -> Dict[str, Any]:
+        """Call OpenAI API for analysis without blocking the event loop."""
+        request = self._openai_request(user_prompt, system_prompt)
+        key = self._cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        response = await self._create_openai_completion(client, request)
+        return self._cache_set(
+            key, self._parse_openai_response(response, system_prompt)
+        )
+
+    async def _create_openai_completion(
+        self, client: Any, request: Dict[str, Any]
+    ) -> Any:
+        """Send a chat completion, respecting the rate limiter and 429 backoff.
 
-        response = self.client.chat.completions.create(
-            model=self.config["openai"]["model"],
-            messages=messages,
-            temperature=self.config["openai"]["temperature"],
-            response_format=self.config["openai"]["response_format"],
+        Args:
+            client: Async OpenAI client
+            request: Chat completion arguments
+
+        Returns:
+            Chat completion response
+        """
+        # Token estimates only feed the rate limiter, so skip them without one
+        tokens = 0
+        if self.rate_limiter is not None:
+            tokens = sum(
+                self._estimate_tokens(m["content"]) for m in request["messages"]
+            )
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(tokens)
+            try:
+                return await client.chat.completions.create(**request)
+            except RateLimitError as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = _retry_after(e) or RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+                logger.warning(f"OpenAI rate limit hit, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for a request, or None if it is not cacheable.
+
+        Only deterministic (temperature 0) calls are cached.
+        """
+        if self.cache is None or self._temperature != 0:
+            return None
+        return self.cache.make_key(request)
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a cached result."""
+        if key is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_set(self, key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a result in the cache and return it."""
+        if key is not None:
+            self.cache.set(key, result)
+        return result
+
+    def _parse_openai_response(
+        self, response: Any, system_prompt: str
+    ) -> Dict[str, Any]:
+        """Parse and validate an OpenAI chat completion."""
+        return self._build_openai_result(
+            response.choices[0].message.content, response.created, system_prompt
         )
 
+    def _build_openai_result(
+        self, content: str, created: Any, system_prompt: str
+    ) -> Dict[str, Any]:
+        """Build a validated analysis result from OpenAI message content."""
         try:
-            result = json.loads(response.choices[0].message.content)
-        except json.JSONDecodeError as e:
+            result = json_utils.loads(content)
+        except json_utils.JSONDecodeError as e:
             raise ValueError(f"Invalid response format: {str(e)}") from e
 
+        return self._finalize_openai_result(result, created, system_prompt)
+
+    def _finalize_openai_result(
+        self, result: Dict[str, Any], created: Any, system_prompt: str
+    ) -> Dict[str, Any]:
+        """Attach analysis metadata to an OpenAI result and validate it."""
         # Add metadata about the analysis
         metadata = {
             "prompt_version": self.config.get("version", "1.0"),
             "system_prompt": system_prompt,
             "user_prompt_template": self.config["user_prompt"],
-            "model": self.config["openai"]["model"],
-            "temperature": self.config["openai"]["temperature"],
-            "timestamp": str(response.created),
+            "model": self._model,
+            "temperature": self._temperature,
+            "timestamp": str(created),
             "provider": "openai",
             "category": self.category,
             "config_path": self.config_path,
@@ -186,85 +817,294 @@ class LLMFilter:
         self._validate_result(result)
         return result
 
-    def _analyze_with_ollama(
-        self, system_prompt: str, user_prompt: str
-    ) -> Dict[str, Any]:
-        """Call Ollama API for analysis."""
-        prompt = (
-            f"{system_prompt}\n\n"
-            "You must respond with a valid JSON object.\n\n"
-            f"{user_prompt}"
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the number of prompt tokens in text for this model."""
+        encoder = _encoder(self._model) if self.provider == "openai" else None
+        if encoder is None:
+            return len(text) // CHARS_PER_TOKEN
+        return len(encoder.encode(text, disallowed_special=()))
+
+    def _pack_items(
+        self, items: List[Dict[str, Any]], max_items: int
+    ) -> List[List[int]]:
+        """Group item indices so each group fits in a single packed request."""
+        groups: List[List[int]] = []
+        group: List[int] = []
+        group_tokens = 0
+        for index, item in enumerate(items):
+            if self._is_trivial(item):
+                # Answered without a request, so never packed
+                groups.append([index])
+                continue
+            item_tokens = self._estimate_tokens(
+                f"{item.get('title', '')}\n{item.get('content', '')}"
+            )
+            if group and (
+                len(group) >= max_items
+                or group_tokens + item_tokens > MAX_PACKED_PROMPT_TOKENS
+            ):
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(index)
+            group_tokens += item_tokens
+        if group:
+            groups.append(group)
+        return groups
+
+    def _packed_user_prompt(self, items: List[Dict[str, Any]]) -> str:
+        """Build one user prompt containing several items."""
+        sections = []
+        for index, item in enumerate(items):
+            _, item_prompt = self._format_prompts(item)
+            sections.append(f"### Article id={index}\n{item_prompt}")
+        return "\n\n".join([PACKED_PROMPT_INSTRUCTION, *sections])
+
+    async def _analyze_batch(
+        self, client: Any, items: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several items in one LLM request.
+
+        Args:
+            client: Async client returned by async_client
+            items: Feed items to analyze together
+
+        Returns:
+            Results aligned with items, with None for items the model skipped
+        """
+        system_prompt = self._system_prompt
+        user_prompt = self._packed_user_prompt(items)
+
+        if self.provider == "openai":
+            response = await self._create_openai_completion(
+                client, self._openai_request(user_prompt)
+            )
+            return self._parse_packed_openai_response(
+                response, system_prompt, len(items)
+            )
+
+        try:
+            parser = await self._read_ollama_stream_async(
+                client, self._ollama_request(user_prompt)
+            )
+        except Exception as e:
+            error_msg = f"Ollama API error: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+        return self._split_packed_results(
+            self._decode_ollama_content(parser),
+            len(items),
+            lambda entry: self._finalize_ollama_result(
+                entry, parser.last_chunk, system_prompt
+            ),
         )
 
+    def _parse_packed_openai_response(
+        self, response: Any, system_prompt: str, count: int
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Split a packed OpenAI response back into per-item results."""
         try:
-            response = ollama.chat(
-                model=self.config["ollama"]["model"],
-                messages=[
+            data = json_utils.loads(response.choices[0].message.content)
+        except json_utils.JSONDecodeError as e:
+            raise ValueError(f"Invalid response format: {str(e)}") from e
+        return self._split_packed_results(
+            data,
+            count,
+            lambda entry: self._finalize_openai_result(
+                entry, response.created, system_prompt
+            ),
+        )
+
+    def _split_packed_results(
+        self,
+        data: Any,
+        count: int,
+        finalize: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Map the entries of a packed response back to item positions.
+
+        Args:
+            data: Decoded response, expected to hold a results array
+            count: Number of items in the request
+            finalize: Adds metadata to and validates a single entry
+
+        Returns:
+            Results aligned with the request items, None where missing or invalid
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("results"), list):
+            raise ValueError("Invalid response format: missing results array")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        for entry in data["results"]:
+            try:
+                index = int(entry.pop("id"))
+                if not 0 <= index < count:
+                    raise IndexError(f"Unknown article id {index}")
+                results[index] = finalize(entry)
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+                logger.error(f"Error in batch analysis: {str(e)}")
+        return results
+
+    def _ollama_request(
+        self, user_prompt: str, system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build chat arguments for Ollama.
+
+        The precomputed prefix and options are reused unless a different
+        system prompt is given or the filter was built for another provider.
+        """
+        if self.provider != "ollama" or system_prompt not in (
+            None,
+            self._system_prompt,
+        ):
+            ollama_config = self.config["ollama"]
+            prompt = (
+                f"{system_prompt or self._system_prompt}\n\n"
+                "You must respond with a valid JSON object.\n\n"
+                f"{user_prompt}"
+            )
+            request = {
+                "model": ollama_config["model"],
+                "messages": [
                     {"role": "system", "content": "You are a JSON-only responder"},
                     {"role": "user", "content": prompt},
                 ],
-                options={
-                    "temperature": self.config["ollama"]["temperature"],
-                    "format": self.config["ollama"]["format"],
+                "options": {
+                    "temperature": ollama_config["temperature"],
+                    "format": ollama_config["format"],
                 },
-            )
-
-            logger.info(f"Raw Ollama response: {response}")
-
-            # Get response content from message
-            if hasattr(response, "message"):
-                content = response.message.content
-            elif isinstance(response, dict) and "message" in response:
-                content = response["message"]["content"]
-            else:
-                raise ValueError(f"No content found in Ollama response: {response}")
+            }
+            if ollama_config.get("keep_alive") is not None:
+                request["keep_alive"] = ollama_config["keep_alive"]
+            return request
 
-            # Clean the content - remove any markdown code block markers and thinking process
-            content = content.strip()
+        request = {
+            "model": self._model,
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": self._ollama_prompt_prefix + user_prompt},
+            ],
+            "options": self._ollama_options,
+        }
+        if self._ollama_keep_alive is not None:
+            request["keep_alive"] = self._ollama_keep_alive
+        return request
 
-            # Remove any markdown markers first
-            content = content.replace("```json", "").replace("```", "").strip()
+    def _analyze_with_ollama(
+        self, system_prompt: str, user_prompt: str
+    ) -> Dict[str, Any]:
+        """Call Ollama API for analysis."""
+        request = self._ollama_request(user_prompt, system_prompt)
+        key = self._cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-            # Try to extract valid JSON using a more robust approach
-            extracted_json = self._extract_json_from_content(content)
+        try:
+            parser = self._read_ollama_stream(request)
+            result = self._parse_ollama_response(parser, system_prompt)
+            return self._cache_set(key, result)
 
-            try:
-                result = json.loads(extracted_json)
-            except json.JSONDecodeError as e:
-                raise ValueError(
-                    f"Invalid JSON in response: {str(e)}\nContent: {extracted_json}"
-                ) from e
+        except Exception as e:
+            error_msg = f"Ollama API error: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
 
-            # Add metadata about the analysis
-            metadata = {
-                "prompt_version": self.config.get("version", "1.0"),
-                "system_prompt": system_prompt,
-                "user_prompt_template": self.config["user_prompt"],
-                "model": self.config["ollama"]["model"],
-                "temperature": self.config["ollama"]["temperature"],
-                "timestamp": str(
-                    response.created_at if hasattr(response, "created_at") else "N/A"
-                ),
-                "provider": "ollama",
-                "category": self.category,
-                "config_path": self.config_path,
-            }
-            result["_analysis_metadata"] = metadata
+    async def _analyze_with_ollama_async(
+        self, client: Any, system_prompt: str, user_prompt: str
+    ) -> Dict[str, Any]:
+        """Call Ollama API for analysis without blocking the event loop."""
+        request = self._ollama_request(user_prompt, system_prompt)
+        key = self._cache_key(request)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-            self._validate_result(result)
-            return result
+        try:
+            parser = await self._read_ollama_stream_async(client, request)
+            result = self._parse_ollama_response(parser, system_prompt)
+            return self._cache_set(key, result)
 
         except Exception as e:
             error_msg = f"Ollama API error: {str(e)}"
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def _read_ollama_stream(self, request: Dict[str, Any]) -> "_OllamaStreamParser":
+        """Stream an Ollama chat until the first JSON object is complete."""
+        stream = ollama.chat(**request, stream=True)
+        parser = _OllamaStreamParser()
+        try:
+            for chunk in stream:
+                if parser.feed(chunk):
+                    break
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+        return parser
+
+    async def _read_ollama_stream_async(
+        self, client: Any, request: Dict[str, Any]
+    ) -> "_OllamaStreamParser":
+        """Stream an async Ollama chat until the first JSON object is complete."""
+        stream = await client.chat(**request, stream=True)
+        parser = _OllamaStreamParser()
+        try:
+            async for chunk in stream:
+                if parser.feed(chunk):
+                    break
+        finally:
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+        return parser
+
+    def _parse_ollama_response(
+        self, parser: "_OllamaStreamParser", system_prompt: str
+    ) -> Dict[str, Any]:
+        """Parse and validate a streamed Ollama chat response."""
+        return self._finalize_ollama_result(
+            self._decode_ollama_content(parser), parser.last_chunk, system_prompt
+        )
+
+    def _decode_ollama_content(self, parser: "_OllamaStreamParser") -> Dict[str, Any]:
+        """Decode the JSON object from streamed Ollama content."""
+        content = parser.content
+        logger.info(f"Raw Ollama response: {content}")
+
+        result = parser.result
+        if result is None:
+            # Clean the content - remove any markdown code block markers
+            content = _FENCE_RE.sub("", content).strip()
+
+            # Decode the first JSON object, ignoring any surrounding text
+            result, _, _ = self._decode_json_from_content(content)
+        return result
+
+    def _finalize_ollama_result(
+        self, result: Dict[str, Any], response: Any, system_prompt: str
+    ) -> Dict[str, Any]:
+        """Attach analysis metadata to an Ollama result and validate it."""
+        # Add metadata about the analysis
+        metadata = {
+            "prompt_version": self.config.get("version", "1.0"),
+            "system_prompt": system_prompt,
+            "user_prompt_template": self.config["user_prompt"],
+            "model": self._model,
+            "temperature": self._temperature,
+            "timestamp": str(
+                response.created_at if hasattr(response, "created_at") else "N/A"
+            ),
+            "provider": "ollama",
+            "category": self.category,
+            "config_path": self.config_path,
+        }
+        result["_analysis_metadata"] = metadata
+
+        self._validate_result(result)
+        return result
+
     def _extract_json_from_content(self, content: str) -> str:
         """Extract valid JSON from content that may have extra text.
 
-        This method uses a more robust approach to find and extract JSON
-        by counting braces to find the complete JSON object.
-
         Args:
             content: Raw content that may contain JSON with extra text
 
@@ -275,63 +1115,211 @@ class LLMFilter:
             ValueError: If no valid JSON object is found
         """
         content = content.strip()
+        _, start, end = self._decode_json_from_content(content)
+        return content[start:end]
 
-        # Find the first opening brace
-        json_start = content.find("{")
-        if json_start == -1:
-            raise ValueError("No JSON object found in content")
+    def _decode_json_from_content(
+        self, content: str
+    ) -> Tuple[Dict[str, Any], int, int]:
+        """Decode the first complete JSON object embedded in content.
 
-        # Count braces to find the matching closing brace
-        brace_count = 0
-        json_end = json_start
-
-        for i in range(json_start, len(content)):
-            char = content[i]
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    json_end = i + 1
-                    break
+        Each opening brace is tried in turn with JSONDecoder.raw_decode, so
+        braces inside strings and stray braces in surrounding text are
+        handled by the JSON parser itself.
 
-        if brace_count != 0:
-            raise ValueError("Unmatched braces in JSON content")
+        Args:
+            content: Raw content that may contain JSON with extra text
 
-        extracted = content[json_start:json_end]
+        Returns:
+            Tuple of (decoded object, start index, end index)
 
-        # Validate that we extracted something that looks like JSON
-        if not extracted.strip():
-            raise ValueError("Empty JSON content extracted")
+        Raises:
+            ValueError: If no valid JSON object is found
+        """
+        start = content.find("{")
+        if start == -1:
+            raise ValueError("No JSON object found in content")
 
-        return extracted
+        error = None
+        while start != -1:
+            try:
+                result, end = _JSON_DECODER.raw_decode(content, start)
+                return result, start, end
+            except json.JSONDecodeError as e:
+                error = error or e
+                start = content.find("{", start + 1)
+
+        raise ValueError(f"Invalid JSON in content: {str(error)}")
 
     def _validate_result(self, result: Dict[str, Any]) -> None:
         """Validate LLM response has required fields."""
-        for field in self.REQUIRED_FIELDS:
-            if field not in result:
-                raise ValueError(f"Missing required field in response: {field}")
+        missing = self.REQUIRED_FIELDS - result.keys()
+        if missing:
+            raise ValueError(
+                f"Missing required field in response: {', '.join(sorted(missing))}"
+            )
 
     def batch_analyze(
-        self, items: List[Dict[str, Any]], batch_size: int = 10
+        self,
+        items: List[Dict[str, Any]],
+        batch_size: int = 10,
+        items_per_request: int = 1,
     ) -> List[Dict[str, Any]]:
         """Analyze multiple feed items.
 
         Args:
             items: List of feed items to analyze
-            batch_size: Number of items to process in parallel (not implemented yet)
+            batch_size: Maximum number of requests in flight at once
+            items_per_request: Items to pack into each LLM request
 
         Returns:
             List of analysis results
         """
-        results = []
-        for item in items:
+        return asyncio.run(
+            self.abatch_analyze(
+                items,
+                max_concurrency=batch_size,
+                items_per_request=items_per_request,
+            )
+        )
+
+    async def abatch_analyze(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+        items_per_request: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Analyze multiple feed items concurrently.
+
+        Args:
+            items: List of feed items to analyze
+            max_concurrency: Maximum number of requests in flight at once
+            items_per_request: Items to pack into each LLM request. Packing
+                saves requests when the rate limit is per request rather than
+                per token.
+
+        Returns:
+            List of analysis results in input order, skipping failed items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if items_per_request > 1:
+            groups = self._pack_items(items, items_per_request)
+        else:
+            groups = [[index] for index in range(len(items))]
+
+        async with self.async_client() as client:
+
+            async def analyze(group: List[int]) -> List[Optional[Dict[str, Any]]]:
+                async with semaphore:
+                    if len(group) == 1:
+                        return [await self._analyze_item_async(items[group[0]], client)]
+                    return await self._analyze_batch(
+                        client, [items[index] for index in group]
+                    )
+
+            outcomes = await asyncio.gather(
+                *(analyze(group) for group in groups), return_exceptions=True
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        for group, outcome in zip(groups, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error in batch analysis: {str(outcome)}")
+                # Continue processing remaining items
+                continue
+            for index, result in zip(group, outcome):
+                results[index] = result
+
+        return [result for result in results if result is not None]
+
+    def batch_analyze_via_batch_api(
+        self, items: List[Dict[str, Any]], poll_interval: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """Analyze multiple feed items as a single OpenAI Batch API job.
+
+        Batch jobs are billed at a discount and use a separate rate limit
+        pool, but may take up to 24 hours. This call blocks until the job
+        finishes, so it is meant for large offline jobs.
+
+        Args:
+            items: List of feed items to analyze
+            poll_interval: Seconds to wait between job status checks
+
+        Returns:
+            List of analysis results in input order, skipping failed items
+
+        Raises:
+            ValueError: If the provider is not OpenAI
+            RuntimeError: If the batch job does not complete
+        """
+        if self.provider != "openai":
+            raise ValueError("Batch API is only available for the openai provider")
+        if not items:
+            return []
+
+        # Custom IDs are input positions so results can be put back in order
+        system_prompts = []
+        lines = []
+        for index, item in enumerate(items):
+            system_prompt, user_prompt = self._format_prompts(item)
+            system_prompts.append(system_prompt)
+            lines.append(
+                json_utils.dumps(
+                    {
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": self._openai_request(user_prompt),
+                    }
+                )
+            )
+
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(items)} items")
+
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+        if not batch.output_file_id:
+            logger.error(f"OpenAI batch {batch.id} produced no successful results")
+            return []
+
+        output = self.client.files.content(batch.output_file_id).text
+        return self._parse_batch_output(output, system_prompts)
+
+    def _parse_batch_output(
+        self, output: str, system_prompts: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Parse a Batch API output file into results ordered by custom_id."""
+        results_by_index = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json_utils.loads(line)
+            index = int(record["custom_id"])
             try:
-                result = self.analyze_item(item)
-                results.append(result)
-            except Exception as e:
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    raise ValueError(f"Request failed: {record.get('error')}")
+                body = response["body"]
+                results_by_index[index] = self._build_openai_result(
+                    body["choices"][0]["message"]["content"],
+                    body.get("created"),
+                    system_prompts[index],
+                )
+            except (KeyError, ValueError) as e:
                 logger.error(f"Error in batch analysis: {str(e)}")
-                # Continue processing remaining items
                 continue
 
-        return results
+        return [results_by_index[i] for i in sorted(results_by_index)]
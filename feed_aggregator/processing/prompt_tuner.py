@@ -5,45 +5,107 @@ This system uses MongoDB training data to automatically optimize LLM prompts
 for better relevance scoring accuracy.
 """
 
+import asyncio
 import logging
 import math
 import random
+import re
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import bson
+import numpy as np
 import yaml
+from bson import ObjectId
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - libyaml is optional
+    from yaml import SafeDumper
 
 from feed_aggregator.config.category_config import CategoryConfig
-from feed_aggregator.processing.llm_filter import LLMFilter
-from feed_aggregator.storage.mongodb_client import MongoDBClient
+from feed_aggregator.processing.llm_cache import MemoryBackend
+from feed_aggregator.processing.llm_filter import LLMFilter, load_llm_filter_section
+from feed_aggregator.processing.tuner_cache import TunerCache
+from feed_aggregator.storage.mongodb_client import CURSOR_BATCH_SIZE, MongoDBClient
 
 logger = logging.getLogger(__name__)
 
+# Experiments carry every candidate's metrics; encoding them in pure Python
+# is slow enough to dominate a tuning run's storage step
+if not bson.has_c():
+    raise ImportError(
+        "pymongo was installed without its C extensions; reinstall it with "
+        "'pip install --force-reinstall pymongo' on a platform with a wheel"
+    )
+
+# Training records scored per LLM request during evaluation
+DEFAULT_EVAL_BATCH_SIZE = 8
+
+# LLM requests in flight at once across all candidate evaluations
+DEFAULT_EVAL_CONCURRENCY = 4
+
+# Training record fields read during evaluation
+EVALUATION_FIELDS = ("article_id", "title", "content", "target_score")
+
+# Prompt configurations whose LLMFilter is kept between evaluations
+MAX_CACHED_FILTERS = 16
+
+# "VARIATION N: <prompt>" lines in the variation generator's response
+_VARIATION_RE = re.compile(
+    r"^[ \t]*VARIATION[ \t]*\d*[ \t]*:[ \t]*(\S.*?)[ \t\r]*$", re.MULTILINE
+)
+
+
+def _is_context_overflow(error: Exception) -> bool:  # pragma: no cover
+    """Check whether an LLM error was caused by an oversized prompt."""
+    message = str(error).lower()
+    return "context_length_exceeded" in message or "maximum context length" in message
+
 
 class PromptTuner:  # pragma: no cover
     """Automated prompt tuning system using evolutionary optimization."""
 
-    def __init__(self, category: str, provider: str = "ollama"):  # pragma: no cover
+    def __init__(
+        self,
+        category: str,
+        provider: str = "ollama",
+        concurrency: int = DEFAULT_EVAL_CONCURRENCY,
+        batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+        cache: Optional[TunerCache] = None,
+    ):  # pragma: no cover
         """Initialize prompt tuner.
 
         Args:
             category: Category to tune prompts for
             provider: LLM provider to use
+            concurrency: Maximum LLM requests in flight during evaluation
+            batch_size: Number of records scored per LLM request
+            cache: Score cache shared across runs, defaults to an exact-match
+                cache on disk
         """
         self.category = category
         self.provider = provider
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.cache = cache if cache is not None else TunerCache()
+        self._filters: "OrderedDict[str, LLMFilter]" = OrderedDict()
         self.category_config = CategoryConfig()
         self.mongo_client = MongoDBClient()
 
         # Collections for tuning data
         self.training_data = self.mongo_client.db.prompt_training_data
         self.tuning_experiments = self.mongo_client.db.prompt_tuning_experiments
+        self.experiment_iterations = self.mongo_client.db.experiment_iterations
         self.candidate_prompts = self.mongo_client.db.candidate_prompts
 
-        # Load current prompt configuration
+        # Load current prompt configuration through LLMFilter's parse cache
         self.current_config_path = self.category_config.get_prompts_path(category)
-        with open(self.current_config_path, "r") as f:
-            self.base_config = yaml.safe_load(f)
+        self.base_config = {
+            "llm_filter": load_llm_filter_section(self.current_config_path)
+        }
 
     def collect_training_data(  # pragma: no cover
         self, article_ids: List[str], target_scores: List[float], rationales: List[str]
@@ -57,11 +119,15 @@ class PromptTuner:  # pragma: no cover
         """
         training_records = []
 
+        # Fetch all articles in one query, reading only the fields used below
+        articles = self.mongo_client.get_items_by_ids(
+            article_ids, fields=("title", "content", "summary")
+        )
+
         for article_id, target_score, rationale in zip(
             article_ids, target_scores, rationales
         ):
-            # Get article from MongoDB
-            article = self.mongo_client.get_item(article_id)
+            article = articles.get(article_id)
             if not article:
                 logger.warning(f"Article {article_id} not found")
                 continue
@@ -89,30 +155,143 @@ class PromptTuner:  # pragma: no cover
 
         # Store in MongoDB
         if training_records:
-            self.training_data.insert_many(training_records)
+            self.training_data.insert_many(training_records, ordered=False)
             logger.info(
                 f"Added {len(training_records)} training records for {self.category}"
             )
 
     def get_training_data(
-        self, limit: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = EVALUATION_FIELDS,
     ) -> List[Dict]:  # pragma: no cover
         """Get training data for the category.
 
         Args:
             limit: Maximum number of records to return
+            fields: Fields to return, defaults to those evaluation reads;
+                None returns full records
 
         Returns:
             List of training records
         """
         query = {"category": self.category}
-        cursor = self.training_data.find(query)
+        projection = None
+        if fields is not None:
+            projection = dict.fromkeys(fields, 1)
+            projection["_id"] = 0
+        cursor = self.training_data.find(query, projection).batch_size(
+            CURSOR_BATCH_SIZE
+        )
 
         if limit:
             cursor = cursor.limit(limit)
 
         return list(cursor)
 
+    async def _analyze_chunk(  # pragma: no cover
+        self, llm_filter: LLMFilter, items: List[Dict], semaphore: asyncio.Semaphore
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Score one chunk of items in a single LLM request.
+
+        When the packed prompt overflows the model's context, the chunk is
+        split into chunks 10% smaller, down to one item per request.
+
+        Returns:
+            Analysis results aligned with items, None where an item failed
+        """
+        try:
+            async with semaphore:
+                return await llm_filter.aanalyze_items_batch(items)
+        except Exception as e:
+            if len(items) > 1 and _is_context_overflow(e):
+                batch_size = max(1, int(len(items) * 0.9))
+                logger.warning(f"Prompt too long, reducing batch to {batch_size}")
+                return await self._analyze_records(
+                    llm_filter, items, batch_size, semaphore
+                )
+            if not isinstance(e, (KeyError, ValueError, RuntimeError)):
+                raise
+            logger.error(f"Error evaluating {len(items)} records: {e}")
+            return [None] * len(items)
+
+    async def _analyze_records(  # pragma: no cover
+        self,
+        llm_filter: LLMFilter,
+        records: List[Dict],
+        batch_size: int,
+        semaphore: asyncio.Semaphore,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Score records concurrently, batch_size records per LLM request.
+
+        Args:
+            llm_filter: Filter configured with the prompt under evaluation
+            records: Training records with title and content
+            batch_size: Number of records per request
+            semaphore: Bounds the requests in flight
+
+        Returns:
+            Analysis results aligned with records, None where a record failed
+        """
+        items = [
+            {"title": record["title"], "content": record["content"]}
+            for record in records
+        ]
+        chunks = [
+            items[start : start + batch_size]
+            for start in range(0, len(items), batch_size)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._analyze_chunk(llm_filter, chunk, semaphore) for chunk in chunks)
+        )
+        return [result for results in chunk_results for result in results]
+
+    def _filter_for(self, prompt_config: Dict) -> LLMFilter:  # pragma: no cover
+        """Return the LLMFilter for a prompt configuration, built once per run.
+
+        Filters are kept in a small LRU keyed like the score cache, so the
+        baseline and surviving candidates are not rebuilt every iteration.
+        """
+        key = TunerCache.scope_key(self.provider, prompt_config)
+        llm_filter = self._filters.pop(key, None)
+        if llm_filter is None:
+            llm_filter = LLMFilter(
+                provider=self.provider, config_dict={"llm_filter": prompt_config}
+            )
+        self._filters[key] = llm_filter
+        if len(self._filters) > MAX_CACHED_FILTERS:
+            self._filters.popitem(last=False)
+        return llm_filter
+
+    async def _score_records(  # pragma: no cover
+        self,
+        prompt_config: Dict,
+        llm_filter: LLMFilter,
+        records: List[Dict],
+        semaphore: asyncio.Semaphore,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Score records, only sending cache misses to the LLM.
+
+        Returns:
+            Analysis results aligned with records, None where a record failed
+        """
+        scope = TunerCache.scope_key(self.provider, prompt_config)
+        results = [self.cache.get(scope, record) for record in records]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if misses:
+            await llm_filter.awarm_up()
+            fresh = await self._analyze_records(
+                llm_filter,
+                [records[index] for index in misses],
+                self.batch_size,
+                semaphore,
+            )
+            for index, result in zip(misses, fresh):
+                results[index] = result
+                if result is not None:
+                    self.cache.set(scope, records[index], result)
+        return results
+
     def evaluate_prompt(
         self, prompt_config: Dict, test_data: List[Dict]
     ) -> Dict:  # pragma: no cover
@@ -125,74 +304,70 @@ class PromptTuner:  # pragma: no cover
         Returns:
             Evaluation metrics
         """
-        # Create temporary config file using secure method
-        import tempfile
+        return asyncio.run(self.aevaluate_prompt(prompt_config, test_data))
 
-        temp_file = tempfile.NamedTemporaryFile(
-            prefix=f"prompt_{self.category}_", suffix=".yml", delete=False
-        )
-        temp_config_path = temp_file.name
-        temp_file.close()
-        with open(temp_config_path, "w") as f:
-            yaml.dump({"llm_filter": prompt_config}, f)
+    async def aevaluate_prompt(
+        self,
+        prompt_config: Dict,
+        test_data: List[Dict],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Dict:  # pragma: no cover
+        """Evaluate a prompt configuration against test data concurrently.
 
-        try:
-            # Initialize LLM filter with test prompt
-            llm_filter = LLMFilter(provider=self.provider, config_path=temp_config_path)
+        Args:
+            prompt_config: Prompt configuration to test
+            test_data: List of test records with target scores
+            semaphore: Shared limit on requests in flight, defaults to one
+                sized by the tuner's concurrency
 
-            predictions = []
-            targets = []
-            errors = []
+        Returns:
+            Evaluation metrics
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
 
-            for record in test_data:
-                try:
-                    # Get prediction
-                    result = llm_filter.analyze_item(
-                        {"title": record["title"], "content": record["content"]}
-                    )
+        llm_filter = self._filter_for(prompt_config)
 
-                    predicted_score = result["relevance_score"]
-                    target_score = record["target_score"]
+        predictions = []
+        targets = []
 
-                    predictions.append(predicted_score)
-                    targets.append(target_score)
-                    errors.append(abs(predicted_score - target_score))
+        results = await self._score_records(
+            prompt_config, llm_filter, test_data, semaphore
+        )
+        for record, result in zip(test_data, results):
+            try:
+                if result is None:
+                    raise ValueError("No analysis returned")
 
-                except (KeyError, ValueError, RuntimeError) as e:
-                    logger.error(f"Error evaluating record {record['article_id']}: {e}")
-                    continue
+                predicted_score = result["relevance_score"]
+                target_score = record["target_score"]
 
-            if not predictions:
-                return {"error": "No successful predictions"}
+                predictions.append(float(predicted_score))
+                targets.append(float(target_score))
 
-            # Calculate metrics
-            mse = sum((p - t) ** 2 for p, t in zip(predictions, targets)) / len(
-                predictions
-            )
-            mae = sum(errors) / len(errors)
-            rmse = math.sqrt(mse)
+            except (KeyError, ValueError, RuntimeError) as e:
+                logger.error(f"Error evaluating record {record['article_id']}: {e}")
+                continue
 
-            # Classification accuracy (within 0.1 threshold)
-            correct_classifications = sum(1 for e in errors if e <= 0.1)
-            accuracy = correct_classifications / len(errors)
-
-            return {
-                "mse": mse,
-                "mae": mae,
-                "rmse": rmse,
-                "accuracy": accuracy,
-                "num_predictions": len(predictions),
-                "predictions": predictions,
-                "targets": targets,
-                "errors": errors,
-            }
+        if not predictions:
+            return {"error": "No successful predictions"}
 
-        finally:
-            # Clean up temp file
-            import os
+        # Calculate metrics
+        diff = np.asarray(predictions) - np.asarray(targets)
+        errors = np.abs(diff)
+        mse = float(np.mean(diff**2))
 
-            if os.path.exists(temp_config_path):
-                os.unlink(temp_config_path)
+        return {
+            "mse": mse,
+            "mae": float(errors.mean()),
+            "rmse": math.sqrt(mse),
+            # Classification accuracy (within 0.1 threshold)
+            "accuracy": float((errors <= 0.1).mean()),
+            "num_predictions": len(predictions),
+            "predictions": predictions,
+            "targets": targets,
+            "errors": errors.tolist(),
+        }
 
     def store_candidate_prompt(  # pragma: no cover
         self,
@@ -214,7 +389,78 @@ class PromptTuner:  # pragma: no cover
         Returns:
             MongoDB ID of the stored candidate prompt
         """
-        candidate = {
+        candidate = self._candidate_document(
+            experiment_id, iteration, prompt_version, config, metrics
+        )
+        result = self.candidate_prompts.insert_one(candidate)
+        return str(result.inserted_id)
+
+    def store_candidate_prompts(
+        self, experiment_id: str, iterations: List[Dict]
+    ) -> List[str]:  # pragma: no cover
+        """Store every candidate prompt of an experiment in one insert.
+
+        Args:
+            experiment_id: ID of the tuning experiment
+            iterations: The experiment's iteration records
+
+        Returns:
+            MongoDB IDs of the stored candidate prompts
+        """
+        candidates = [
+            self._candidate_document(
+                experiment_id,
+                iteration_data["iteration"],
+                result["config"].get(
+                    "version", f"baseline_iter{iteration_data['iteration']}"
+                ),
+                result["config"],
+                result["metrics"],
+            )
+            for iteration_data in iterations
+            for result in iteration_data["results"]
+        ]
+        if not candidates:
+            return []
+
+        result = self.candidate_prompts.insert_many(candidates, ordered=False)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    def store_experiment_iterations(
+        self, experiment_id: str, iterations: List[Dict]
+    ) -> List[str]:  # pragma: no cover
+        """Store an experiment's iteration records, one document each.
+
+        Keeping iterations out of the experiment document keeps long runs
+        below MongoDB's 16MB document limit.
+
+        Args:
+            experiment_id: ID of the tuning experiment
+            iterations: The experiment's iteration records
+
+        Returns:
+            MongoDB IDs of the stored iteration documents
+        """
+        if not iterations:
+            return []
+
+        documents = [
+            {"experiment_id": experiment_id, **iteration_data}
+            for iteration_data in iterations
+        ]
+        result = self.experiment_iterations.insert_many(documents, ordered=False)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    def _candidate_document(
+        self,
+        experiment_id: str,
+        iteration: int,
+        prompt_version: str,
+        config: Dict,
+        metrics: Dict,
+    ) -> Dict:  # pragma: no cover
+        """Build the MongoDB document for a candidate prompt."""
+        return {
             "experiment_id": experiment_id,
             "category": self.category,
             "iteration": iteration,
@@ -225,9 +471,6 @@ class PromptTuner:  # pragma: no cover
             "provider": self.provider,
         }
 
-        result = self.candidate_prompts.insert_one(candidate)
-        return str(result.inserted_id)
-
     def generate_prompt_variations(  # pragma: no cover
         self, base_prompt: str, num_variations: int = 5
     ) -> List[str]:
@@ -257,8 +500,8 @@ class PromptTuner:  # pragma: no cover
         Return only the variations, one per line, starting with "VARIATION N:".
         """
 
-        # Create a simple LLM filter for prompt generation
-        temp_filter = LLMFilter(provider=self.provider, category=self.category)
+        # Reuse the filter for the category's current prompt
+        temp_filter = self._filter_for(self.base_config["llm_filter"])
 
         try:
             # This is a bit meta - using the LLM to improve its own prompts
@@ -267,49 +510,210 @@ class PromptTuner:  # pragma: no cover
             )
 
             # Parse variations from response
-            variations = []
-            lines = result.get("summary", "").split("\n")
-            for line in lines:
-                if line.strip().startswith("VARIATION"):
-                    variation = line.split(":", 1)[1].strip()
-                    if variation:
-                        variations.append(variation)
-
-            return variations[:num_variations]
+            return _VARIATION_RE.findall(result.get("summary", ""))[:num_variations]
 
         except Exception as e:
             logger.error(f"Error generating prompt variations: {e}")
             return []
 
-    def tune_prompts(
-        self, max_iterations: int = 10, population_size: int = 8
-    ) -> Dict:  # pragma: no cover
-        """Run automated prompt tuning experiment.
+    async def _evaluate_configs(
+        self, configs: List[Dict], test_data: List[Dict]
+    ) -> List[Dict]:  # pragma: no cover
+        """Evaluate several prompt configurations under one concurrency limit.
+
+        Configurations that would send identical requests (differing only in
+        version or prompt whitespace) are evaluated once and share metrics.
+        A local Ollama server reuses the KV cache of the previous request's
+        prompt prefix, so its configurations are evaluated one after another
+        to keep requests sharing a system prompt together.
+        """
+        keys = [TunerCache.scope_key(self.provider, config) for config in configs]
+        unique: Dict[str, Dict] = {}
+        for key, config in zip(keys, configs):
+            unique.setdefault(key, config)
+        if len(unique) < len(configs):
+            logger.info(
+                f"Collapsed {len(configs) - len(unique)} duplicate configurations"
+            )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        if self.provider == "ollama":
+            metrics = [
+                await self.aevaluate_prompt(config, test_data, semaphore)
+                for config in unique.values()
+            ]
+        else:
+            metrics = await asyncio.gather(
+                *(
+                    self.aevaluate_prompt(config, test_data, semaphore)
+                    for config in unique.values()
+                )
+            )
+        by_key = dict(zip(unique, metrics))
+        return [dict(by_key[key]) for key in keys]
+
+    def sweep_eval_settings(
+        self,
+        records: List[Dict],
+        batch_sizes: Tuple[int, ...] = (1, 4, 8),
+        concurrencies: Tuple[int, ...] = (1, 2, 4, 8),
+    ) -> Tuple[int, int]:  # pragma: no cover
+        """Pick the fastest batch size and concurrency on a small sample.
+
+        Returns beyond a few requests in flight diminish quickly, so a short
+        sweep on 5-10 records before a full run avoids guessing.
 
         Args:
-            max_iterations: Maximum number of tuning iterations
-            population_size: Number of prompt variations to test per iteration
+            records: Sample of training records to time
+            batch_sizes: Candidate records per request
+            concurrencies: Candidate requests in flight
 
         Returns:
-            Best prompt configuration and results
+            The chosen (batch_size, concurrency), also stored on the tuner
+        """
+        config = self.base_config["llm_filter"]
+        timings = {}
+        # Cached scores would make every combination after the first look free
+        cache, self.cache = self.cache, TunerCache(backend=MemoryBackend(max_size=0))
+        try:
+            for batch_size in batch_sizes:
+                for concurrency in concurrencies:
+                    self.batch_size, self.concurrency = batch_size, concurrency
+                    started = time.perf_counter()
+                    metrics = self.evaluate_prompt(config, records)
+                    if "error" not in metrics:
+                        elapsed = time.perf_counter() - started
+                        timings[(batch_size, concurrency)] = elapsed
+        finally:
+            self.cache = cache
+
+        if timings:
+            self.batch_size, self.concurrency = min(timings, key=timings.get)
+        else:
+            self.batch_size, self.concurrency = (
+                DEFAULT_EVAL_BATCH_SIZE,
+                DEFAULT_EVAL_CONCURRENCY,
+            )
+        logger.info(
+            f"Using batch_size={self.batch_size}, concurrency={self.concurrency}"
+        )
+        return self.batch_size, self.concurrency
+
+    def _run_iteration(
+        self, best_config: Dict, train_data: List[Dict], population_size: int
+    ) -> List[Dict]:  # pragma: no cover
+        """Evaluate the current best prompt and its variations.
+
+        Args:
+            best_config: Best prompt configuration so far
+            train_data: Records to evaluate against
+            population_size: Number of configurations including best_config
+
+        Returns:
+            Results for configurations that produced metrics
+        """
+        # Generate prompt variations
+        variations = self.generate_prompt_variations(
+            best_config["system_prompt"], population_size - 1
+        )
+
+        # Include current best in population
+        test_configs = [best_config]
+        for i, variation in enumerate(variations):
+            variant_config = best_config.copy()
+            variant_config["system_prompt"] = variation
+            variant_config["version"] = f"{best_config.get('version', '1.0')}_var{i+1}"
+            test_configs.append(variant_config)
+
+        # Evaluate all configurations concurrently
+        logger.info(f"Evaluating {len(test_configs)} configurations")
+        all_metrics = asyncio.run(self._evaluate_configs(test_configs, train_data))
+        return [
+            {
+                "config_index": j,
+                "is_baseline": j == 0,
+                "metrics": metrics,
+                "config": config,
+            }
+            for j, (config, metrics) in enumerate(zip(test_configs, all_metrics))
+            if "error" not in metrics
+        ]
+
+    def _split_training_data(
+        self, seed: int
+    ) -> Tuple[List[Dict], List[Dict]]:  # pragma: no cover
+        """Load the training data and split it 80/20 into train and test sets.
+
+        Records are stratified into quarter-point target_score bands and 20%
+        of each band goes to the test set, so every score band present is
+        evaluated. The split is reproducible for a given seed.
+
+        Args:
+            seed: Seed for the shuffle within each band
+
+        Raises:
+            ValueError: If fewer than 5 training records exist
         """
-        # Get training data
         training_data = self.get_training_data()
         if len(training_data) < 5:
             raise ValueError(
                 f"Need at least 5 training examples, got {len(training_data)}"
             )
 
-        # Split into train/test
-        random.shuffle(training_data)
-        split_idx = int(0.8 * len(training_data))
-        train_data = training_data[:split_idx]
-        test_data = training_data[split_idx:]
+        bands: Dict[float, List[Dict]] = {}
+        for record in training_data:
+            band = round(record["target_score"] * 4) / 4
+            bands.setdefault(band, []).append(record)
+
+        rng = np.random.default_rng(seed)
+        train_data, test_data = [], []
+        for band in sorted(bands):
+            # Sort first so the shuffle does not depend on the query's order
+            records = sorted(bands[band], key=lambda r: str(r.get("article_id")))
+            shuffled = [records[i] for i in rng.permutation(len(records))]
+            test_count = round(0.2 * len(records))
+            test_data.extend(shuffled[:test_count])
+            train_data.extend(shuffled[test_count:])
+
+        if not test_data:
+            test_data.append(train_data.pop())
+        return train_data, test_data
+
+    def tune_prompts(
+        self,
+        max_iterations: int = 10,
+        population_size: int = 8,
+        sweep_settings: bool = False,
+        seed: Optional[int] = None,
+        patience: int = 2,
+        min_delta: float = 0.005,
+    ) -> Dict:  # pragma: no cover
+        """Run automated prompt tuning experiment.
+
+        Args:
+            max_iterations: Maximum number of tuning iterations
+            population_size: Number of prompt variations to test per iteration
+            sweep_settings: Time batch size and concurrency combinations on a
+                few training records before the run and keep the fastest
+            seed: Seed for the train/test split; a random one is chosen and
+                recorded in the experiment when omitted
+            patience: Stop after this many consecutive iterations that improve
+                the best MAE by less than min_delta
+            min_delta: Smallest MAE reduction that counts as an improvement
+
+        Returns:
+            Best prompt configuration and results
+        """
+        seed = random.randrange(2**32) if seed is None else seed
+        train_data, test_data = self._split_training_data(seed)
 
         logger.info(
             f"Training on {len(train_data)} examples, testing on {len(test_data)}"
         )
 
+        if sweep_settings:
+            self.sweep_eval_settings(train_data[:8])
+
         # Initialize experiment tracking
         experiment = {
             "category": self.category,
@@ -317,14 +721,18 @@ class PromptTuner:  # pragma: no cover
             "started_at": datetime.now(UTC),
             "max_iterations": max_iterations,
             "population_size": population_size,
+            "seed": seed,
             "training_size": len(train_data),
             "test_size": len(test_data),
             "iterations": [],
+            "stopped_early": False,
+            "stop_iteration": None,
         }
 
         # Start with base prompt
         current_best_config = self.base_config["llm_filter"].copy()
         current_best_score = float("inf")  # We want to minimize error
+        stalled_iterations = 0
 
         # Evaluate baseline
         baseline_metrics = self.evaluate_prompt(current_best_config, test_data)
@@ -335,41 +743,9 @@ class PromptTuner:  # pragma: no cover
         for iteration in range(max_iterations):
             logger.info(f"Starting iteration {iteration + 1}/{max_iterations}")
 
-            # Generate prompt variations
-            base_system_prompt = current_best_config["system_prompt"]
-            variations = self.generate_prompt_variations(
-                base_system_prompt, population_size - 1
+            iteration_results = self._run_iteration(
+                current_best_config, train_data, population_size
             )
-
-            # Test all variations
-            iteration_results = []
-
-            # Include current best in population
-            test_configs = [current_best_config]
-
-            # Add variations
-            for i, variation in enumerate(variations):
-                variant_config = current_best_config.copy()
-                variant_config["system_prompt"] = variation
-                variant_config[
-                    "version"
-                ] = f"{current_best_config.get('version', '1.0')}_var{i+1}"
-                test_configs.append(variant_config)
-
-            # Evaluate each configuration
-            for j, config in enumerate(test_configs):
-                logger.info(f"Evaluating configuration {j+1}/{len(test_configs)}")
-                metrics = self.evaluate_prompt(config, train_data)
-
-                if "error" not in metrics:
-                    result = {
-                        "config_index": j,
-                        "is_baseline": j == 0,
-                        "metrics": metrics,
-                        "config": config,
-                    }
-                    iteration_results.append(result)
-
             if not iteration_results:
                 logger.warning(f"No valid results in iteration {iteration + 1}")
                 continue
@@ -378,7 +754,8 @@ class PromptTuner:  # pragma: no cover
             best_result = min(iteration_results, key=lambda x: x["metrics"]["mae"])
 
             # Update global best if improved
-            if best_result["metrics"]["mae"] < current_best_score:
+            improvement = current_best_score - best_result["metrics"]["mae"]
+            if improvement > 0:
                 current_best_config = best_result["config"]
                 current_best_score = best_result["metrics"]["mae"]
                 logger.info(f"New best MAE: {current_best_score:.3f}")
@@ -386,6 +763,9 @@ class PromptTuner:  # pragma: no cover
                 logger.info(
                     f"No improvement this iteration (best: {current_best_score:.3f})"
                 )
+            stalled_iterations = (
+                0 if improvement >= min_delta else stalled_iterations + 1
+            )
 
             # Record iteration
             experiment["iterations"].append(
@@ -397,6 +777,14 @@ class PromptTuner:  # pragma: no cover
                 }
             )
 
+            if stalled_iterations >= patience:
+                logger.info(
+                    f"Stopping early: MAE improved by less than {min_delta} "
+                    f"for {patience} iterations"
+                )
+                experiment.update(stopped_early=True, stop_iteration=iteration + 1)
+                break
+
         # Final evaluation on test set
         final_metrics = self.evaluate_prompt(current_best_config, test_data)
 
@@ -411,32 +799,24 @@ class PromptTuner:  # pragma: no cover
             }
         )
 
-        # Store experiment in MongoDB
-        experiment_result = self.tuning_experiments.insert_one(experiment)
+        # Store experiment in MongoDB, with iterations in their own collection
+        iterations = experiment["iterations"]
+        experiment_document = {k: v for k, v in experiment.items() if k != "iterations"}
+        experiment_document["iteration_count"] = len(iterations)
+        experiment_result = self.tuning_experiments.insert_one(experiment_document)
         experiment_id = str(experiment_result.inserted_id)
+        self.store_experiment_iterations(experiment_id, iterations)
 
         # Store all candidate prompts from the experiment
-        for iteration_data in experiment["iterations"]:
-            iteration_num = iteration_data["iteration"]
-            for result in iteration_data["results"]:
-                prompt_version = result["config"].get(
-                    "version", f"baseline_iter{iteration_num}"
-                )
-                self.store_candidate_prompt(
-                    experiment_id=experiment_id,
-                    iteration=iteration_num,
-                    prompt_version=prompt_version,
-                    config=result["config"],
-                    metrics=result["metrics"],
-                )
+        candidate_ids = self.store_candidate_prompts(
+            experiment_id, experiment["iterations"]
+        )
 
         logger.info(
             f"Tuning completed. Final MAE: {final_metrics.get('mae', 'N/A'):.3f}"
         )
         logger.info(f"Improvement over baseline: {experiment['improvement']:.3f}")
-        logger.info(
-            f"Stored {sum(len(iter_data['results']) for iter_data in experiment['iterations'])} candidate prompts"
-        )
+        logger.info(f"Stored {len(candidate_ids)} candidate prompts")
 
         # Add experiment ID to the returned experiment
         experiment["_id"] = experiment_result.inserted_id
@@ -451,8 +831,6 @@ class PromptTuner:  # pragma: no cover
         Returns:
             True if successfully applied
         """
-        from bson import ObjectId
-
         experiment = self.tuning_experiments.find_one({"_id": ObjectId(experiment_id)})
         if not experiment:
             logger.error(f"Experiment {experiment_id} not found")
@@ -479,7 +857,7 @@ class PromptTuner:  # pragma: no cover
         # Write to config file
         full_config = {"llm_filter": best_config}
         with open(self.current_config_path, "w") as f:
-            yaml.dump(full_config, f, default_flow_style=False)
+            yaml.dump(full_config, f, Dumper=SafeDumper, default_flow_style=False)
 
         logger.info(f"Applied tuned prompt version {new_version} for {self.category}")
         return True
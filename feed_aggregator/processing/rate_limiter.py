@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+import weakref
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests per minute and tokens per minute.
+
+    Both buckets start full and refill continuously at their per-minute
+    rate. acquire() waits until one request and the estimated number of
+    tokens are available, so concurrent callers are spread out to the
+    account's sustained limits instead of bursting into 429 responses.
+    """
+
+    def __init__(self, rpm: int, tpm: Optional[int] = None):
+        """Initialize rate limiter.
+
+        Args:
+            rpm: Maximum requests per minute
+            tpm: Optional maximum tokens per minute
+        """
+        if rpm <= 0 or (tpm is not None and tpm <= 0):
+            raise ValueError("Rate limits must be positive")
+
+        self.rpm = rpm
+        self.tpm = tpm
+        self._available_requests = float(rpm)
+        self._available_tokens = float(tpm or 0)
+        self._updated_at = time.monotonic()
+        # asyncio locks bind to one event loop, and callers may reuse the
+        # limiter across asyncio.run calls, so keep one lock per loop
+        self._locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    def _refill(self) -> None:
+        """Add capacity for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._updated_at) / 60
+        self._updated_at = now
+
+        self._available_requests = min(
+            self.rpm, self._available_requests + elapsed_minutes * self.rpm
+        )
+        if self.tpm is not None:
+            self._available_tokens = min(
+                self.tpm, self._available_tokens + elapsed_minutes * self.tpm
+            )
+
+    def _wait_time(self, tokens: int) -> float:
+        """Seconds until a request needing tokens can be admitted."""
+        wait = max(0.0, (1 - self._available_requests) * 60 / self.rpm)
+        if self.tpm is not None:
+            wait = max(wait, (tokens - self._available_tokens) * 60 / self.tpm)
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait for capacity for one request using the given tokens.
+
+        Args:
+            tokens: Estimated tokens the request will consume. Requests larger
+                than the whole token budget are admitted once the bucket is full.
+        """
+        if self.tpm is not None:
+            tokens = min(tokens, self.tpm)
+
+        async with self._lock():
+            self._refill()
+            wait = self._wait_time(tokens)
+            while wait > 0:
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+                self._refill()
+                wait = self._wait_time(tokens)
+
+            self._available_requests -= 1
+            if self.tpm is not None:
+                self._available_tokens -= tokens
@@ -0,0 +1,196 @@
+import hashlib
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import ollama
+
+from feed_aggregator.processing.llm_cache import (
+    DEFAULT_CACHE_DIR,
+    CacheBackend,
+    DiskBackend,
+    LLMCache,
+)
+from feed_aggregator.processing.llm_filter import canonical_prompt
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TUNER_CACHE_DIR = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "tuner")
+
+# Minimum cosine similarity for a semantic cache hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+# Result fields kept for evaluation
+CACHED_FIELDS = ("relevance_score", "summary")
+
+DEFAULT_EMBED_MODEL = "nomic-embed-text"
+
+
+def ollama_embedder(
+    model: str = DEFAULT_EMBED_MODEL,
+) -> Callable[[str], Sequence[float]]:
+    """Return an embedding function backed by a local Ollama model.
+
+    Args:
+        model: Ollama embedding model name
+
+    Returns:
+        Function mapping a text to its embedding
+    """
+
+    def embed(text: str) -> Sequence[float]:
+        return ollama.embed(model=model, input=text)["embeddings"][0]
+
+    return embed
+
+
+class TunerCache:
+    """Caches per-record scores across prompt tuning runs.
+
+    The first level is an exact match on the prompt configuration and the
+    record's title and content, persisted through a cache backend. The
+    optional second level returns the score of a similar record scored
+    with the same prompt configuration, using embeddings computed once per
+    record and held in memory.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """Initialize tuner cache.
+
+        Args:
+            backend: Storage for exact matches, defaults to JSON files under
+                DEFAULT_TUNER_CACHE_DIR
+            embed: Optional function returning an embedding for a text,
+                enables semantic lookups
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.backend = (
+            backend if backend is not None else DiskBackend(DEFAULT_TUNER_CACHE_DIR)
+        )
+        self.embed = embed
+        self.threshold = threshold
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._semantic: Dict[str, Tuple[List[np.ndarray], List[Dict[str, Any]]]] = {}
+
+    @staticmethod
+    def scope_key(provider: str, prompt_config: Dict[str, Any]) -> str:
+        """Identify the provider and prompt configuration a score came from.
+
+        The version label is ignored and the system prompt is normalized the
+        way LLMFilter sends it, so configurations that differ only in those
+        share entries.
+
+        Args:
+            provider: LLM provider name
+            prompt_config: The llm_filter section being evaluated
+
+        Returns:
+            Hex digest identifying the scope
+        """
+        config = {k: v for k, v in prompt_config.items() if k != "version"}
+        if isinstance(config.get("system_prompt"), str):
+            config["system_prompt"] = canonical_prompt(config["system_prompt"])
+        return LLMCache.make_key({"provider": provider, "config": config})
+
+    @staticmethod
+    def _record_text(record: Dict[str, Any]) -> str:
+        return f"{record.get('title', '')}\x00{record.get('content', '')}"
+
+    def _record_key(self, scope: str, record: Dict[str, Any]) -> str:
+        text = f"{scope}\x00{self._record_text(record)}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _embedding(self, record: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Return the normalized embedding of a record, computing it once."""
+        if self.embed is None:
+            return None
+
+        text = self._record_text(record)
+        text_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        vector = self._embeddings.get(text_key)
+        if vector is None:
+            try:
+                vector = np.asarray(self.embed(text), dtype=np.float32)
+            except Exception as e:
+                logger.warning(f"Embedding failed, skipping semantic cache: {str(e)}")
+                return None
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector = vector / norm
+            self._embeddings[text_key] = vector
+        return vector
+
+    def _semantic_get(
+        self, scope: str, record: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        entries = self._semantic.get(scope)
+        if not entries:
+            return None
+        vector = self._embedding(record)
+        if vector is None:
+            return None
+
+        vectors, results = entries
+        similarities = np.stack(vectors) @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return results[best]
+        return None
+
+    def get(self, scope: str, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Look up the score for a record under a prompt configuration.
+
+        Args:
+            scope: Key returned by scope_key
+            record: Training record with title and content
+
+        Returns:
+            Cached relevance_score and summary, or None on a miss
+        """
+        result = self.backend.get(self._record_key(scope, record))
+        if result is not None:
+            self.hits += 1
+            return result
+
+        result = self._semantic_get(scope, record)
+        if result is not None:
+            self.semantic_hits += 1
+            return dict(result)
+
+        self.misses += 1
+        return None
+
+    def set(self, scope: str, record: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Store the score for a record under a prompt configuration.
+
+        Args:
+            scope: Key returned by scope_key
+            record: Training record with title and content
+            result: Analysis result from LLMFilter
+        """
+        value = {field: result.get(field) for field in CACHED_FIELDS}
+        self.backend.set(self._record_key(scope, record), value)
+
+        vector = self._embedding(record)
+        if vector is not None:
+            vectors, results = self._semantic.setdefault(scope, ([], []))
+            vectors.append(vector)
+            results.append(value)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts since the cache was created."""
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
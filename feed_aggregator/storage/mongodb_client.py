@@ -1,11 +1,15 @@
+import copy
 import logging
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from pymongo import ASCENDING, MongoClient
+from pymongo import ASCENDING, DESCENDING, MongoClient, UpdateOne, WriteConcern
 from pymongo.collection import Collection
+from pymongo.cursor import Cursor
 from pymongo.database import Database
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from feed_aggregator.config.mongodb_config import (
     EnvironmentMongoDBConfigProvider,
@@ -14,6 +18,101 @@ from feed_aggregator.config.mongodb_config import (
 
 logger = logging.getLogger(__name__)
 
+# Upserts sent to MongoDB per bulk_write round trip
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Index serving status queries sorted by publish date
+STATUS_PUBLISHED_INDEX = [("processing_status", ASCENDING), ("published", ASCENDING)]
+
+# Index serving the score-filtered status queries
+STATUS_SCORE_INDEX = [
+    ("processing_status", ASCENDING),
+    ("llm_analysis.relevance_score", ASCENDING),
+]
+
+# Indexes serving the scored-articles-in-a-time-window query, one per branch
+# of its $or on published and crawled
+STATUS_PUBLISHED_SCORE_INDEX = [
+    ("processing_status", ASCENDING),
+    ("published", DESCENDING),
+    ("llm_analysis.relevance_score", ASCENDING),
+]
+STATUS_CRAWLED_SCORE_INDEX = [
+    ("processing_status", ASCENDING),
+    ("crawled", DESCENDING),
+    ("llm_analysis.relevance_score", ASCENDING),
+]
+
+# Analysis updates above which rebuilding STATUS_SCORE_INDEX afterwards is
+# cheaper than maintaining it on every write
+REINDEX_THRESHOLD = 10_000
+
+# Metrics buffered before they are written in one insert_many
+METRIC_FLUSH_SIZE = 100
+
+# Documents fetched per cursor round trip on large scans
+CURSOR_BATCH_SIZE = 1000
+
+# Aggregation stages counting items per processing status
+STATUS_GROUP_STAGES = [{"$group": {"_id": "$processing_status", "count": {"$sum": 1}}}]
+
+# Acknowledged by the primary without waiting for the journal; for data whose
+# loss in a server crash is acceptable
+FAST_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
+# MongoClients shared by MongoDBClient instances with the same URI and options,
+# with the number of open instances using each
+_shared_clients: Dict[Tuple, List[Any]] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _cursor_batch_size(limit: Optional[int]) -> int:
+    """Batch size fetching a limited result in one round trip when it fits."""
+    return min(CURSOR_BATCH_SIZE, limit) if limit else CURSOR_BATCH_SIZE
+
+
+def _acquire_client(uri: str, options: Dict[str, Any]) -> MongoClient:
+    """Return the process-wide MongoClient for uri and options.
+
+    Instances sharing a client share its connection pool and server
+    discovery instead of each opening their own.
+
+    Args:
+        uri: MongoDB connection URI
+        options: Keyword arguments for MongoClient
+
+    Returns:
+        Shared MongoClient
+    """
+    key = (uri, tuple(sorted(options.items())))
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is None:
+            entry = _shared_clients[key] = [MongoClient(uri, **options), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_client(client: MongoClient) -> bool:
+    """Release one use of a shared client, closing it after the last.
+
+    Args:
+        client: Client returned by _acquire_client
+
+    Returns:
+        True if the client was closed
+    """
+    with _shared_clients_lock:
+        for key, entry in _shared_clients.items():
+            if entry[0] is client:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return False
+                del _shared_clients[key]
+                break
+    client.close()
+    return True
+
 
 class MongoDBClient:
     """MongoDB client for feed storage and retrieval operations."""
@@ -24,11 +123,27 @@ class MongoDBClient:
     STATUS_FILTERED = "filtered_out"
     STATUS_PUBLISHED = "published"
 
-    def __init__(self, config_provider: Optional[MongoDBConfigProvider] = None):
+    # (uri, database) pairs whose indexes this process has already ensured,
+    # mapped to whether STATUS_PUBLISHED_INDEX is known to exist
+    _indexed_databases: Dict[Tuple[str, str], bool] = {}
+
+    def __init__(
+        self,
+        config_provider: Optional[MongoDBConfigProvider] = None,
+        fast_ingest: bool = False,
+        item_cache_size: int = 0,
+    ):
         """Initialize MongoDB connection using configuration provider.
 
+        Metrics are always written with FAST_WRITE_CONCERN.
+
         Args:
             config_provider: MongoDB configuration provider. If None, uses environment variables.
+            fast_ingest: Also write feed items with FAST_WRITE_CONCERN, trading
+                durability of the latest writes for lower ingest latency
+            item_cache_size: Number of documents get_item keeps in an
+                in-process LRU; 0 disables it. Writes through this client
+                invalidate it, writes made elsewhere do not.
         """
         if config_provider is None:
             config_provider = EnvironmentMongoDBConfigProvider()
@@ -37,50 +152,159 @@ class MongoDBClient:
         uri = config.get_uri()
 
         # Initialize connection
-        self.client = MongoClient(uri)
+        self.client = _acquire_client(uri, config.get_client_options())
         self.db: Database = self.client[config.database]
-        self.feed_items: Collection = self.db.feed_items
-        self.metrics: Collection = self.db.processing_metrics
+        self.feed_items: Collection = self.db.get_collection(
+            "feed_items", write_concern=FAST_WRITE_CONCERN if fast_ingest else None
+        )
+        self.metrics: Collection = self.db.get_collection(
+            "processing_metrics", write_concern=FAST_WRITE_CONCERN
+        )
+        self._metric_buffer: List[Dict] = []
+        self._item_cache_size = item_cache_size
+        self._item_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        # Bounds bulk writes issued concurrently from several threads
+        self._write_semaphore = threading.BoundedSemaphore(config.write_concurrency)
 
         logger.info(f"Connected to MongoDB at {config.host}:{config.port}")
 
-    def store_feed_items(self, items: List[Dict]) -> int:
+        database_key = (uri, config.database)
+        if database_key not in self._indexed_databases:
+            created = self._ensure_indexes()
+            self._indexed_databases[database_key] = STATUS_PUBLISHED_INDEX in created
+
+        # Hinting an index the server lacks fails the query, so only hint
+        # the one this process created
+        self._status_index_hint = (
+            STATUS_PUBLISHED_INDEX if self._indexed_databases[database_key] else None
+        )
+
+    def _ensure_indexes(self) -> List[List[Tuple[str, int]]]:
+        """Create the indexes the client's queries rely on.
+
+        The compound indexes serve the status queries sorted by publish date
+        and the score-filtered queries; their processing_status prefix also
+        serves plain status lookups and counts. The time window indexes let
+        each branch of the reconciliation query's $or use its own index scan.
+        The crawled index backs listings of the most recently ingested items.
+        create_index is a no-op when the index already exists. Failures (for
+        example a user without index privileges) are logged, not raised.
+
+        Returns:
+            Key specifications of the indexes that exist afterwards
+        """
+        indexes = [
+            ([("id", ASCENDING)], {"unique": True}),
+            (STATUS_PUBLISHED_INDEX, {}),
+            (STATUS_SCORE_INDEX, {}),
+            (STATUS_PUBLISHED_SCORE_INDEX, {}),
+            (STATUS_CRAWLED_SCORE_INDEX, {}),
+            ([("crawled", DESCENDING)], {}),
+        ]
+        created = []
+        for keys, options in indexes:
+            try:
+                self.feed_items.create_index(keys, **options)
+                created.append(keys)
+            except PyMongoError as e:
+                logger.warning(f"Could not create index {keys}: {str(e)}")
+        return created
+
+    def _hint_status_index(self, cursor: Cursor) -> Cursor:
+        """Pin a status query sorted by publish date to its compound index.
+
+        Skews in the status distribution can otherwise lead the planner to
+        an in-memory sort.
+        """
+        if self._status_index_hint:
+            cursor = cursor.hint(self._status_index_hint)
+        return cursor
+
+    def store_feed_items(
+        self, items: Iterable[Dict], stored_ids: Optional[Set[str]] = None
+    ) -> int:
         """Store feed items in MongoDB.
 
         Args:
-            items: List of feed items from Feedly API
+            items: Feed items from Feedly API; any iterable (including a
+                generator) is consumed lazily
+            stored_ids: Optional set that receives the ids of the items
+                actually written, excluding items that were skipped or whose
+                write failed
 
         Returns:
             Number of items successfully stored
         """
+        self._item_cache.clear()
         stored_count = 0
+        operations = []
+        item_ids = []
+        written_ids: Set[str] = set()
         for item in items:
             try:
                 # Add processing status if not present
-                if "processing_status" not in item:
-                    item["processing_status"] = "pending"
-
-                # Insert the item
-                result = self.feed_items.update_one(
-                    {"id": item["id"]},  # Use Feedly ID as unique identifier
-                    {"$set": item},
-                    upsert=True,
+                item.setdefault("processing_status", self.STATUS_PENDING)
+
+                operations.append(
+                    UpdateOne(
+                        {"id": item["id"]},  # Use Feedly ID as unique identifier
+                        {"$set": item},
+                        upsert=True,
+                    )
                 )
-
-                if result.upserted_id or result.modified_count:
-                    stored_count += 1
-
-            except DuplicateKeyError:
-                logger.warning(f"Duplicate item found: {item.get('id')}")
+                item_ids.append(item["id"])
             except Exception as e:
                 logger.error(f"Error storing item {item.get('id')}: {str(e)}")
 
+            if len(operations) >= BULK_WRITE_BATCH_SIZE:
+                count, written = self._bulk_upsert(operations, item_ids)
+                stored_count += count
+                written_ids |= written
+                operations, item_ids = [], []
+
+        if operations:
+            count, written = self._bulk_upsert(operations, item_ids)
+            stored_count += count
+            written_ids |= written
+
+        if stored_ids is not None:
+            stored_ids |= written_ids
+
         # Record metric
         if stored_count > 0:
             self.record_metric("items_ingested", stored_count)
 
         return stored_count
 
+    def _bulk_upsert(
+        self, operations: List[UpdateOne], item_ids: List[str]
+    ) -> Tuple[int, Set[str]]:
+        """Apply upserts or updates in a single unordered bulk write.
+
+        Args:
+            operations: Updates to apply
+            item_ids: Feedly IDs the operations target
+
+        Returns:
+            Number of items inserted or modified, and the IDs whose write
+            did not fail
+        """
+        try:
+            with self._write_semaphore:
+                result = self.feed_items.bulk_write(operations, ordered=False)
+            return result.upserted_count + result.modified_count, set(item_ids)
+        except BulkWriteError as e:
+            failed_ids = set()
+            for error in e.details.get("writeErrors", []):
+                item_id = error.get("op", {}).get("q", {}).get("id")
+                failed_ids.add(item_id)
+                logger.warning(f"Error storing item {item_id}: {error.get('errmsg')}")
+            count = e.details.get("nUpserted", 0) + e.details.get("nModified", 0)
+            return count, set(item_ids) - failed_ids
+        except Exception as e:
+            logger.error(f"Error storing {len(operations)} items: {str(e)}")
+            return 0, set()
+
     def get_items_by_status(
         self,
         status: str,
@@ -101,19 +325,50 @@ class MongoDBClient:
         Returns:
             List of matching items
         """
+        return list(
+            self.iter_items_by_status(
+                status, category, limit, sort_field, sort_direction
+            )
+        )
+
+    def iter_items_by_status(
+        self,
+        status: str,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort_field: str = "published",
+        sort_direction: int = ASCENDING,
+    ) -> Iterator[Dict]:
+        """Stream items by processing status with optional category filter.
+
+        Unlike get_items_by_status, items are fetched in batches as the
+        caller iterates instead of being loaded into memory up front.
+
+        Args:
+            status: Processing status to filter by
+            category: Optional category to filter by
+            limit: Optional maximum number of items to return
+            sort_field: Field to sort by (default: published)
+            sort_direction: Sort direction (default: ASCENDING)
+
+        Returns:
+            Iterator over matching items
+        """
         query = {"processing_status": status}
         if category:
             query["category"] = category
 
-        cursor = self.feed_items.find(query)
+        cursor = self.feed_items.find(query).batch_size(_cursor_batch_size(limit))
 
         if sort_field:
             cursor = cursor.sort(sort_field, sort_direction)
+            if sort_field == "published":
+                cursor = self._hint_status_index(cursor)
 
         if limit:
             cursor = cursor.limit(limit)
 
-        return list(cursor)
+        return cursor
 
     def get_pending_items(self, limit: int = 100) -> List[Dict]:
         """Get items that need processing.
@@ -135,7 +390,39 @@ class MongoDBClient:
         Returns:
             True if item exists
         """
-        return self.feed_items.count_documents({"id": item_id}) > 0
+        # Stops at the first match and reads only the unique id index
+        return (
+            self.feed_items.find_one({"id": item_id}, {"_id": 0, "id": 1}) is not None
+        )
+
+    def get_existing_ids(self, item_ids: Iterable[str]) -> Set[str]:
+        """Get the subset of item IDs already stored, in one query.
+
+        Args:
+            item_ids: Feedly IDs to check
+
+        Returns:
+            IDs that exist in the database
+        """
+        cursor = self.feed_items.find(
+            {"id": {"$in": list(item_ids)}}, {"_id": 0, "id": 1}
+        )
+        return {doc["id"] for doc in cursor}
+
+    def get_analyzed_ids(self, item_ids: Iterable[str]) -> Set[str]:
+        """Get the subset of item IDs that already have an LLM analysis.
+
+        Args:
+            item_ids: Feedly IDs to check
+
+        Returns:
+            IDs of stored items with an llm_analysis field
+        """
+        cursor = self.feed_items.find(
+            {"id": {"$in": list(item_ids)}, "llm_analysis": {"$exists": True}},
+            {"_id": 0, "id": 1},
+        )
+        return {doc["id"] for doc in cursor}
 
     def get_item(self, item_id: str) -> Optional[Dict]:
         """Get an item by its ID.
@@ -146,7 +433,40 @@ class MongoDBClient:
         Returns:
             Item document or None if not found
         """
-        return self.feed_items.find_one({"id": item_id})
+        if not self._item_cache_size:
+            return self.feed_items.find_one({"id": item_id})
+
+        item = self._item_cache.get(item_id)
+        if item is not None:
+            self._item_cache.move_to_end(item_id)
+        else:
+            item = self.feed_items.find_one({"id": item_id})
+            if item is None:
+                return None
+            self._item_cache[item_id] = item
+            if len(self._item_cache) > self._item_cache_size:
+                self._item_cache.popitem(last=False)
+        # Callers update the documents they get, so hand out copies
+        return copy.deepcopy(item)
+
+    def get_items_by_ids(
+        self, item_ids: Iterable[str], fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict]:
+        """Fetch several items in one query.
+
+        Args:
+            item_ids: Feedly IDs of the items
+            fields: Optional fields to return; id is always included
+
+        Returns:
+            Found items keyed by Feedly ID; missing IDs are absent
+        """
+        projection = None
+        if fields is not None:
+            projection = dict.fromkeys(fields, 1)
+            projection["id"] = 1
+        cursor = self.feed_items.find({"id": {"$in": list(item_ids)}}, projection)
+        return {item["id"]: item for item in cursor}
 
     def update_item(self, item_id: str, update_data: Dict) -> bool:
         """Update an item with the provided data.
@@ -158,9 +478,54 @@ class MongoDBClient:
         Returns:
             True if update was successful
         """
+        self._item_cache.pop(item_id, None)
         result = self.feed_items.update_one({"id": item_id}, {"$set": update_data})
         return result.modified_count > 0
 
+    def bulk_update_analyses(self, updates: Dict[str, Dict]) -> int:
+        """Write analysis results for many items, e.g. after a re-score.
+
+        At REINDEX_THRESHOLD updates or more, STATUS_SCORE_INDEX is dropped
+        for the duration of the writes and rebuilt afterwards, which is
+        cheaper than updating it per document. Smaller batches keep the
+        index, so concurrent score queries are not slowed down.
+
+        Args:
+            updates: Fields to set (e.g. llm_analysis, processing_status)
+                keyed by Feedly ID
+
+        Returns:
+            Number of items modified
+        """
+        operations = [
+            UpdateOne({"id": item_id}, {"$set": update_data})
+            for item_id, update_data in updates.items()
+        ]
+        if not operations:
+            return 0
+
+        self._item_cache.clear()
+        reindex = len(operations) >= REINDEX_THRESHOLD
+        if reindex:
+            try:
+                self.feed_items.drop_index(STATUS_SCORE_INDEX)
+            except PyMongoError as e:
+                logger.warning(f"Could not drop score index: {str(e)}")
+                reindex = False
+
+        item_ids = list(updates)
+        modified_count = 0
+        try:
+            for start in range(0, len(operations), BULK_WRITE_BATCH_SIZE):
+                end = start + BULK_WRITE_BATCH_SIZE
+                count, _ = self._bulk_upsert(operations[start:end], item_ids[start:end])
+                modified_count += count
+        finally:
+            if reindex:
+                self.feed_items.create_index(STATUS_SCORE_INDEX)
+
+        return modified_count
+
     def update_item_status(
         self, item_id: str, status: str, llm_analysis: Optional[Dict] = None
     ) -> bool:
@@ -197,6 +562,35 @@ class MongoDBClient:
         Returns:
             List of high-scoring items that haven't been published to feed
         """
+        return list(self.iter_filtered_items(min_score, limit, category))
+
+    def iter_filtered_items(
+        self, min_score: float = 0.7, limit: int = 100, category: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Stream the items get_filtered_items returns, fetched in batches.
+
+        Args:
+            min_score: Minimum relevance score (0-1)
+            limit: Maximum number of items to return
+            category: Optional category to filter by
+
+        Returns:
+            Iterator over high-scoring items that haven't been published to feed
+        """
+        query = self._filtered_items_query(min_score, category)
+        cursor = (
+            self.feed_items.find(query)
+            .sort("published", ASCENDING)
+            .batch_size(_cursor_batch_size(limit))
+        )
+        if limit:
+            cursor = cursor.limit(limit)
+        return self._hint_status_index(cursor)
+
+    def _filtered_items_query(
+        self, min_score: float, category: Optional[str] = None
+    ) -> Dict:
+        """Build the query for scored items not yet published to the feed."""
         query = {
             "processing_status": {"$in": [self.STATUS_PROCESSED, self.STATUS_FILTERED]},
             "llm_analysis.relevance_score": {"$gte": min_score},
@@ -207,11 +601,35 @@ class MongoDBClient:
         }
         if category:
             query["category"] = category
+        return query
+
+    def get_dashboard_snapshot(
+        self, min_score: float = 0.7, limit: int = 100, category: Optional[str] = None
+    ) -> Dict:
+        """Get status counts and unpublished high-scoring items in one query.
+
+        Args:
+            min_score: Minimum relevance score (0-1)
+            limit: Maximum number of items to return
+            category: Optional category to filter items by
 
-        cursor = self.feed_items.find(query).sort("published", ASCENDING)
+        Returns:
+            Dictionary with "counts" as returned by get_status_counts and
+            "filtered" as returned by get_filtered_items
+        """
+        filtered = [
+            {"$match": self._filtered_items_query(min_score, category)},
+            {"$sort": {"published": ASCENDING}},
+        ]
         if limit:
-            cursor = cursor.limit(limit)
-        return list(cursor)
+            filtered.append({"$limit": limit})
+
+        pipeline = [{"$facet": {"counts": STATUS_GROUP_STAGES, "filtered": filtered}}]
+        snapshot = next(self.feed_items.aggregate(pipeline))
+        return {
+            "counts": self._status_counts(snapshot["counts"]),
+            "filtered": snapshot["filtered"],
+        }
 
     def get_status_counts(self) -> Dict[str, int]:
         """Get counts of items by processing status.
@@ -219,20 +637,17 @@ class MongoDBClient:
         Returns:
             Dictionary of status counts
         """
+        return self._status_counts(self.feed_items.aggregate(STATUS_GROUP_STAGES))
+
+    def _status_counts(self, rows: Iterable[Dict]) -> Dict[str, int]:
+        """Map $group rows of items per processing status to named counts."""
+        counts = {row["_id"]: row["count"] for row in rows}
         return {
-            "total": self.feed_items.count_documents({}),
-            "pending": self.feed_items.count_documents(
-                {"processing_status": self.STATUS_PENDING}
-            ),
-            "processed": self.feed_items.count_documents(
-                {"processing_status": self.STATUS_PROCESSED}
-            ),
-            "filtered": self.feed_items.count_documents(
-                {"processing_status": self.STATUS_FILTERED}
-            ),
-            "published": self.feed_items.count_documents(
-                {"processing_status": self.STATUS_PUBLISHED}
-            ),
+            "total": sum(counts.values()),
+            "pending": counts.get(self.STATUS_PENDING, 0),
+            "processed": counts.get(self.STATUS_PROCESSED, 0),
+            "filtered": counts.get(self.STATUS_FILTERED, 0),
+            "published": counts.get(self.STATUS_PUBLISHED, 0),
         }
 
     def record_metric(
@@ -240,6 +655,9 @@ class MongoDBClient:
     ) -> None:
         """Record a processing metric.
 
+        Metrics are buffered and written once METRIC_FLUSH_SIZE accumulate,
+        on flush_metrics() or on close().
+
         Args:
             metric_type: Type of metric
             value: Metric value
@@ -253,13 +671,30 @@ class MongoDBClient:
         if metadata:
             metric["metadata"] = metadata
 
+        self._metric_buffer.append(metric)
+        if len(self._metric_buffer) >= METRIC_FLUSH_SIZE:
+            self.flush_metrics()
+
+    def flush_metrics(self) -> None:
+        """Write buffered metrics in one unordered insert.
+
+        Metrics are best effort, so failures are logged and the buffer is
+        cleared either way.
+        """
+        if not self._metric_buffer:
+            return
+
+        metrics, self._metric_buffer = self._metric_buffer, []
         try:
-            self.metrics.insert_one(metric)
+            with self._write_semaphore:
+                self.metrics.insert_many(metrics, ordered=False)
         except Exception as e:
-            logger.error(f"Error recording metric: {str(e)}")
+            logger.error(f"Error recording {len(metrics)} metrics: {str(e)}")
 
     def close(self) -> None:
-        """Close MongoDB connection."""
+        """Flush buffered metrics and close MongoDB connection."""
         if self.client:
-            self.client.close()
-            logger.info("Closed MongoDB connection")
+            self.flush_metrics()
+            if _release_client(self.client):
+                logger.info("Closed MongoDB connection")
+            self.client = None
@@ -1,6 +1,7 @@
 import os
 
-from feed_aggregator.fetcher import FeedlyFetcher
+from feed_aggregator.fetcher import DEFAULT_FEEDLY_CACHE_DIR, FeedlyFetcher
+from feed_aggregator.processing.llm_cache import DiskBackend
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
 
@@ -21,7 +22,14 @@ def main():
         print("Using Feedly API with provided token...")
         if user_id:
             print(f"Using user ID: {user_id}")
-        fetcher = FeedlyFetcher(token=token, user_id=user_id)
+        # Reuse responses between development runs, e.g. FEEDLY_CACHE_TTL=3600
+        cache_ttl = os.environ.get("FEEDLY_CACHE_TTL")
+        cache = (
+            DiskBackend(DEFAULT_FEEDLY_CACHE_DIR, ttl=float(cache_ttl))
+            if cache_ttl
+            else None
+        )
+        fetcher = FeedlyFetcher(token=token, user_id=user_id, cache=cache)
     else:
         print("No FEEDLY_TOKEN found, using demo mode...")
         fetcher = FeedlyFetcher(demo_mode=True)
@@ -39,28 +47,14 @@ def main():
         print(f"Stored {stored_count} items in MongoDB")
 
         # Get metrics
-        metrics = {
-            "total_items": mongo_client.feed_items.count_documents({}),
-            "pending_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "pending"}
-            ),
-            "processed_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "processed"}
-            ),
-            "filtered_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "filtered_out"}
-            ),
-            "published_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "published"}
-            ),
-        }
+        metrics = mongo_client.get_status_counts()
 
         print("\nCurrent MongoDB Status:")
-        print(f"Total items: {metrics['total_items']}")
-        print(f"Pending items: {metrics['pending_items']}")
-        print(f"Processed items: {metrics['processed_items']}")
-        print(f"Filtered items: {metrics['filtered_items']}")
-        print(f"Published items: {metrics['published_items']}")
+        print(f"Total items: {metrics['total']}")
+        print(f"Pending items: {metrics['pending']}")
+        print(f"Processed items: {metrics['processed']}")
+        print(f"Filtered items: {metrics['filtered']}")
+        print(f"Published items: {metrics['published']}")
 
     finally:
         # Close MongoDB connection
@@ -10,6 +10,133 @@ from feed_aggregator.storage.mongodb_client import MongoDBClient
 
 logging.basicConfig(level=logging.INFO)
 
+# Look for actual cybersecurity-related articles
+CYBER_KEYWORDS = [
+    "security",
+    "vulnerability",
+    "exploit",
+    "malware",
+    "ransomware",
+    "phishing",
+    "breach",
+    "hack",
+    "cyber",
+    "threat",
+    "attack",
+    "penetration",
+    "firewall",
+    "encryption",
+    "authentication",
+    "CVE",
+    "zero-day",
+    "backdoor",
+    "botnet",
+]
+
+# Query to find cyber-related articles
+CYBER_QUERY = {
+    "processing_status": {"$in": ["processed", "published"]},
+    "llm_analysis": {"$exists": True},
+    "$or": [
+        {"title": {"$regex": "|".join(CYBER_KEYWORDS), "$options": "i"}},
+        {
+            "content.content": {
+                "$regex": "|".join(CYBER_KEYWORDS[:5]),
+                "$options": "i",
+            }
+        },  # Limit regex complexity
+    ],
+}
+
+RATIONALES = {
+    0.2: "Low quality cyber content - Reddit post or minimal content",
+    0.8: "High quality cybersecurity content - vulnerability disclosure or security research",
+    0.7: "Good quality cybersecurity content - tools, analysis, or research",
+    0.6: "Medium quality cybersecurity content with substantial technical details",
+    0.3: "Low-medium quality cyber content - mentions security but lacks depth",
+}
+
+
+def _mentions(field: str, keywords: list) -> dict:
+    """Aggregation expression testing a lowercased field for any keyword."""
+    return {"$regexMatch": {"input": field, "regex": "|".join(keywords)}}
+
+
+# Finds up to 15 cyber articles and scores them server-side, first match wins:
+# Reddit posts or very short content are low quality, vulnerability
+# disclosures high, tools and analysis medium-high, substantial security
+# content medium, anything else low-medium
+CYBER_TRAINING_PIPELINE = [
+    {"$match": CYBER_QUERY},
+    {"$limit": 15},
+    {
+        "$project": {
+            "_id": 0,
+            "id": 1,
+            "title": 1,
+            "title_lower": {"$toLower": {"$ifNull": ["$title", ""]}},
+            "content_lower": {"$toLower": {"$ifNull": ["$content.content", ""]}},
+        }
+    },
+    {"$addFields": {"content_length": {"$strLenCP": "$content_lower"}}},
+    {
+        "$project": {
+            "id": 1,
+            "title": 1,
+            "target_score": {
+                "$switch": {
+                    "branches": [
+                        {
+                            "case": {
+                                "$or": [
+                                    _mentions(
+                                        "$title_lower", ["reddit", "submitted by"]
+                                    ),
+                                    {"$lt": ["$content_length", 200]},
+                                ]
+                            },
+                            "then": 0.2,
+                        },
+                        {
+                            "case": _mentions(
+                                "$title_lower",
+                                [
+                                    "vulnerability",
+                                    "exploit",
+                                    "cve",
+                                    "zero-day",
+                                    "breach",
+                                ],
+                            ),
+                            "then": 0.8,
+                        },
+                        {
+                            "case": _mentions(
+                                "$title_lower",
+                                ["tool", "framework", "analysis", "research"],
+                            ),
+                            "then": 0.7,
+                        },
+                        {
+                            "case": {
+                                "$and": [
+                                    {"$gt": ["$content_length", 500]},
+                                    _mentions(
+                                        "$content_lower",
+                                        ["security", "attack", "defense"],
+                                    ),
+                                ]
+                            },
+                            "then": 0.6,
+                        },
+                    ],
+                    "default": 0.3,
+                }
+            },
+        }
+    },
+]
+
 
 def clear_and_setup_cyber_training():
     """Clear incorrect training data and setup proper Cyber category training."""
@@ -25,45 +152,7 @@ def clear_and_setup_cyber_training():
         result = tuner.training_data.delete_many({"category": "Cyber"})
         print(f"🗑️  Cleared {result.deleted_count} existing Cyber training records")
 
-        # Look for actual cybersecurity-related articles
-        cyber_keywords = [
-            "security",
-            "vulnerability",
-            "exploit",
-            "malware",
-            "ransomware",
-            "phishing",
-            "breach",
-            "hack",
-            "cyber",
-            "threat",
-            "attack",
-            "penetration",
-            "firewall",
-            "encryption",
-            "authentication",
-            "CVE",
-            "zero-day",
-            "backdoor",
-            "botnet",
-        ]
-
-        # Build query to find cyber-related articles
-        cyber_query = {
-            "processing_status": {"$in": ["processed", "published"]},
-            "llm_analysis": {"$exists": True},
-            "$or": [
-                {"title": {"$regex": "|".join(cyber_keywords), "$options": "i"}},
-                {
-                    "content.content": {
-                        "$regex": "|".join(cyber_keywords[:5]),
-                        "$options": "i",
-                    }
-                },  # Limit regex complexity
-            ],
-        }
-
-        articles = list(mongo_client.feed_items.find(cyber_query).limit(15))
+        articles = list(mongo_client.feed_items.aggregate(CYBER_TRAINING_PIPELINE))
         print(f"📊 Found {len(articles)} cyber-related articles in MongoDB")
 
         if len(articles) < 5:
@@ -104,51 +193,12 @@ def clear_and_setup_cyber_training():
         rationales = []
 
         for article in articles:
-            article_id = article["id"]
             title = article.get("title", "")
-            article.get("llm_analysis", {}).get("relevance_score", 0.5)
-            content = article.get("content", {}).get("content", "")
-            content_length = len(content)
-
-            # More sophisticated scoring for cyber content
-            if (
-                any(keyword in title.lower() for keyword in ["reddit", "submitted by"])
-                or content_length < 200
-            ):
-                # Low quality - Reddit posts or very short content
-                target_score = 0.2
-                rationale = "Low quality cyber content - Reddit post or minimal content"
-            elif any(
-                keyword in title.lower()
-                for keyword in ["vulnerability", "exploit", "cve", "zero-day", "breach"]
-            ):
-                # High quality - actual security research/disclosures
-                target_score = 0.8
-                rationale = "High quality cybersecurity content - vulnerability disclosure or security research"
-            elif any(
-                keyword in title.lower()
-                for keyword in ["tool", "framework", "analysis", "research"]
-            ):
-                # Medium-high quality - security tools/analysis
-                target_score = 0.7
-                rationale = (
-                    "Good quality cybersecurity content - tools, analysis, or research"
-                )
-            elif content_length > 500 and any(
-                keyword in content.lower()
-                for keyword in ["security", "attack", "defense"]
-            ):
-                # Medium quality - substantial security content
-                target_score = 0.6
-                rationale = "Medium quality cybersecurity content with substantial technical details"
-            else:
-                # Low-medium quality
-                target_score = 0.3
-                rationale = "Low-medium quality cyber content - mentions security but lacks depth"
+            target_score = article["target_score"]
 
-            article_ids.append(article_id)
+            article_ids.append(article["id"])
             target_scores.append(target_score)
-            rationales.append(rationale)
+            rationales.append(RATIONALES[target_score])
 
             print(f"   {title[:60]}... -> Target: {target_score}")
 
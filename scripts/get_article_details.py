@@ -16,7 +16,7 @@ def main():
 
     try:
         # Query for the specific article
-        article = client.feed_items.find_one({"id": args.article_id})
+        article = client.get_item(args.article_id)
 
         if article:
             print("Article Details:")
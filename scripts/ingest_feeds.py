@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import os
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+from pymongo.errors import BulkWriteError
 
 from feed_aggregator.fetcher import FeedlyFetcher
 from feed_aggregator.storage.mongodb_client import MongoDBClient
@@ -19,43 +22,56 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--stream-id",
         type=str,
-        help="Feedly stream ID to fetch from (default: user's global.all category)",
+        help=(
+            "Feedly stream ID to fetch from, or several separated by commas "
+            "(default: user's global.all category)"
+        ),
     )
     return parser.parse_args()
 
 
-def get_existing_ids(mongo_client: MongoDBClient) -> set:
-    """Get set of existing feed item IDs from MongoDB."""
-    return {doc["id"] for doc in mongo_client.feed_items.find({}, {"id": 1})}
+def merge_stream_items(streams: List[Dict]) -> List[Dict]:
+    """Combine the items of several streams, keeping the first copy of each."""
+    items = []
+    seen_ids = set()
+    for stream in streams:
+        for item in stream["items"]:
+            item_id = item.get("id")
+            if item_id is not None and item_id in seen_ids:
+                continue
+            seen_ids.add(item_id)
+            items.append(item)
+    return items
+
+
+def get_existing_ids(mongo_client: MongoDBClient, incoming_ids: Iterable[str]) -> set:
+    """Get the subset of incoming feed item IDs already stored in MongoDB."""
+    cursor = mongo_client.feed_items.find(
+        {"id": {"$in": list(incoming_ids)}}, {"_id": 0, "id": 1}
+    )
+    return {doc["id"] for doc in cursor}
 
 
 def normalize_item(item: Dict) -> Dict:
-    """Normalize item data to match MongoDB schema."""
-    # Deep copy to avoid modifying original
-    normalized = item.copy()
+    """Normalize item data to match MongoDB schema.
 
+    The item is updated in place and returned; callers pass items they own.
+    """
     # Set default processing status
-    normalized["processing_status"] = "pending"
+    item["processing_status"] = "pending"
 
-    # Handle leoSummary sentences
-    if "leoSummary" in normalized:
-        if "sentences" in normalized["leoSummary"]:
-            sentences = normalized["leoSummary"]["sentences"]
-            # Convert sentence objects to strings
-            normalized["leoSummary"]["sentences"] = [
-                s["text"] if isinstance(s, dict) else s for s in sentences
-            ]
+    # Convert leoSummary sentence objects to strings. Feedly returns either
+    # all objects or all strings, so the first sentence decides.
+    sentences = item.get("leoSummary", {}).get("sentences")
+    if sentences and isinstance(sentences[0], dict):
+        item["leoSummary"]["sentences"] = [s["text"] for s in sentences]
 
     # Ensure required fields exist
-    required_fields = ["fingerprint", "id", "title", "crawled"]
-    for field in required_fields:
-        if field not in normalized:
-            if field == "fingerprint":
-                normalized["fingerprint"] = normalized.get("id", "")
-            else:
-                normalized[field] = ""
+    item.setdefault("fingerprint", item.get("id", ""))
+    for field in ("id", "title", "crawled"):
+        item.setdefault(field, "")
 
-    return normalized
+    return item
 
 
 def store_new_items(
@@ -64,6 +80,7 @@ def store_new_items(
     """Store new items in MongoDB and return stats."""
     stats = {"new": 0, "skipped": 0, "error": 0}
 
+    new_docs = []
     for item in items:
         try:
             if item["id"] in existing_ids:
@@ -71,16 +88,28 @@ def store_new_items(
                 continue
 
             # Normalize item data
-            normalized = normalize_item(item)
-
-            # Store new item
-            mongo_client.feed_items.insert_one(normalized)
-            stats["new"] += 1
+            new_docs.append(normalize_item(item))
 
         except Exception as e:
             print(f"Error storing item: {str(e)}")
             stats["error"] += 1
-            continue
+
+    if not new_docs:
+        return stats
+
+    # Store new items in one unordered insert so one bad item doesn't stop the rest
+    try:
+        result = mongo_client.feed_items.insert_many(new_docs, ordered=False)
+        stats["new"] += len(result.inserted_ids)
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        for error in write_errors:
+            print(f"Error storing item: {error.get('errmsg')}")
+        stats["new"] += e.details.get("nInserted", 0)
+        stats["error"] += len(write_errors)
+    except Exception as e:
+        print(f"Error storing items: {str(e)}")
+        stats["error"] += len(new_docs)
 
     return stats
 
@@ -93,11 +122,11 @@ def print_summary(stats: Dict[str, int], metrics: Dict[str, int]) -> None:
     print(f"Items with errors: {stats['error']}")
 
     print("\nMongoDB Status:")
-    print(f"Total items: {metrics['total_items']}")
-    print(f"Pending items: {metrics['pending_items']}")
-    print(f"Processed items: {metrics['processed_items']}")
-    print(f"Filtered items: {metrics['filtered_items']}")
-    print(f"Published items: {metrics['published_items']}")
+    print(f"Total items: {metrics['total']}")
+    print(f"Pending items: {metrics['pending']}")
+    print(f"Processed items: {metrics['processed']}")
+    print(f"Filtered items: {metrics['filtered']}")
+    print(f"Published items: {metrics['published']}")
 
 
 def main():
@@ -128,33 +157,24 @@ def main():
     mongo_client = MongoDBClient()
 
     try:
-        # Get existing item IDs
-        existing_ids = get_existing_ids(mongo_client)
-        print(f"\nFound {len(existing_ids)} existing items in MongoDB")
-
-        # Fetch data from Feedly
-        data = fetcher.get_stream_contents(stream_id, count=args.count)
-        print(f"Fetched {len(data['items'])} items from Feedly")
+        # Fetch data from Feedly, all streams at once
+        stream_ids = [s.strip() for s in stream_id.split(",") if s.strip()]
+        items = merge_stream_items(
+            asyncio.run(fetcher.aget_streams_contents(stream_ids, count=args.count))
+        )
+        print(f"Fetched {len(items)} items from {len(stream_ids)} Feedly streams")
+
+        # Get IDs of fetched items that are already stored
+        existing_ids = get_existing_ids(
+            mongo_client, {item["id"] for item in items if "id" in item}
+        )
+        print(f"Found {len(existing_ids)} of them already in MongoDB")
 
         # Store new items and track stats
-        stats = store_new_items(mongo_client, data["items"], existing_ids)
+        stats = store_new_items(mongo_client, items, existing_ids)
 
         # Get metrics
-        metrics = {
-            "total_items": mongo_client.feed_items.count_documents({}),
-            "pending_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "pending"}
-            ),
-            "processed_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "processed"}
-            ),
-            "filtered_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "filtered_out"}
-            ),
-            "published_items": mongo_client.feed_items.count_documents(
-                {"processing_status": "published"}
-            ),
-        }
+        metrics = mongo_client.get_status_counts()
 
         print_summary(stats, metrics)
 
@@ -4,6 +4,19 @@ from datetime import datetime
 
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
+# Fields read by print_item_summary
+SUMMARY_PROJECTION = {
+    "_id": 0,
+    "title": 1,
+    "origin.title": 1,
+    "originId": 1,
+    "published": 1,
+    "crawled": 1,
+    "processing_status": 1,
+    "commonTopics.label": 1,
+    "categories.label": 1,
+}
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -56,8 +69,11 @@ def main():
 
     try:
         # Get recent items sorted by crawl time
+        projection = None if args.full else SUMMARY_PROJECTION
         recent_items = list(
-            mongo_client.feed_items.find().sort("crawled", -1).limit(args.count)
+            mongo_client.feed_items.find(projection=projection)
+            .sort("crawled", -1)
+            .limit(args.count)
         )
 
         if not recent_items:
@@ -1,19 +1,35 @@
 import argparse
+import asyncio
 import os
 
 from feed_aggregator.fetcher import FeedlyFetcher, URLFetcher
 from feed_aggregator.processing.content_analyzer import ContentAnalyzer
+from feed_aggregator.processing.llm_cache import (
+    DEFAULT_CACHE_DIR,
+    DiskBackend,
+    LLMCache,
+)
 from feed_aggregator.processing.llm_filter import LLMFilter
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
+# Processed articles written to MongoDB per bulk write
+STORE_BATCH_SIZE = 50
+
+# Characters of combined content sent to the LLM; longer text mostly adds
+# prompt processing time without changing the relevance score
+MAX_LLM_CONTENT_CHARS = 12_000
+
+ARTICLE_CACHE_DIR = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "articles")
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Process a Feedly article")
     parser.add_argument(
         "url",
+        nargs="+",
         help=(
             "Either a full Feedly URL (https://feedly.com/i/entry/<entry_id>) "
-            "or just the entry ID"
+            "or just the entry ID; several may be given"
         ),
     )
     parser.add_argument(
@@ -30,14 +46,27 @@ def initialize_components(token, user_id, category):
         raise ValueError("FEEDLY_TOKEN environment variable not set")
 
     fetcher = FeedlyFetcher(token=token, user_id=user_id)
+    url_fetcher = URLFetcher()
     content_analyzer = ContentAnalyzer()
     llm_filter = LLMFilter(provider="ollama", category=category)
     mongo_client = MongoDBClient()
 
-    return fetcher, content_analyzer, llm_filter, mongo_client
+    return fetcher, url_fetcher, content_analyzer, llm_filter, mongo_client
+
+
+def create_analysis_cache():
+    """Create the article analysis cache if LLM_CACHE_TTL is set.
+
+    LLMFilter only caches deterministic requests, so reposts of the same
+    article would otherwise be sent to the model again on every run.
+    """
+    cache_ttl = os.environ.get("LLM_CACHE_TTL")
+    if not cache_ttl:
+        return None
+    return LLMCache(DiskBackend(ARTICLE_CACHE_DIR, ttl=float(cache_ttl)))
 
 
-def fetch_url_content(article):
+def fetch_url_content(article, url_fetcher):
     """Fetch content from article URL if available."""
     if "alternate" not in article or not article["alternate"]:
         return None
@@ -51,9 +80,7 @@ def fetch_url_content(article):
         return None
 
     try:
-        url_fetcher = URLFetcher()
         url_content = url_fetcher.fetch_url_content(url)
-        url_fetcher.close()
 
         if url_content:
             print("\nURL Content Fetched:")
@@ -67,20 +94,30 @@ def fetch_url_content(article):
         return None
 
 
-def combine_content(article, url_content):
-    """Combine Feedly content with URL content."""
-    feedly_content = article.get("content", {}).get(
-        "content", article.get("summary", {}).get("content", "")
-    )
+def combine_content(article, url_content, max_chars=None):
+    """Combine Feedly content with URL content.
+
+    With max_chars, the page's main content is trimmed to half of the budget
+    and its description to a quarter, and the Feedly content gets the rest.
+    """
+    feedly_content = (article.get("content") or {}).get("content") or (
+        article.get("summary") or {}
+    ).get("content", "")
+    main_content = (url_content or {}).get("main_content") or ""
+    description = (url_content or {}).get("description") or ""
 
-    if not url_content:
-        return feedly_content
+    if max_chars is not None:
+        main_content = main_content[: max_chars // 2]
+        description = description[: max_chars // 4]
+        feedly_content = feedly_content[
+            : max_chars - len(main_content) - len(description)
+        ]
 
     combined = feedly_content
-    if url_content.get("main_content"):
-        combined = f"{combined}\n\n{url_content['main_content']}"
-    if url_content.get("description"):
-        combined = f"{combined}\n\n{url_content['description']}"
+    if main_content:
+        combined = f"{combined}\n\n{main_content}"
+    if description:
+        combined = f"{combined}\n\n{description}"
 
     return combined
 
@@ -103,15 +140,35 @@ def run_content_analysis(analyzer, content):
     return analysis
 
 
-def run_llm_analysis(analyzer, article, combined_content, url_content):
-    """Run LLM analysis and print results."""
-    analysis = analyzer.analyze_item(
-        {
-            "title": article.get("title", ""),
-            "content": combined_content,
-            "url_content_available": bool(url_content),
-        }
-    )
+async def run_llm_analysis(
+    analyzer, article, combined_content, url_content, cache=None, client=None
+):
+    """Run LLM analysis, reusing a cached result for identical content."""
+    item = {
+        "title": article.get("title", ""),
+        "content": combined_content,
+        "url_content_available": bool(url_content),
+    }
+    key = None
+    analysis = None
+    if cache is not None:
+        key = cache.make_key(
+            {
+                "provider": analyzer.provider,
+                "prompts": [
+                    analyzer.config["system_prompt"],
+                    analyzer.config["user_prompt"],
+                ],
+                "title": item["title"],
+                "content": item["content"],
+            }
+        )
+        analysis = cache.get(key)
+
+    if analysis is None:
+        analysis = await analyzer.aanalyze_item(item, client)
+        if key is not None:
+            cache.set(key, analysis)
 
     print("\nLLM Analysis Results:")
     print(f"Relevance score: {analysis['relevance_score']}")
@@ -123,22 +180,119 @@ def run_llm_analysis(analyzer, article, combined_content, url_content):
     return analysis
 
 
-def store_article(mongo_client, article, category, content_analysis, llm_analysis):
-    """Store processed article in MongoDB."""
+async def run_analyses(
+    content_analyzer,
+    llm_filter,
+    article,
+    combined_content,
+    llm_content,
+    url_content,
+    cache=None,
+    client=None,
+):
+    """Run content analysis in a thread while the LLM request is in flight."""
+    return await asyncio.gather(
+        asyncio.to_thread(run_content_analysis, content_analyzer, combined_content),
+        run_llm_analysis(llm_filter, article, llm_content, url_content, cache, client),
+    )
+
+
+def store_article(buffer, article, category, content_analysis, llm_analysis):
+    """Queue a processed article for the next bulk write."""
+    buffer.append(
+        {
+            **article,
+            "category": category,
+            "content_analysis": content_analysis,
+            "llm_analysis": llm_analysis,
+            "processing_status": "processed",
+        }
+    )
+
+
+def flush_articles(mongo_client, buffer):
+    """Store queued articles in MongoDB with one bulk write."""
+    if not buffer:
+        return
+
     try:
-        article["category"] = category
-        article["content_analysis"] = content_analysis
-        article["llm_analysis"] = llm_analysis
-        article["processing_status"] = "processed"
-
-        mongo_client.store_feed_items([article])
-        print(f"\nArticle stored in MongoDB with ID: {article['id']}")
-        print(
-            "To view details, run: python scripts/get_article_details.py",
-            article["id"],
-        )
+        mongo_client.store_feed_items(buffer)
+        for article in buffer:
+            print(f"\nArticle stored in MongoDB with ID: {article['id']}")
+            print(
+                "To view details, run: python scripts/get_article_details.py",
+                article["id"],
+            )
     except Exception as e:
-        print(f"Error storing article in MongoDB: {e}")
+        print(f"Error storing articles in MongoDB: {e}")
+    finally:
+        buffer.clear()
+
+
+async def process_article(
+    fetcher,
+    url_fetcher,
+    content_analyzer,
+    llm_filter,
+    url,
+    category,
+    buffer,
+    cache=None,
+    llm_client=None,
+):
+    """Fetch, analyze and queue a single article."""
+    article = fetcher.get_entry_by_url(url)
+    print(f"Successfully fetched article: {article.get('title', 'No title')}")
+
+    # Fetch and process URL content
+    url_content = fetch_url_content(article, url_fetcher)
+    if url_content:
+        article["url_content"] = url_content
+
+    # Combine and analyze content; statistics use the full text
+    combined_content = combine_content(article, url_content)
+    llm_content = combine_content(article, url_content, MAX_LLM_CONTENT_CHARS)
+    content_analysis, llm_analysis = await run_analyses(
+        content_analyzer,
+        llm_filter,
+        article,
+        combined_content,
+        llm_content,
+        url_content,
+        cache,
+        llm_client,
+    )
+
+    store_article(buffer, article, category, content_analysis, llm_analysis)
+
+
+async def process_articles(
+    urls,
+    fetcher,
+    url_fetcher,
+    content_analyzer,
+    llm_filter,
+    mongo_client,
+    category,
+    buffer,
+    cache=None,
+):
+    """Process articles in order, sharing one LLM client across them."""
+    async with llm_filter.async_client() as llm_client:
+        for url in urls:
+            await process_article(
+                fetcher,
+                url_fetcher,
+                content_analyzer,
+                llm_filter,
+                url,
+                category,
+                buffer,
+                cache,
+                llm_client,
+            )
+            if len(buffer) >= STORE_BATCH_SIZE:
+                flush_articles(mongo_client, buffer)
 
 
 def main():
@@ -147,35 +301,37 @@ def main():
     user_id = os.environ.get("FEEDLY_USER")
 
     # Initialize components
-    fetcher, content_analyzer, llm_filter, mongo_client = initialize_components(
-        token, user_id, args.category
-    )
-
+    (
+        fetcher,
+        url_fetcher,
+        content_analyzer,
+        llm_filter,
+        mongo_client,
+    ) = initialize_components(token, user_id, args.category)
+
+    cache = create_analysis_cache()
+    buffer = []
     try:
-        # Fetch article
-        article = fetcher.get_entry_by_url(args.url)
-        print(f"Successfully fetched article: {article.get('title', 'No title')}")
-
-        # Fetch and process URL content
-        url_content = fetch_url_content(article)
-        if url_content:
-            article["url_content"] = url_content
-
-        # Combine and analyze content
-        combined_content = combine_content(article, url_content)
-        content_analysis = run_content_analysis(content_analyzer, combined_content)
-        llm_analysis = run_llm_analysis(
-            llm_filter, article, combined_content, url_content
-        )
-
-        # Store results
-        store_article(
-            mongo_client, article, args.category, content_analysis, llm_analysis
+        asyncio.run(
+            process_articles(
+                args.url,
+                fetcher,
+                url_fetcher,
+                content_analyzer,
+                llm_filter,
+                mongo_client,
+                args.category,
+                buffer,
+                cache,
+            )
         )
 
     # except Exception as e:
     #   print(f"Error processing article: {e}")
     finally:
+        # Store whatever was processed, even if a later article failed
+        flush_articles(mongo_client, buffer)
+        url_fetcher.close()
         mongo_client.close()
 
 
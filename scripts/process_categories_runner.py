@@ -2,41 +2,91 @@
 """Runner script for processing multiple categories in the ETL pipeline."""
 
 import argparse
+import asyncio
+import functools
+import itertools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from feed_aggregator.config.category_config import CategoryConfig
 from feed_aggregator.etl.process_category import git_commit_and_push, main
 from feed_aggregator.etl.update_feed import main as update_feed_main
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
+# Fields the reconcile report reads from each processed article
+RECONCILE_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "title": 1,
+    "llm_analysis.relevance_score": 1,
+}
 
-def process_single_category(category_key: str) -> bool:
+# Usage examples shown after the --help options
+EPILOG = """
+Examples:
+  # Process a specific category
+  python process_categories_runner.py ML
+
+  # Process multiple specific categories
+  python process_categories_runner.py ML Tech Cyber
+
+  # Process all configured categories
+  python process_categories_runner.py --all
+
+  # List available categories
+  python process_categories_runner.py --list
+
+  # Reconcile yesterday's processed articles against XML feed
+  python process_categories_runner.py --reconcile
+"""
+
+# Documents fetched per round trip while scanning for reconciliation
+RECONCILE_BATCH_SIZE = 500
+
+# Rule printed above and below banner titles
+BAR = "=" * 60
+
+
+def _print_banner(title: str, *lines: str, footer: bool = False) -> None:
+    """Print a titled banner and any following lines in a single write."""
+    parts = ["", BAR, title, BAR, *lines]
+    if footer:
+        parts.append(BAR)
+    print("\n".join(parts))
+
+
+@functools.lru_cache(maxsize=1)
+def _category_config() -> CategoryConfig:
+    """Load the category configuration once per process."""
+    return CategoryConfig()
+
+
+def process_single_category(
+    category_key: str, max_concurrency: Optional[int] = None
+) -> bool:
     """Process a single category.
 
     Args:
         category_key: Category to process
+        max_concurrency: LLM requests the category may have in flight,
+            defaults to OLLAMA_NUM_PARALLEL
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"PROCESSING CATEGORY: {category_key}")
-        print(f"{'='*60}")
+        _print_banner(f"PROCESSING CATEGORY: {category_key}")
 
-        main(category_key)
+        main(category_key, max_concurrency)
 
-        print(f"\n{'='*60}")
-        print(f"COMPLETED CATEGORY: {category_key}")
-        print(f"{'='*60}")
+        _print_banner(f"COMPLETED CATEGORY: {category_key}")
 
         return True
     except Exception as e:
-        print(f"\n{'='*60}")
-        print(f"ERROR PROCESSING CATEGORY: {category_key}")
-        print(f"Error: {e}")
-        print(f"{'='*60}")
+        print(f"\n{BAR}\nERROR PROCESSING CATEGORY: {category_key}\nError: {e}\n{BAR}")
         return False
 
 
@@ -48,7 +98,7 @@ def process_all_categories() -> None:
             process_pending_articles_round_robin,
         )
 
-        category_config = CategoryConfig()
+        category_config = _category_config()
         all_categories = category_config.get_all_categories()
 
         print(f"Processing all categories: {all_categories}")
@@ -57,43 +107,47 @@ def process_all_categories() -> None:
         )
 
         # Phase 1: Fetch articles from all categories
-        print(f"\n{'='*60}")
-        print("PHASE 1: FETCHING ARTICLES FROM ALL CATEGORIES")
-        print(f"{'='*60}")
+        _print_banner("PHASE 1: FETCHING ARTICLES FROM ALL CATEGORIES")
 
         total_fetched = 0
         fetch_failures = 0
 
-        for category in all_categories:
-            try:
-                fetched_count = fetch_category_articles(category, category_config)
-                total_fetched += fetched_count
-                print(f"✓ {category}: {fetched_count} new articles")
-            except Exception as e:
-                print(f"✗ {category}: Failed to fetch articles - {e}")
-                fetch_failures += 1
+        # Fetches are independent Feedly round trips, so overlap them
+        workers = max(1, min(16, len(all_categories)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch_category_articles, c, category_config): c
+                for c in all_categories
+            }
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    fetched_count = future.result()
+                    total_fetched += fetched_count
+                    print(f"✓ {category}: {fetched_count} new articles")
+                except Exception as e:
+                    print(f"✗ {category}: Failed to fetch articles - {e}")
+                    fetch_failures += 1
 
         print("\nFetch Summary:")
         print(f"Total new articles fetched: {total_fetched}")
         print(f"Categories with fetch failures: {fetch_failures}")
 
         # Phase 2: Process pending articles in round-robin fashion
-        print(f"\n{'='*60}")
-        print("PHASE 2: PROCESSING ARTICLES (ROUND-ROBIN)")
-        print(f"{'='*60}")
+        _print_banner("PHASE 2: PROCESSING ARTICLES (ROUND-ROBIN)")
 
         if total_fetched > 0:
             process_pending_articles_round_robin(all_categories, category_config)
         else:
             print("No new articles to process.")
 
-        print(f"\n{'='*60}")
-        print("FINAL SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total categories: {len(all_categories)}")
-        print(f"Articles fetched: {total_fetched}")
-        print(f"Fetch failures: {fetch_failures}")
-        print(f"{'='*60}")
+        _print_banner(
+            "FINAL SUMMARY",
+            f"Total categories: {len(all_categories)}",
+            f"Articles fetched: {total_fetched}",
+            f"Fetch failures: {fetch_failures}",
+            footer=True,
+        )
 
         if fetch_failures == len(all_categories):
             print("All categories failed to fetch articles!")
@@ -107,7 +161,7 @@ def process_all_categories() -> None:
 def handle_list_categories():
     """Handle the --list option."""
     try:
-        category_config = CategoryConfig()
+        category_config = _category_config()
         categories = category_config.get_all_categories()
         print("Available categories:")
         for category in categories:
@@ -121,37 +175,64 @@ def handle_list_categories():
 def validate_categories(categories):
     """Validate that specified categories exist."""
     try:
-        category_config = CategoryConfig()
-        available_categories = category_config.get_all_categories()
-
-        for category in categories:
-            if category not in available_categories:
-                print(f"Error: Category '{category}' not found.")
-                print(f"Available categories: {available_categories}")
-                sys.exit(1)
+        available_categories = _category_config().get_all_categories()
     except Exception as e:
         print(f"Error loading category configuration: {e}")
         sys.exit(1)
 
+    available = set(available_categories)
+    invalid = [category for category in categories if category not in available]
+    if invalid:
+        # Report every unknown category at once, not just the first
+        for category in invalid:
+            print(f"Error: Category '{category}' not found.")
+        print(f"Available categories: {available_categories}")
+        sys.exit(1)
 
-def process_specific_categories(categories):
-    """Process a list of specific categories."""
-    success_count = 0
-    failure_count = 0
 
-    for category in categories:
-        if process_single_category(category):
-            success_count += 1
-        else:
-            failure_count += 1
+async def _process_single_category_async(
+    category_key: str, semaphore: asyncio.Semaphore, max_concurrency: int
+) -> bool:
+    """Process a category in a worker thread once the semaphore allows."""
+    async with semaphore:
+        return await asyncio.to_thread(
+            process_single_category, category_key, max_concurrency
+        )
+
 
-    print(f"\n{'='*60}")
-    print("FINAL SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total categories processed: {len(categories)}")
-    print(f"Successful: {success_count}")
-    print(f"Failed: {failure_count}")
-    print(f"{'='*60}")
+async def _process_categories_concurrently(categories) -> list:
+    """Process categories concurrently within one OLLAMA_NUM_PARALLEL budget.
+
+    Categories spend most of their time waiting on the LLM, so overlapping
+    them shortens the run when the server handles parallel requests. The
+    budget is split between the categories running at once, so the total
+    number of LLM requests in flight stays within OLLAMA_NUM_PARALLEL.
+    """
+    budget = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
+    workers = max(1, min(budget, len(categories)))
+    per_category = max(1, budget // workers)
+    semaphore = asyncio.Semaphore(workers)
+    return await asyncio.gather(
+        *(
+            _process_single_category_async(c, semaphore, per_category)
+            for c in categories
+        )
+    )
+
+
+def process_specific_categories(categories):
+    """Process a list of specific categories."""
+    results = asyncio.run(_process_categories_concurrently(categories))
+    success_count = sum(results)
+    failure_count = len(results) - success_count
+
+    _print_banner(
+        "FINAL SUMMARY",
+        f"Total categories processed: {len(categories)}",
+        f"Successful: {success_count}",
+        f"Failed: {failure_count}",
+        footer=True,
+    )
 
     if failure_count > 0:
         sys.exit(1)
@@ -160,48 +241,46 @@ def process_specific_categories(categories):
 def _get_processed_articles(
     mongo_client, yesterday_start_ms, yesterday_end_ms, min_score
 ):
-    """Get processed articles from the last 24 hours."""
-    return list(
-        mongo_client.feed_items.find(
+    """Yield processed articles from the last 24 hours.
+
+    An article qualifies if it was published or crawled in the window. The
+    two windows are queried separately so each is a single range scan on
+    its own index, and articles matching both are yielded once. Results are
+    streamed from the cursors rather than loaded up front.
+    """
+    window = {"$gte": yesterday_start_ms, "$lt": yesterday_end_ms}
+    seen_ids = set()
+    for time_field in ("published", "crawled"):
+        cursor = mongo_client.feed_items.find(
             {
                 "processing_status": {"$in": ["processed", "published"]},
                 "llm_analysis.relevance_score": {"$gte": min_score},
-                "$or": [
-                    {
-                        "published": {
-                            "$gte": yesterday_start_ms,
-                            "$lt": yesterday_end_ms,
-                        }
-                    },
-                    {
-                        "crawled": {
-                            "$gte": yesterday_start_ms,
-                            "$lt": yesterday_end_ms,
-                        }
-                    },
-                ],
-            }
+                time_field: window,
+            },
+            RECONCILE_PROJECTION,
+            batch_size=RECONCILE_BATCH_SIZE,
         )
-    )
+        for article in cursor:
+            if article["id"] not in seen_ids:
+                seen_ids.add(article["id"])
+                yield article
 
 
 def _get_xml_article_ids():
     """Get article IDs from existing XML feed."""
-    import os
-
     from defusedxml import ElementTree as DefusedET
 
     xml_article_ids = set()
     if os.path.exists("feed.xml"):
         try:
-            tree = DefusedET.parse("feed.xml")
-            root = tree.getroot()
-            channel = root.find("channel")
-
-            for item in channel.findall("item"):
-                guid_elem = item.find("guid")
+            # Stream the feed and drop each item once its guid is read
+            for _, elem in DefusedET.iterparse("feed.xml", events=("end",)):
+                if elem.tag != "item":
+                    continue
+                guid_elem = elem.find("guid")
                 if guid_elem is not None and guid_elem.text:
                     xml_article_ids.add(guid_elem.text)
+                elem.clear()
 
             print(f"Found {len(xml_article_ids)} articles already in XML feed")
         except Exception as e:
@@ -213,21 +292,37 @@ def _get_xml_article_ids():
 
 
 def _find_missing_articles(processed_articles, xml_article_ids):
-    """Find articles that are processed but not in XML."""
+    """Find articles that are processed but not in XML in a single pass.
+
+    Returns:
+        Tuple of the number of processed articles, the first few of them as
+        a sample, and the articles missing from the XML feed
+    """
+    processed_count = 0
+    sample_articles = []
     missing_articles = []
     for article in processed_articles:
+        processed_count += 1
+        if len(sample_articles) < 3:
+            sample_articles.append(article)
         if article["id"] not in xml_article_ids:
             missing_articles.append(article)
-            title = article.get("title", "No title")[:50]
-            article_id = article["id"][:20]
-            print(f"  Missing: {title}... (ID: {article_id}...)")
-    return missing_articles
+    return processed_count, sample_articles, missing_articles
+
+
+def _format_missing_articles(missing_articles):
+    """Format the report lines for articles missing from the XML feed."""
+    return "\n".join(
+        f"  Missing: {article.get('title', 'No title')[:50]}... "
+        f"(ID: {article['id'][:20]}...)"
+        for article in missing_articles
+    )
 
 
-def _show_sample_articles(processed_articles, xml_article_ids):
+def _show_sample_articles(sample_articles, xml_article_ids):
     """Show sample articles that were checked."""
     print("\nSample of processed articles checked:")
-    for _i, article in enumerate(processed_articles[:3]):
+    for article in sample_articles:
         in_xml = "✓" if article["id"] in xml_article_ids else "✗"
         score = article.get("llm_analysis", {}).get("relevance_score", "N/A")
         title = article.get("title", "No title")[:50]
@@ -237,9 +332,7 @@ def _show_sample_articles(processed_articles, xml_article_ids):
 def reconcile_processed_articles():
     """Reconcile last day's processed articles against XML feed and add missing ones."""
     try:
-        print(f"\n{'='*60}")
-        print("RECONCILING PROCESSED ARTICLES AGAINST XML FEED")
-        print(f"{'='*60}")
+        _print_banner("RECONCILING PROCESSED ARTICLES AGAINST XML FEED")
 
         # Calculate last 24 hours ending now
         now = datetime.now(timezone.utc)
@@ -255,7 +348,7 @@ def reconcile_processed_articles():
 
         try:
             # Get configuration
-            category_config = CategoryConfig()
+            category_config = _category_config()
             global_config = category_config.get_global_config()
             min_score = global_config.get("default_quality_threshold", 0.6)
 
@@ -263,16 +356,14 @@ def reconcile_processed_articles():
             yesterday_start_ms = int(yesterday_start.timestamp() * 1000)
             yesterday_end_ms = int(yesterday_end.timestamp() * 1000)
 
-            # Get processed articles
             processed_articles = _get_processed_articles(
                 mongo_client, yesterday_start_ms, yesterday_end_ms, min_score
             )
 
-            print(
-                f"Found {len(processed_articles)} high-quality processed articles from yesterday"
-            )
-
-            if not processed_articles:
+            # Only read the XML feed once there is something to check
+            first_article = next(processed_articles, None)
+            if first_article is None:
+                print("Found 0 high-quality processed articles from yesterday")
                 print(
                     "No processed articles found from yesterday. Nothing to reconcile."
                 )
@@ -281,16 +372,24 @@ def reconcile_processed_articles():
             # Get XML article IDs
             xml_article_ids = _get_xml_article_ids()
 
-            # Find missing articles
-            missing_articles = _find_missing_articles(
-                processed_articles, xml_article_ids
+            # Stream processed articles once, collecting the missing ones
+            processed_count, sample_articles, missing_articles = _find_missing_articles(
+                itertools.chain([first_article], processed_articles),
+                xml_article_ids,
+            )
+
+            print(
+                f"Found {processed_count} high-quality processed articles from yesterday"
             )
             print(
                 f"Found {len(missing_articles)} processed articles missing from XML feed"
             )
+            if missing_articles:
+                # One write for the whole report instead of one per article
+                print(_format_missing_articles(missing_articles))
 
             # Show sample articles
-            _show_sample_articles(processed_articles, xml_article_ids)
+            _show_sample_articles(sample_articles, xml_article_ids)
 
             if missing_articles:
                 # Mark missing articles as ready for publishing
@@ -311,11 +410,11 @@ def reconcile_processed_articles():
                 print("Committing and pushing changes...")
                 git_commit_and_push()
 
-                print(f"\n{'='*60}")
-                print("RECONCILIATION COMPLETED SUCCESSFULLY")
-                print(f"{'='*60}")
-                print(f"Articles reconciled: {len(missing_articles)}")
-                print("Feed updated and pushed to repository")
+                _print_banner(
+                    "RECONCILIATION COMPLETED SUCCESSFULLY",
+                    f"Articles reconciled: {len(missing_articles)}",
+                    "Feed updated and pushed to repository",
+                )
             else:
                 print(
                     "All processed articles are already in the XML feed. No reconciliation needed."
@@ -329,28 +428,13 @@ def reconcile_processed_articles():
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
 def create_argument_parser():
-    """Create and configure the argument parser."""
+    """Create and configure the argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="Process feed categories",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Process a specific category
-  python process_categories_runner.py ML
-
-  # Process multiple specific categories
-  python process_categories_runner.py ML Tech Cyber
-
-  # Process all configured categories
-  python process_categories_runner.py --all
-
-  # List available categories
-  python process_categories_runner.py --list
-
-  # Reconcile yesterday's processed articles against XML feed
-  python process_categories_runner.py --reconcile
-        """,
+        epilog=EPILOG,
     )
 
     parser.add_argument(
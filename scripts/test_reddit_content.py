@@ -1,8 +1,36 @@
 #!/usr/bin/env python3
 """Test LLM analysis on Reddit-style content."""
 
+import asyncio
+
 from feed_aggregator.processing.llm_filter import LLMFilter
 
+CATEGORIES = ("Tech", "Cyber")
+
+
+async def analyze_categories(item):
+    """Analyze an item with each category's prompts concurrently."""
+    llm_filters = [
+        LLMFilter(provider="ollama", category=category) for category in CATEGORIES
+    ]
+    # Both filters use Ollama, so they share one client
+    async with llm_filters[0].async_client() as client:
+        return await asyncio.gather(
+            *(llm_filter.aanalyze_item(item, client) for llm_filter in llm_filters)
+        )
+
+
+def print_result(category, result):
+    """Print one category's analysis."""
+    print(f"=== {category} Category Analysis ===")
+    print(f"Relevance Score: {result['relevance_score']}")
+    print(f"Summary: {result['summary']}")
+    print(f"Key Topics: {result['key_topics']}")
+    if result.get("filtered_reason"):
+        print(f"Filtered Reason: {result['filtered_reason']}")
+    print(f"Prompt Version: {result['_analysis_metadata']['prompt_version']}")
+    print(f"Category: {result['_analysis_metadata']['category']}")
+
 
 def main():
     # Simulate the content that was published (Reddit post with link)
@@ -24,32 +52,12 @@ def main():
     print(f"Content: {reddit_content['content']}")
     print()
 
-    # Test with Tech category
-    print("=== Tech Category Analysis ===")
-    llm_filter_tech = LLMFilter(provider="ollama", category="Tech")
-    result_tech = llm_filter_tech.analyze_item(reddit_content)
-
-    print(f"Relevance Score: {result_tech['relevance_score']}")
-    print(f"Summary: {result_tech['summary']}")
-    print(f"Key Topics: {result_tech['key_topics']}")
-    if result_tech.get("filtered_reason"):
-        print(f"Filtered Reason: {result_tech['filtered_reason']}")
-    print(f"Prompt Version: {result_tech['_analysis_metadata']['prompt_version']}")
-    print(f"Category: {result_tech['_analysis_metadata']['category']}")
-    print()
+    # Both categories run against the model at the same time
+    result_tech, result_cyber = asyncio.run(analyze_categories(reddit_content))
 
-    # Test with Cyber category
-    print("=== Cyber Category Analysis ===")
-    llm_filter_cyber = LLMFilter(provider="ollama", category="Cyber")
-    result_cyber = llm_filter_cyber.analyze_item(reddit_content)
-
-    print(f"Relevance Score: {result_cyber['relevance_score']}")
-    print(f"Summary: {result_cyber['summary']}")
-    print(f"Key Topics: {result_cyber['key_topics']}")
-    if result_cyber.get("filtered_reason"):
-        print(f"Filtered Reason: {result_cyber['filtered_reason']}")
-    print(f"Prompt Version: {result_cyber['_analysis_metadata']['prompt_version']}")
-    print(f"Category: {result_cyber['_analysis_metadata']['category']}")
+    print_result("Tech", result_tech)
+    print()
+    print_result("Cyber", result_cyber)
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ Usage examples:
 
 import argparse
 import logging
+import os
 import sys
 
 from feed_aggregator.processing.prompt_tuner import PromptTuner
@@ -59,7 +60,7 @@ def add_training_data(args):
 
 def run_tuning(args):
     """Run prompt tuning experiment."""
-    tuner = PromptTuner(args.category, args.provider)
+    tuner = PromptTuner(args.category, args.provider, concurrency=args.concurrency)
 
     try:
         # Check if we have enough training data
@@ -73,7 +74,8 @@ def run_tuning(args):
         print(f"📊 Training data: {len(training_data)} examples")
         print(
             f"⚙️  Parameters: {args.iterations} iterations, "
-            f"{args.population} population size"
+            f"{args.population} population size, "
+            f"{args.concurrency} concurrent requests"
         )
         print()
 
@@ -136,7 +138,7 @@ def list_training_data(args):
     tuner = PromptTuner(args.category, args.provider)
 
     try:
-        training_data = tuner.get_training_data()
+        training_data = tuner.get_training_data(fields=None)
 
         print(f"📊 Training data for {args.category}: {len(training_data)} examples")
         print()
@@ -187,6 +189,13 @@ def main():
     tune_parser.add_argument(
         "--population", type=int, default=6, help="Population size per iteration"
     )
+    tune_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")),
+        help="Maximum LLM requests in flight while evaluating candidates "
+        "(default: OLLAMA_NUM_PARALLEL or 4)",
+    )
 
     # Apply prompt command
     apply_parser = subparsers.add_parser("apply", help="Apply tuned prompt")
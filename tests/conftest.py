@@ -1,10 +1,34 @@
 """Pytest configuration."""
+import functools
 import os
 from typing import Generator
 
+import mongomock.collection
 import pytest
 
 
+def _ignore_sort(method):
+    """Drop the sort argument pymongo 4.11+ passes to bulk builders.
+
+    mongomock's BulkOperationBuilder predates it, so bulk_write with
+    UpdateOne or ReplaceOne fails under mongomock without this.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, sort=None, **kwargs):
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in ("add_update", "add_replace"):
+    setattr(
+        mongomock.collection.BulkOperationBuilder,
+        _name,
+        _ignore_sort(getattr(mongomock.collection.BulkOperationBuilder, _name)),
+    )
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
-from feed_aggregator.processing.content_analyzer import ContentAnalyzer
+from feed_aggregator.processing.content_analyzer import (
+    ContentAnalyzer,
+    _ensure_nltk_data,
+)
 
 
 @pytest.fixture
@@ -205,3 +210,43 @@ def test_batch_analyze():
     assert all("keywords" in r for r in results)
     assert all("readability" in r for r in results)
     assert all("word_count" in r for r in results)
+
+
+@pytest.mark.unit
+def test_extract_chunks():
+    """Test single-pass chunking of POS-tagged tokens."""
+    pos_tags = [
+        ("PyTorch", "NNP"),
+        ("2.0", "CD"),
+        ("for", "IN"),
+        ("deep", "JJ"),
+        ("learning", "NN"),
+        ("models", "NNS"),
+        ("in", "IN"),
+        ("3", "CD"),
+        ("weeks", "NNS"),
+    ]
+
+    chunks = ContentAnalyzer._extract_chunks(pos_tags)
+
+    assert chunks == [
+        ("TECH_TERM", [("PyTorch", "NNP")]),
+        ("VERSION", [("2.0", "CD"), ("for", "IN")]),
+        ("TECH_TERM", [("learning", "NN"), ("models", "NNS")]),
+        ("VERSION", [("3", "CD"), ("weeks", "NNS")]),
+    ]
+
+
+@pytest.mark.unit
+def test_nltk_data_checked_once():
+    """Test that NLTK data availability is only probed once per process."""
+    _ensure_nltk_data.cache_clear()
+    try:
+        with patch("feed_aggregator.processing.content_analyzer.nltk") as mock_nltk:
+            _ensure_nltk_data()
+            _ensure_nltk_data()
+
+        assert mock_nltk.data.find.call_count == 5
+        mock_nltk.download.assert_not_called()
+    finally:
+        _ensure_nltk_data.cache_clear()
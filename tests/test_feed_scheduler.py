@@ -1,7 +1,10 @@
 from unittest.mock import MagicMock, patch
 
+import mongomock
 import pytest
+from pymongo.errors import BulkWriteError
 
+from feed_aggregator.ingestion.data_normalizer import DataNormalizer
 from feed_aggregator.ingestion.feed_scheduler import FeedScheduler
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
@@ -47,6 +50,34 @@ def scheduler(mock_mongodb, mock_feedly):
         return scheduler
 
 
+@pytest.fixture
+def stored_scheduler(mock_feedly, monkeypatch):
+    """Create FeedScheduler storing into a mongomock-backed MongoDBClient."""
+    for key, value in {
+        "MONGODB_HOST": "testhost",
+        "MONGODB_USERNAME": "testuser",
+        "MONGODB_PASSWORD": "testpass",
+        "MONGODB_DATABASE": "testdb",
+    }.items():
+        monkeypatch.setenv(key, value)
+    MongoDBClient._indexed_databases.clear()
+
+    def normalize(item, source):
+        # store_feed_items upserts on the Feedly id
+        return {**DataNormalizer().normalize(item, source), "id": item["id"]}
+
+    with mongomock.MongoClient() as client, patch(
+        "feed_aggregator.storage.mongodb_client.MongoClient", return_value=client
+    ), patch(
+        "feed_aggregator.ingestion.feed_scheduler.FeedlyFetcher",
+        return_value=mock_feedly,
+    ):
+        scheduler = FeedScheduler(mongodb_client=MongoDBClient())
+        scheduler.normalizer = MagicMock(normalize=MagicMock(side_effect=normalize))
+        yield scheduler
+        scheduler.close()
+
+
 def test_fetch_and_store_feedly(scheduler, mock_feedly, mock_mongodb):
     """Test fetching from Feedly and storing in MongoDB."""
     result = scheduler.fetch_and_store()
@@ -59,7 +90,7 @@ def test_fetch_and_store_feedly(scheduler, mock_feedly, mock_mongodb):
 
     # Verify items were normalized and stored
     mock_mongodb.store_feed_items.assert_called_once()
-    stored_items = mock_mongodb.store_feed_items.call_args[0][0]
+    stored_items = list(mock_mongodb.store_feed_items.call_args[0][0])
     assert len(stored_items) == 2
     assert all(item["source"] == "feedly" for item in stored_items)
     assert all("_id" in item for item in stored_items)
@@ -74,6 +105,49 @@ def test_fetch_and_store_feedly(scheduler, mock_feedly, mock_mongodb):
     assert result == 2
 
 
+def test_fetch_and_store_skips_seen_items(stored_scheduler):
+    """Test that items stored by an earlier fetch are not normalized again."""
+    assert stored_scheduler.fetch_and_store() == 2
+    assert stored_scheduler.fetch_and_store() == 0
+
+    assert stored_scheduler.normalizer.normalize.call_count == 2
+
+
+def test_fetch_and_store_retries_failed_items(stored_scheduler):
+    """Test that items whose write failed are not remembered as seen."""
+    error = BulkWriteError(
+        {
+            "nUpserted": 1,
+            "nModified": 0,
+            "writeErrors": [{"index": 1, "errmsg": "bad", "op": {"q": {"id": "2"}}}],
+        }
+    )
+    feed_items = stored_scheduler.mongodb.feed_items
+    with patch.object(feed_items, "bulk_write", side_effect=error):
+        stored_scheduler.fetch_and_store()
+    with patch.object(feed_items, "bulk_write", side_effect=Exception("down")):
+        stored_scheduler.fetch_and_store()
+
+    assert stored_scheduler.fetch_and_store() == 1
+    normalized = [
+        c[0][0]["id"] for c in stored_scheduler.normalizer.normalize.call_args_list
+    ]
+    assert normalized == ["1", "2", "2", "2"]
+
+
+def test_seen_cache_is_bounded(scheduler):
+    """Test that the seen-item cache evicts the oldest entries."""
+    scheduler.SEEN_CACHE_SIZE = 2
+    items = [{"id": str(i), "title": title} for i, title in enumerate("ABC", 1)]
+
+    assert all(scheduler._is_new(item) for item in items)
+    scheduler._remember(scheduler._item_key(item) for item in items)
+
+    assert len(scheduler._seen) == 2
+    assert scheduler._is_new(items[0])
+    assert not scheduler._is_new(items[2])
+
+
 def test_fetch_and_store_with_error(scheduler, mock_feedly, mock_mongodb):
     """Test handling of fetch errors."""
     # Make fetcher raise an exception
@@ -1,7 +1,9 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock, patch
 
 from feed_aggregator.fetcher import FeedlyFetcher
+from feed_aggregator.processing.llm_cache import MemoryBackend
 
 
 class TestFeedlyFetcher(unittest.TestCase):
@@ -35,6 +37,52 @@ class TestFeedlyFetcher(unittest.TestCase):
         # Verify that get() was called with the first available category
         mock_categories.get.assert_called_once_with("Culture")
 
+    def test_session_pools_feedly_connections(self):
+        """Test that the Feedly host gets a pooled keep-alive adapter."""
+        fetcher = FeedlyFetcher(token="test-token", user_id="test-user")
+        adapter = fetcher.session.session.get_adapter("https://feedly.com/v3/streams")
+
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 1)
+
+        fetcher.close()
+        self.assertIsNone(fetcher.session)
+
+    def test_session_decodes_response_bytes(self):
+        """Test that API responses are parsed from the raw body."""
+        fetcher = FeedlyFetcher(token="test-token", user_id="test-user")
+        response = MagicMock(content=b'{"items": [{"id": "a"}]}')
+
+        with patch.object(
+            fetcher.session, "make_api_request", return_value=response
+        ) as request:
+            result = fetcher.session.do_api_request("/v3/streams/contents")
+
+        self.assertEqual(result, {"items": [{"id": "a"}]})
+        request.assert_called_once()
+
+        response.content = b""
+        with patch.object(fetcher.session, "make_api_request", return_value=response):
+            self.assertIsNone(fetcher.session.do_api_request("/v3/profile"))
+
+    def test_get_stream_contents_uses_cache(self):
+        """Test that cached stream contents skip the Feedly API."""
+        fetcher = FeedlyFetcher(
+            token="test-token", user_id="test-user", cache=MemoryBackend()
+        )
+        contents = {"id": "stream", "items": [{"id": "a"}]}
+
+        with patch.object(
+            fetcher, "_fetch_stream_contents", return_value=contents
+        ) as fetch:
+            first = fetcher.get_stream_contents("stream", count=5)
+            second = fetcher.get_stream_contents("stream", count=5)
+            fetcher.get_stream_contents("stream", count=6)
+
+        self.assertEqual(first, contents)
+        self.assertEqual(second, contents)
+        self.assertEqual(fetch.call_count, 2)
+
     def test_get_stream_contents_demo_mode(self):
         """Test that demo mode returns sample data."""
         fetcher = FeedlyFetcher(demo_mode=True)
@@ -49,6 +97,17 @@ class TestFeedlyFetcher(unittest.TestCase):
         )
         self.assertEqual(result["id"], "user/-/category/global.all")
 
+    def test_aget_streams_contents_keeps_stream_order(self):
+        """Test that several streams are fetched and returned in order."""
+        fetcher = FeedlyFetcher(demo_mode=True)
+
+        results = asyncio.run(
+            fetcher.aget_streams_contents(["stream-a", "stream-b"], count=1)
+        )
+
+        self.assertEqual([r["id"] for r in results], ["stream-a", "stream-b"])
+        self.assertTrue(all(len(r["items"]) == 1 for r in results))
+
     def test_demo_mode_respects_count(self):
         """Test that demo mode respects the count parameter."""
         fetcher = FeedlyFetcher(demo_mode=True)
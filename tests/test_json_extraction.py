@@ -83,9 +83,21 @@ Text after"""
     def test_extract_json_unmatched_braces(self):
         """Test error when braces are unmatched."""
         content = '{"incomplete": "json"'
-        with pytest.raises(ValueError, match="Unmatched braces"):
+        with pytest.raises(ValueError, match="Invalid JSON"):
             self.llm_filter._extract_json_from_content(content)
 
+    def test_extract_json_skips_non_json_braces(self):
+        """Test that braces in text before the JSON are skipped."""
+        content = 'Thinking about {topics} first\n{"key": "value"}'
+        result = self.llm_filter._extract_json_from_content(content)
+        assert result == '{"key": "value"}'
+
+    def test_extract_json_with_unbalanced_braces_in_strings(self):
+        """Test that unbalanced braces inside strings do not confuse extraction."""
+        content = '{"code": "if (x) {", "key": "value"} trailing }'
+        result = self.llm_filter._extract_json_from_content(content)
+        assert result == '{"code": "if (x) {", "key": "value"}'
+
     def test_extract_json_empty_content(self):
         """Test error when content is empty."""
         content = ""
@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+import pytest
+
+from feed_aggregator import json_utils
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip(use_orjson):
+    """Test that both the orjson and stdlib paths round-trip documents."""
+    doc = {"b": [1, 2.5, None], "a": "text", "nested": {"ok": True}}
+    orjson = json_utils.orjson if use_orjson else None
+    if use_orjson and orjson is None:
+        pytest.skip("orjson not installed")
+
+    with patch.object(json_utils, "orjson", orjson):
+        encoded = json_utils.dumps(doc, sort_keys=True)
+        assert isinstance(encoded, bytes)
+        assert encoded.startswith(b'{"a":"text"')
+        assert json_utils.loads(encoded) == doc
+        assert json_utils.loads(encoded.decode("utf-8")) == doc
+        assert json_utils.dumps({"when": object}, default=lambda _: "x") == (
+            b'{"when":"x"}'
+        )
+        with pytest.raises(json_utils.JSONDecodeError):
+            json_utils.loads("not json")
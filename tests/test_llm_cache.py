@@ -0,0 +1,76 @@
+import pytest
+
+from feed_aggregator.processing.llm_cache import DiskBackend, LLMCache, MemoryBackend
+
+
+@pytest.fixture
+def result():
+    """Create a sample analysis result."""
+    return {
+        "relevance_score": 0.85,
+        "summary": "Summary",
+        "key_topics": ["AI"],
+        "_analysis_metadata": {"model": "gpt-4", "timestamp": "1234567890"},
+    }
+
+
+@pytest.mark.unit
+def test_make_key_is_stable():
+    """Test that equal requests hash to the same key regardless of order."""
+    first = LLMCache.make_key({"model": "gpt-4", "temperature": 0})
+    second = LLMCache.make_key({"temperature": 0, "model": "gpt-4"})
+    other = LLMCache.make_key({"model": "gpt-4o", "temperature": 0})
+
+    assert first == second
+    assert first != other
+
+
+@pytest.mark.unit
+def test_cache_hit_and_miss(result):
+    """Test hit/miss counting and timestamp handling."""
+    cache = LLMCache()
+
+    assert cache.get("key") is None
+    cache.set("key", result)
+    cached = cache.get("key")
+
+    assert cached["summary"] == "Summary"
+    assert cached["_analysis_metadata"]["timestamp"] != "1234567890"
+    assert "timestamp" not in cache.backend.get("key")["_analysis_metadata"]
+    assert result["_analysis_metadata"]["timestamp"] == "1234567890"
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.unit
+def test_memory_backend_evicts_oldest():
+    """Test that the memory backend is bounded."""
+    backend = MemoryBackend(max_size=2)
+    backend.set("a", {"v": 1})
+    backend.set("b", {"v": 2})
+    backend.get("a")
+    backend.set("c", {"v": 3})
+
+    assert backend.get("a") == {"v": 1}
+    assert backend.get("b") is None
+    assert backend.get("c") == {"v": 3}
+
+
+@pytest.mark.unit
+def test_memory_backend_ttl():
+    """Test that expired entries are dropped."""
+    backend = MemoryBackend(ttl=-1)
+    backend.set("a", {"v": 1})
+
+    assert backend.get("a") is None
+
+
+@pytest.mark.unit
+def test_disk_backend_round_trip(tmp_path, result):
+    """Test storing and reading entries from disk."""
+    backend = DiskBackend(directory=str(tmp_path))
+    backend.set("abc", result)
+
+    assert (tmp_path / "abc.json").exists()
+    assert backend.get("abc") == result
+    assert backend.get("missing") is None
+    assert DiskBackend(directory=str(tmp_path), ttl=-1).get("abc") is None
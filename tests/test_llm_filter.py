@@ -1,11 +1,25 @@
+import asyncio
+import json
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import yaml
+from openai import RateLimitError
 
-from feed_aggregator.processing.llm_filter import LLMFilter
+from feed_aggregator.processing.llm_cache import LLMCache
+from feed_aggregator.processing.llm_filter import (
+    CONFIG_SIDECAR_SUFFIX,
+    MAX_PACKED_PROMPT_TOKENS,
+    LLMFilter,
+    _compile_template,
+    _encoder,
+    _load_yaml_cached,
+    _shared_http_client,
+)
+from feed_aggregator.processing.rate_limiter import RateLimiter
 
 
 @pytest.fixture
@@ -56,6 +70,8 @@ def config_file(mock_config):
         config_path = f.name
     yield config_path
     os.unlink(config_path)
+    if os.path.exists(config_path + CONFIG_SIDECAR_SUFFIX):
+        os.unlink(config_path + CONFIG_SIDECAR_SUFFIX)
 
 
 @pytest.fixture
@@ -76,7 +92,7 @@ def llm_filter_openai(mock_openai, config_file):
     """Create LLMFilter with mocked OpenAI client."""
     with patch("feed_aggregator.processing.llm_filter.OpenAI") as mock_openai_cls:
         mock_openai_cls.return_value = mock_openai
-        return LLMFilter(
+        yield LLMFilter(
             provider="openai",
             config_path=config_file,
             api_key="test_key",
@@ -125,20 +141,23 @@ def test_analyze_item_openai(llm_filter_openai, sample_item, mock_openai):
 def test_analyze_item_ollama(llm_filter_ollama, sample_item):
     """Test successful item analysis with Ollama."""
     with patch("feed_aggregator.processing.llm_filter.ollama.chat") as mock_chat:
-        mock_chat.return_value = {
-            "message": {
-                "content": (
-                    '{"relevance_score": 0.75, '
-                    '"summary": "ML model advancement", '
-                    '"key_topics": ["AI", "ML"], '
-                    '"filtered_reason": null}'
-                )
-            }
-        }
+        mock_chat.return_value = iter(
+            [
+                {"message": {"content": '{"relevance_score": 0.75, '}},
+                {"message": {"content": '"summary": "ML model advancement", '}},
+                {
+                    "message": {
+                        "content": '"key_topics": ["AI", "ML"], "filtered_reason": null}'
+                    }
+                },
+            ]
+        )
         result = llm_filter_ollama.analyze_item(sample_item)
+        assert result["summary"] == "ML model advancement"
 
         # Verify Ollama was called with correct parameters
         call_args = mock_chat.call_args[1]
+        assert call_args["stream"] is True
         assert call_args["model"] == "mistral"
         assert call_args["options"]["temperature"] == 0.3
         assert call_args["options"]["format"] == "json"
@@ -155,6 +174,47 @@ def test_analyze_item_ollama(llm_filter_ollama, sample_item):
         assert result["filtered_reason"] is None
 
 
+@pytest.mark.unit
+def test_analyze_item_ollama_stops_after_json(llm_filter_ollama, sample_item):
+    """Test that streaming stops once the JSON object is complete."""
+    chunks = [
+        {"message": {"content": "```json\n"}},
+        {
+            "message": {
+                "content": (
+                    '{"relevance_score": 0.75, "summary": "Done", '
+                    '"key_topics": ["AI"], "nested": {"a": 1}}'
+                )
+            }
+        },
+        {"message": {"content": "\n```\nTrailing explanation"}},
+    ]
+    stream = iter(chunks)
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.chat", return_value=stream
+    ):
+        result = llm_filter_ollama.analyze_item(sample_item)
+
+    assert result["summary"] == "Done"
+    assert result["nested"] == {"a": 1}
+    assert next(stream) is chunks[2]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", ["", "   \n", "New Breakthrough in AI Research"])
+def test_analyze_item_short_circuits_trivial_items(
+    llm_filter_openai, sample_item, mock_openai, content
+):
+    """Test that empty or title-only items are not sent to the LLM."""
+    result = llm_filter_openai.analyze_item(dict(sample_item, content=content))
+
+    mock_openai.chat.completions.create.assert_not_called()
+    assert result["relevance_score"] == 0.0
+    assert result["key_topics"] == []
+    assert result["_analysis_metadata"]["provider"] == "shortcircuit"
+
+
 @pytest.mark.unit
 def test_analyze_item_low_relevance(llm_filter_openai, sample_item, mock_openai):
     """Test handling of low relevance items."""
@@ -207,17 +267,638 @@ def test_analyze_item_missing_fields(llm_filter_openai, sample_item, mock_openai
     with pytest.raises(ValueError) as exc:
         llm_filter_openai.analyze_item(sample_item)
     assert "Missing required field" in str(exc.value)
+    assert "key_topics, relevance_score" in str(exc.value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Title: {title}\n\nContent: {content}",
+        "{{literal}} {title} {content}",
+        "{title!r}: {content:.5}",
+        "No fields",
+    ],
+)
+def test_compile_template_matches_format(template):
+    """Test that compiled templates render exactly like str.format."""
+    fields = {"title": "A title", "content": "Some longer content"}
+    assert _compile_template(template)(**fields) == template.format(**fields)
 
 
 @pytest.mark.unit
-def test_batch_analyze(llm_filter_openai, sample_item, mock_openai):
+def test_requests_reuse_system_message(llm_filter_openai):
+    """Test that request bodies share the precomputed system message."""
+    first = llm_filter_openai._openai_request("first")
+    second = llm_filter_openai._openai_request("second")
+
+    assert first["messages"][0] is second["messages"][0]
+    assert first["messages"][0] == {"role": "system", "content": "Test system prompt"}
+    assert second["messages"][1] == {"role": "user", "content": "second"}
+
+
+@pytest.mark.unit
+def test_custom_system_prompt_is_sent(llm_filter_openai, mock_openai, config_file):
+    """Test that an explicit system prompt replaces the precomputed one."""
+    custom = "You are a prompt engineering expert."
+
+    llm_filter_openai._analyze_with_openai(custom, "make variations")
+    messages = mock_openai.chat.completions.create.call_args[1]["messages"]
+    assert messages[0] == {"role": "system", "content": custom}
+    assert messages[1] == {"role": "user", "content": "make variations"}
+
+    content = '{"relevance_score": 0.5, "summary": "S", "key_topics": []}'
+    chunk = {"message": {"content": content}}
+    llm_filter_ollama = LLMFilter(provider="ollama", config_path=config_file)
+    for llm_filter in (llm_filter_ollama, llm_filter_openai):
+        with patch(
+            "feed_aggregator.processing.llm_filter.ollama.chat",
+            return_value=iter([chunk]),
+        ) as mock_chat:
+            result = llm_filter._analyze_with_ollama(custom, "make variations")
+
+        prompt = mock_chat.call_args[1]["messages"][1]["content"]
+        assert prompt.startswith(custom)
+        assert "Test system prompt" not in prompt
+        assert mock_chat.call_args[1]["model"] == "mistral"
+        assert result["summary"] == "S"
+
+
+@pytest.mark.unit
+def test_prompt_prefix_is_stable(mock_config, tmp_path):
+    """Test that the system prompt is canonical and the prefix is kept warm."""
+    mock_config["llm_filter"]["system_prompt"] = "Line one  \r\nLine two\n\n"
+    mock_config["llm_filter"]["ollama"]["keep_alive"] = "30m"
+    config_path = tmp_path / "prompts.yml"
+    config_path.write_text(yaml.dump(mock_config))
+
+    llm_filter = LLMFilter(provider="ollama", config_path=str(config_path))
+    request = llm_filter._ollama_request("user prompt")
+
+    assert llm_filter._system_prompt == "Line one\nLine two"
+    assert request["messages"][1]["content"].startswith("Line one\nLine two\n\n")
+    assert request["keep_alive"] == "30m"
+    assert request["options"]["num_keep"] > 0
+
+
+@pytest.mark.unit
+def test_config_dict_skips_file(mock_config):
+    """Test that an in-memory config is used without reading any file."""
+    with patch(
+        "feed_aggregator.processing.llm_filter.load_llm_filter_section"
+    ) as mock_load:
+        llm_filter = LLMFilter(provider="ollama", config_dict=mock_config)
+
+    mock_load.assert_not_called()
+    assert llm_filter._system_prompt == mock_config["llm_filter"]["system_prompt"]
+    assert llm_filter.config is not mock_config["llm_filter"]
+
+    with pytest.raises(ValueError, match="missing llm_filter section"):
+        LLMFilter(provider="ollama", config_dict={})
+
+
+@pytest.mark.unit
+def test_missing_provider_section(mock_config, tmp_path):
+    """Test that a config without the provider's section is rejected."""
+    del mock_config["llm_filter"]["ollama"]
+    config_path = tmp_path / "prompts.yml"
+    config_path.write_text(yaml.dump(mock_config))
+
+    with pytest.raises(ValueError, match="missing ollama section"):
+        LLMFilter(provider="ollama", config_path=str(config_path))
+
+
+@pytest.mark.unit
+def test_openai_client_created_lazily(config_file):
+    """Test that the OpenAI client is only built when first used."""
+    with patch("feed_aggregator.processing.llm_filter.OpenAI") as mock_openai_cls:
+        llm_filter = LLMFilter(config_path=config_file, api_key="test_key")
+        mock_openai_cls.assert_not_called()
+
+        assert llm_filter.client is llm_filter.client
+        mock_openai_cls.assert_called_once_with(
+            api_key="test_key", http_client=_shared_http_client()
+        )
+
+
+@pytest.mark.unit
+def test_llm_filter_uses_slots(llm_filter_openai):
+    """Test that filter instances do not carry a per-instance __dict__."""
+    assert not hasattr(llm_filter_openai, "__dict__")
+    with pytest.raises(AttributeError):
+        llm_filter_openai.unknown_attribute = True
+
+
+@pytest.mark.unit
+def test_openai_clients_share_http_pool(config_file):
+    """Test that separate filters reuse one HTTP connection pool."""
+    with patch("feed_aggregator.processing.llm_filter.OpenAI") as mock_openai_cls:
+        first = LLMFilter(config_path=config_file, api_key="test_key")
+        second = LLMFilter(config_path=config_file, api_key="other_key")
+        assert first.client is not None and second.client is not None
+
+    first_call, second_call = mock_openai_cls.call_args_list
+    assert first_call[1]["http_client"] is second_call[1]["http_client"]
+
+
+@pytest.mark.unit
+def test_config_parsed_once_per_mtime(mock_config, tmp_path):
+    """Test that prompts files are only re-parsed when they change."""
+    config_path = tmp_path / "prompts.yml"
+    config_path.write_text(yaml.dump(mock_config))
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.yaml.load", wraps=yaml.load
+    ) as yaml_load:
+        first = LLMFilter(provider="ollama", config_path=str(config_path))
+        second = LLMFilter(provider="ollama", config_path=str(config_path))
+        assert yaml_load.call_count == 1
+
+        first.config["system_prompt"] = "Changed"
+        assert second.config["system_prompt"] == "Test system prompt"
+
+        mock_config["llm_filter"]["system_prompt"] = "Updated prompt"
+        config_path.write_text(yaml.dump(mock_config))
+        os.utime(config_path, (0, os.path.getmtime(config_path) + 1))
+        third = LLMFilter(provider="ollama", config_path=str(config_path))
+
+    assert yaml_load.call_count == 2
+    assert third.config["system_prompt"] == "Updated prompt"
+
+
+@pytest.mark.unit
+def test_config_sidecar_skips_yaml_parse(mock_config, tmp_path):
+    """Test that a fresh JSON sidecar is used instead of parsing YAML."""
+    config_path = tmp_path / "prompts.yml"
+    config_path.write_text(yaml.dump(mock_config))
+    LLMFilter(provider="ollama", config_path=str(config_path))
+
+    sidecar = tmp_path / f"prompts.yml{CONFIG_SIDECAR_SUFFIX}"
+    assert json.loads(sidecar.read_text()) == mock_config
+
+    _load_yaml_cached.cache_clear()
+    with patch("feed_aggregator.processing.llm_filter.yaml.load") as yaml_load:
+        llm_filter = LLMFilter(provider="ollama", config_path=str(config_path))
+
+    yaml_load.assert_not_called()
+    assert llm_filter.config == mock_config["llm_filter"]
+
+
+@pytest.mark.unit
+def test_analyze_item_uses_cache(mock_openai, mock_config, sample_item, tmp_path):
+    """Test that deterministic calls are served from the cache."""
+    mock_config["llm_filter"]["openai"]["temperature"] = 0
+    config_path = tmp_path / "prompts.yml"
+    config_path.write_text(yaml.dump(mock_config))
+    cache = LLMCache()
+    with patch(
+        "feed_aggregator.processing.llm_filter.OpenAI", return_value=mock_openai
+    ):
+        llm_filter = LLMFilter(
+            config_path=str(config_path), api_key="test_key", cache=cache
+        )
+        first = llm_filter.analyze_item(sample_item)
+        second = llm_filter.analyze_item(sample_item)
+
+    assert mock_openai.chat.completions.create.call_count == 1
+    assert second["summary"] == first["summary"]
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.unit
+def test_analyze_item_skips_cache_when_not_deterministic(
+    mock_openai, config_file, sample_item
+):
+    """Test that sampled calls bypass the cache."""
+    cache = LLMCache()
+    with patch(
+        "feed_aggregator.processing.llm_filter.OpenAI", return_value=mock_openai
+    ):
+        llm_filter = LLMFilter(config_path=config_file, api_key="test_key", cache=cache)
+        llm_filter.analyze_item(sample_item)
+        llm_filter.analyze_item(sample_item)
+
+    assert mock_openai.chat.completions.create.call_count == 2
+    assert cache.stats == {"hits": 0, "misses": 0}
+
+
+@pytest.fixture
+def mock_async_openai(mock_openai):
+    """Create mock AsyncOpenAI client returning the same response as mock_openai."""
+    mock = AsyncMock()
+    mock.__aenter__.return_value = mock
+    mock.chat.completions.create.return_value = (
+        mock_openai.chat.completions.create.return_value
+    )
+    with patch("feed_aggregator.processing.llm_filter.AsyncOpenAI", return_value=mock):
+        yield mock
+
+
+@pytest.mark.unit
+def test_batch_analyze(llm_filter_openai, sample_item, mock_async_openai):
     """Test batch analysis of multiple items."""
     items = [sample_item, dict(sample_item)]
     results = llm_filter_openai.batch_analyze(items)
 
     assert len(results) == 2
     assert all(r["relevance_score"] == 0.85 for r in results)
-    assert mock_openai.chat.completions.create.call_count == 2
+    assert mock_async_openai.chat.completions.create.await_count == 2
+
+
+@pytest.mark.unit
+def test_batch_analyze_skips_failures(
+    llm_filter_openai, sample_item, mock_async_openai, mock_openai
+):
+    """Test that failed items are dropped from batch results."""
+    mock_async_openai.chat.completions.create.side_effect = [
+        mock_openai.chat.completions.create.return_value,
+        Exception("API Error"),
+    ]
+
+    results = llm_filter_openai.batch_analyze([sample_item, dict(sample_item)])
+
+    assert len(results) == 1
+    assert results[0]["relevance_score"] == 0.85
+
+
+@pytest.mark.unit
+def test_batch_analyze_retries_rate_limits(
+    llm_filter_openai, sample_item, mock_async_openai, mock_openai
+):
+    """Test that 429 responses are retried after Retry-After."""
+    response = httpx.Response(
+        429,
+        headers={"retry-after": "0.01"},
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+    )
+    mock_async_openai.chat.completions.create.side_effect = [
+        RateLimitError("Rate limited", response=response, body=None),
+        mock_openai.chat.completions.create.return_value,
+    ]
+    llm_filter_openai.rate_limiter = RateLimiter(rpm=100, tpm=100_000)
+
+    results = llm_filter_openai.batch_analyze([sample_item])
+
+    assert len(results) == 1
+    assert mock_async_openai.chat.completions.create.await_count == 2
+
+
+@pytest.mark.unit
+def test_tokens_estimated_only_for_rate_limiter(llm_filter_openai, mock_async_openai):
+    """Test that requests are only tokenized when a rate limiter needs them."""
+    request = llm_filter_openai._openai_request("user prompt")
+
+    with patch.object(LLMFilter, "_estimate_tokens", return_value=5) as mock_estimate:
+        asyncio.run(
+            llm_filter_openai._create_openai_completion(mock_async_openai, request)
+        )
+        mock_estimate.assert_not_called()
+
+        llm_filter_openai.rate_limiter = MagicMock(acquire=AsyncMock())
+        asyncio.run(
+            llm_filter_openai._create_openai_completion(mock_async_openai, request)
+        )
+
+    assert mock_estimate.call_count == 2
+    llm_filter_openai.rate_limiter.acquire.assert_awaited_once_with(10)
+
+
+@pytest.mark.unit
+def test_batch_analyze_packs_items(llm_filter_openai, sample_item, mock_async_openai):
+    """Test that several items can share one OpenAI request."""
+    packed = MagicMock()
+    packed.created = 1234567890
+    packed.choices = [
+        MagicMock(
+            message=MagicMock(
+                content=json.dumps(
+                    {
+                        "results": [
+                            {
+                                "id": 1,
+                                "relevance_score": 0.4,
+                                "summary": "Second",
+                                "key_topics": ["B"],
+                            },
+                            {
+                                "id": 0,
+                                "relevance_score": 0.9,
+                                "summary": "First",
+                                "key_topics": ["A"],
+                            },
+                        ]
+                    }
+                )
+            )
+        )
+    ]
+    mock_async_openai.chat.completions.create.return_value = packed
+
+    items = [sample_item, dict(sample_item, title="Other")]
+    results = llm_filter_openai.batch_analyze(items, items_per_request=5)
+
+    assert mock_async_openai.chat.completions.create.await_count == 1
+    user_prompt = mock_async_openai.chat.completions.create.call_args[1]["messages"][1][
+        "content"
+    ]
+    assert "### Article id=0" in user_prompt
+    assert "### Article id=1" in user_prompt
+    assert [r["summary"] for r in results] == ["First", "Second"]
+    assert "_analysis_metadata" in results[0]
+
+
+@pytest.mark.unit
+def test_batch_analyze_keeps_order_with_trivial_items(
+    llm_filter_openai, sample_item, mock_async_openai
+):
+    """Test that short-circuited items keep their place in packed batches."""
+    packed = MagicMock()
+    packed.created = 1234567890
+    packed.choices = [
+        MagicMock(
+            message=MagicMock(
+                content=json.dumps(
+                    {
+                        "results": [
+                            {
+                                "id": 0,
+                                "relevance_score": 0.9,
+                                "summary": "First",
+                                "key_topics": ["A"],
+                            },
+                            {
+                                "id": 1,
+                                "relevance_score": 0.4,
+                                "summary": "Last",
+                                "key_topics": ["B"],
+                            },
+                        ]
+                    }
+                )
+            )
+        )
+    ]
+    mock_async_openai.chat.completions.create.return_value = packed
+
+    items = [sample_item, dict(sample_item, content=""), dict(sample_item)]
+    results = llm_filter_openai.batch_analyze(items, items_per_request=5)
+
+    assert mock_async_openai.chat.completions.create.await_count == 1
+    assert [r["summary"] for r in results] == ["First", "", "Last"]
+
+
+@pytest.mark.unit
+def test_pack_items_respects_limits(llm_filter_openai):
+    """Test that packing honours the item count and character budget."""
+    items = [{"title": "t", "content": "x"}] * 5
+    assert llm_filter_openai._pack_items(items, 2) == [[0, 1], [2, 3], [4]]
+
+    big = {"title": "t", "content": " word" * MAX_PACKED_PROMPT_TOKENS}
+    assert llm_filter_openai._pack_items([big, big], 10) == [[0], [1]]
+
+
+@pytest.mark.unit
+def test_estimate_tokens_uses_cached_encoder(llm_filter_openai):
+    """Test that the tiktoken encoder is loaded once per model."""
+    fake_tiktoken = MagicMock()
+    fake_tiktoken.encoding_for_model.return_value.encode.return_value = [1, 2, 3]
+    _encoder.cache_clear()
+    try:
+        with patch("feed_aggregator.processing.llm_filter.tiktoken", fake_tiktoken):
+            assert llm_filter_openai._estimate_tokens("some text") == 3
+            assert llm_filter_openai._estimate_tokens("more text") == 3
+        fake_tiktoken.encoding_for_model.assert_called_once_with("gpt-4")
+    finally:
+        _encoder.cache_clear()
+
+
+@pytest.mark.unit
+def test_estimate_tokens_without_tiktoken(llm_filter_openai):
+    """Test the character-based fallback estimate."""
+    _encoder.cache_clear()
+    try:
+        with patch("feed_aggregator.processing.llm_filter.tiktoken", None):
+            assert llm_filter_openai._estimate_tokens("x" * 40) == 10
+    finally:
+        _encoder.cache_clear()
+
+
+@pytest.mark.unit
+def test_batch_analyze_ollama(llm_filter_ollama, sample_item):
+    """Test concurrent batch analysis with Ollama."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    response = {
+        "message": {
+            "content": (
+                '{"relevance_score": 0.75, '
+                '"summary": "ML model advancement", '
+                '"key_topics": ["AI", "ML"], '
+                '"filtered_reason": null}'
+            )
+        }
+    }
+
+    async def stream(**kwargs):
+        yield response
+
+    mock_client.chat.side_effect = stream
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient",
+        return_value=mock_client,
+    ):
+        results = llm_filter_ollama.batch_analyze([sample_item] * 3, batch_size=2)
+
+    assert len(results) == 3
+    assert all(r["relevance_score"] == 0.75 for r in results)
+    assert mock_client.chat.await_count == 3
+
+
+@pytest.mark.unit
+def test_analyze_items_batch_ollama(llm_filter_ollama, sample_item):
+    """Test analyzing several items in one packed Ollama request."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    content = json.dumps(
+        {
+            "results": [
+                {"id": 1, "relevance_score": 0.2, "summary": "B", "key_topics": []},
+                {"id": 0, "relevance_score": 0.8, "summary": "A", "key_topics": []},
+                {"id": 7, "relevance_score": 0.5, "summary": "?", "key_topics": []},
+            ]
+        }
+    )
+
+    async def stream(**kwargs):
+        yield {"message": {"content": content}}
+
+    mock_client.chat.side_effect = stream
+    items = [
+        sample_item,
+        dict(sample_item, content=""),
+        dict(sample_item, title="Other"),
+        dict(sample_item, title="Third"),
+    ]
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient",
+        return_value=mock_client,
+    ):
+        results = llm_filter_ollama.analyze_items_batch(items)
+
+    assert mock_client.chat.await_count == 1
+    user_prompt = mock_client.chat.call_args[1]["messages"][1]["content"]
+    assert "### Article id=2" in user_prompt
+    assert "### Article id=3" not in user_prompt
+    assert results[0]["summary"] == "A"
+    assert results[1]["_analysis_metadata"]["provider"] == "shortcircuit"
+    assert results[2]["summary"] == "B"
+    assert results[2]["_analysis_metadata"]["provider"] == "ollama"
+    assert results[3] is None
+
+
+@pytest.mark.unit
+def test_analyze_items_batch_single_item_unpacked(llm_filter_ollama, sample_item):
+    """Test that a lone item is sent as an ordinary request."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+
+    async def stream(**kwargs):
+        yield {
+            "message": {
+                "content": '{"relevance_score": 0.6, "summary": "S", "key_topics": []}'
+            }
+        }
+
+    mock_client.chat.side_effect = stream
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient",
+        return_value=mock_client,
+    ):
+        results = llm_filter_ollama.analyze_items_batch([sample_item])
+
+    user_prompt = mock_client.chat.call_args[1]["messages"][1]["content"]
+    assert "### Article" not in user_prompt
+    assert results[0]["relevance_score"] == 0.6
+
+
+@pytest.mark.unit
+def test_aanalyze_item_ollama(llm_filter_ollama, sample_item):
+    """Test analyzing one item through the async Ollama client."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+
+    async def stream(**kwargs):
+        yield {
+            "message": {
+                "content": '{"relevance_score": 0.6, "summary": "S", "key_topics": []}'
+            }
+        }
+
+    mock_client.chat.side_effect = stream
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = asyncio.run(llm_filter_ollama.aanalyze_item(sample_item))
+        trivial = asyncio.run(
+            llm_filter_ollama.aanalyze_item(dict(sample_item, content=""))
+        )
+
+    assert result["relevance_score"] == 0.6
+    assert trivial["_analysis_metadata"]["provider"] == "shortcircuit"
+    assert mock_client.chat.await_count == 1
+
+    # A caller-owned client is used as is, without opening another
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient"
+    ) as mock_client_cls:
+        shared = asyncio.run(llm_filter_ollama.aanalyze_item(sample_item, mock_client))
+
+    mock_client_cls.assert_not_called()
+    assert shared["relevance_score"] == 0.6
+    assert mock_client.chat.await_count == 2
+
+
+@pytest.mark.unit
+def test_awarm_up_prefills_ollama_prefix(llm_filter_ollama, llm_filter_openai):
+    """Test that warm-up sends a one-token Ollama request and skips OpenAI."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+
+    with patch(
+        "feed_aggregator.processing.llm_filter.ollama.AsyncClient",
+        return_value=mock_client,
+    ) as mock_async_client:
+        asyncio.run(llm_filter_ollama.awarm_up())
+        asyncio.run(llm_filter_openai.awarm_up())
+        mock_client.chat.side_effect = ConnectionError("down")
+        asyncio.run(llm_filter_ollama.awarm_up())
+
+    assert mock_async_client.call_count == 2
+    kwargs = mock_client.chat.call_args_list[0][1]
+    assert kwargs["options"]["num_predict"] == 1
+    assert "num_predict" not in llm_filter_ollama._ollama_options
+    assert kwargs["messages"][1]["content"] == llm_filter_ollama._ollama_prompt_prefix
+
+
+@pytest.mark.unit
+def test_batch_analyze_via_batch_api(llm_filter_openai, sample_item, mock_openai):
+    """Test analysis through the OpenAI Batch API."""
+    content = (
+        '{"relevance_score": 0.85, "summary": "Summary", '
+        '"key_topics": ["AI"], "filtered_reason": null}'
+    )
+    output_lines = [
+        json.dumps(
+            {
+                "custom_id": "1",
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "created": 1,
+                        "choices": [{"message": {"content": content}}],
+                    },
+                },
+                "error": None,
+            }
+        ),
+        json.dumps(
+            {
+                "custom_id": "0",
+                "response": None,
+                "error": {"code": "server_error", "message": "failed"},
+            }
+        ),
+    ]
+    mock_openai.batches.create.return_value.status = "in_progress"
+    mock_openai.batches.retrieve.return_value.status = "completed"
+    mock_openai.batches.retrieve.return_value.output_file_id = "file-out"
+    mock_openai.files.content.return_value.text = "\n".join(output_lines)
+
+    with patch("feed_aggregator.processing.llm_filter.time.sleep") as mock_sleep:
+        results = llm_filter_openai.batch_analyze_via_batch_api(
+            [sample_item, dict(sample_item)]
+        )
+
+    mock_sleep.assert_called_once()
+    uploaded = mock_openai.files.create.call_args[1]["file"][1].decode()
+    requests = [json.loads(line) for line in uploaded.splitlines()]
+    assert [r["custom_id"] for r in requests] == ["0", "1"]
+    assert requests[0]["body"]["model"] == "gpt-4"
+    assert len(results) == 1
+    assert results[0]["relevance_score"] == 0.85
+    mock_openai.chat.completions.create.assert_not_called()
+
+
+@pytest.mark.unit
+def test_batch_analyze_via_batch_api_requires_openai(llm_filter_ollama, sample_item):
+    """Test that the Batch API path rejects non-OpenAI providers."""
+    with pytest.raises(ValueError):
+        llm_filter_ollama.batch_analyze_via_batch_api([sample_item])
 
 
 @pytest.mark.unit
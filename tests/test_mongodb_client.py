@@ -1,11 +1,14 @@
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Generator, List
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import mongomock
 import pytest
-from pymongo.errors import DuplicateKeyError, OperationFailure
+from mongomock.collection import Collection, Cursor
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
 from feed_aggregator.storage.mongodb_client import MongoDBClient
 
@@ -47,14 +50,15 @@ def sample_feed_item():
 @pytest.fixture
 def mock_mongodb_client(mock_env_vars) -> Generator[MongoDBClient, None, None]:
     """Create a MongoDB client using mongomock."""
+    # Each test gets a fresh mock database that needs its indexes
+    MongoDBClient._indexed_databases.clear()
     with mongomock.MongoClient() as client:
         # Patch MongoClient to use our mock
         with patch(
             "feed_aggregator.storage.mongodb_client.MongoClient", return_value=client
         ):
             mongodb_client = MongoDBClient()
-            # Create collections
-            mongodb_client.db.create_collection("feed_items")
+            # feed_items already exists once its indexes are created
             mongodb_client.db.create_collection("processing_metrics")
             yield mongodb_client
             # Clean up collections after each test
@@ -76,6 +80,114 @@ def test_init_with_credentials(mock_env_vars):
             client.close()
 
 
+@pytest.mark.unit
+def test_init_creates_indexes_once(mock_env_vars):
+    """Test that indexes are created on first connect to a database only."""
+    MongoDBClient._indexed_databases.clear()
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ):
+            first = MongoDBClient()
+            index_keys = [
+                index["key"] for index in first.feed_items.index_information().values()
+            ]
+            with patch.object(Collection, "create_index") as create_index:
+                MongoDBClient().close()
+            first.close()
+
+    assert [("id", 1)] in index_keys
+    assert [("processing_status", 1), ("published", 1)] in index_keys
+    assert [("processing_status", 1), ("llm_analysis.relevance_score", 1)] in index_keys
+    assert [
+        ("processing_status", 1),
+        ("crawled", -1),
+        ("llm_analysis.relevance_score", 1),
+    ] in index_keys
+    assert [("crawled", -1)] in index_keys
+    create_index.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("index_created", [True, False])
+def test_status_queries_hint_compound_index(mock_env_vars, index_created):
+    """Test that status queries hint the compound index only if it was created."""
+    MongoDBClient._indexed_databases.clear()
+    create_index = None if index_created else OperationFailure("not authorized")
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ), patch.object(Collection, "create_index", side_effect=create_index):
+            client = MongoDBClient()
+        with patch.object(
+            Cursor, "hint", autospec=True, side_effect=lambda cursor, index: cursor
+        ) as hint:
+            client.get_pending_items()
+            client.get_filtered_items()
+        client.close()
+
+    expected = [("processing_status", 1), ("published", 1)]
+    assert [c.args[1] for c in hint.call_args_list] == (
+        [expected, expected] if index_created else []
+    )
+
+
+@pytest.mark.unit
+def test_clients_share_connection_pool(mock_env_vars):
+    """Test that instances share one MongoClient until the last one closes."""
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ) as mock_client_cls, patch.object(mock_client, "close") as close:
+            first = MongoDBClient()
+            second = MongoDBClient()
+            first.close()
+            close.assert_not_called()
+            second.close()
+
+    assert mock_client_cls.call_count == 1
+    close.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "fast_ingest,feed_items_journal", [(False, None), (True, False)]
+)
+def test_write_concerns(mock_env_vars, fast_ingest, feed_items_journal):
+    """Test that metrics skip the journal and feed items do only on request."""
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ):
+            client = MongoDBClient(fast_ingest=fast_ingest)
+            client.close()
+
+    assert client.metrics.write_concern.document == {"w": 1, "j": False}
+    assert client.feed_items.write_concern.document.get("j") == feed_items_journal
+
+
+@pytest.mark.unit
+def test_init_passes_pool_options(mock_env_vars):
+    """Test that pool size, timeouts and compressors reach MongoClient."""
+    os.environ["MONGODB_COMPRESSORS"] = "zstd,zlib"
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ) as mock_client_cls:
+            MongoDBClient().close()
+
+    kwargs = mock_client_cls.call_args[1]
+    assert kwargs["maxPoolSize"] == 32
+    assert kwargs["appname"] == "feed-aggregator"
+    assert kwargs["serverSelectionTimeoutMS"] == 5000
+    assert kwargs["compressors"] == "zstd,zlib"
+
+
 @pytest.mark.unit
 def test_store_feed_items_success(mock_mongodb_client, sample_feed_item):
     """Test successful storage of feed items."""
@@ -177,12 +289,252 @@ def test_get_filtered_items(mock_mongodb_client):
     assert all(not item.get("published_to_feed", False) for item in filtered_items)
 
 
+@pytest.mark.unit
+def test_store_feed_items_batches_bulk_writes(mock_mongodb_client):
+    """Test that upserts are flushed in bulk writes of bounded size."""
+    items = ({"id": f"item{i}", "title": f"Item {i}"} for i in range(5))
+
+    with patch(
+        "feed_aggregator.storage.mongodb_client.BULK_WRITE_BATCH_SIZE", 2
+    ), patch.object(
+        mock_mongodb_client.feed_items,
+        "bulk_write",
+        wraps=mock_mongodb_client.feed_items.bulk_write,
+    ) as bulk_write:
+        stored_count = mock_mongodb_client.store_feed_items(items)
+
+    assert stored_count == 5
+    assert [len(c.args[0]) for c in bulk_write.call_args_list] == [2, 2, 1]
+    assert mock_mongodb_client.get_item("item4")["processing_status"] == "pending"
+
+
+@pytest.mark.unit
+def test_bulk_writes_respect_write_concurrency(mock_env_vars):
+    """Test that concurrent stores never exceed MONGODB_WRITE_CONCURRENCY."""
+    os.environ["MONGODB_WRITE_CONCURRENCY"] = "2"
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_bulk_write(operations, ordered):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return MagicMock(upserted_count=len(operations), modified_count=0)
+
+    try:
+        with mongomock.MongoClient() as mock_client:
+            with patch(
+                "feed_aggregator.storage.mongodb_client.MongoClient",
+                return_value=mock_client,
+            ):
+                client = MongoDBClient()
+            with patch.object(
+                client.feed_items, "bulk_write", side_effect=slow_bulk_write
+            ):
+                threads = [
+                    threading.Thread(
+                        target=client.store_feed_items, args=([{"id": str(i)}],)
+                    )
+                    for i in range(6)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            client.close()
+    finally:
+        del os.environ["MONGODB_WRITE_CONCURRENCY"]
+
+    assert len(peak) == 6
+    assert max(peak) <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("threshold,rebuilt", [(2, True), (3, False)])
+def test_bulk_update_analyses(mock_mongodb_client, threshold, rebuilt):
+    """Test that large analysis updates rebuild the score index afterwards."""
+    mock_mongodb_client.store_feed_items([{"id": "a"}, {"id": "b"}])
+    updates = {
+        item_id: {
+            "llm_analysis": {"relevance_score": 0.9},
+            "processing_status": "processed",
+        }
+        for item_id in ("a", "b")
+    }
+
+    with patch(
+        "feed_aggregator.storage.mongodb_client.REINDEX_THRESHOLD", threshold
+    ), patch.object(
+        mock_mongodb_client.feed_items,
+        "drop_index",
+        wraps=mock_mongodb_client.feed_items.drop_index,
+    ) as drop_index:
+        modified_count = mock_mongodb_client.bulk_update_analyses(updates)
+
+    assert modified_count == 2
+    assert drop_index.called == rebuilt
+    assert mock_mongodb_client.get_item("b")["llm_analysis"]["relevance_score"] == 0.9
+    index_keys = [
+        index["key"]
+        for index in mock_mongodb_client.feed_items.index_information().values()
+    ]
+    assert [("processing_status", 1), ("llm_analysis.relevance_score", 1)] in index_keys
+
+
+@pytest.mark.unit
+def test_get_item_cache(mock_env_vars):
+    """Test that cached items are reused until this client updates them."""
+    with mongomock.MongoClient() as mock_client:
+        with patch(
+            "feed_aggregator.storage.mongodb_client.MongoClient",
+            return_value=mock_client,
+        ):
+            client = MongoDBClient(item_cache_size=1)
+        client.store_feed_items([{"id": "a", "title": "A"}, {"id": "b"}])
+
+        with patch.object(
+            client.feed_items, "find_one", wraps=client.feed_items.find_one
+        ) as find_one:
+            client.get_item("a")["title"] = "changed"
+            assert client.get_item("a")["title"] == "A"
+            client.update_item("a", {"title": "New"})
+            assert client.get_item("a")["title"] == "New"
+            client.get_item("b")
+            client.get_item("a")
+        client.close()
+
+    assert find_one.call_count == 4
+
+
+@pytest.mark.unit
+def test_item_exists(mock_mongodb_client, sample_feed_item):
+    """Test the existence check for stored and unknown items."""
+    mock_mongodb_client.store_feed_items([sample_feed_item])
+
+    assert mock_mongodb_client.item_exists(sample_feed_item["id"]) is True
+    assert mock_mongodb_client.item_exists("missing") is False
+
+
+@pytest.mark.unit
+def test_get_existing_ids(mock_mongodb_client, sample_feed_item):
+    """Test that stored IDs are found among a batch in one query."""
+    mock_mongodb_client.store_feed_items([sample_feed_item])
+
+    existing = mock_mongodb_client.get_existing_ids(
+        iter([sample_feed_item["id"], "missing"])
+    )
+
+    assert existing == {sample_feed_item["id"]}
+
+
+@pytest.mark.unit
+def test_get_analyzed_ids(mock_mongodb_client, sample_feed_item):
+    """Test that only items with an LLM analysis are reported as analyzed."""
+    analyzed = dict(sample_feed_item, id="analyzed", llm_analysis={})
+    mock_mongodb_client.store_feed_items([sample_feed_item, analyzed])
+
+    assert mock_mongodb_client.get_analyzed_ids(
+        [sample_feed_item["id"], "analyzed", "missing"]
+    ) == {"analyzed"}
+
+
+@pytest.mark.unit
+def test_get_items_by_ids(mock_mongodb_client):
+    """Test fetching several items in one query with a projection."""
+    mock_mongodb_client.store_feed_items(
+        [{"id": f"item{i}", "title": f"Item {i}", "extra": i} for i in range(3)]
+    )
+
+    items = mock_mongodb_client.get_items_by_ids(
+        ["item0", "item2", "missing"], fields=["title"]
+    )
+
+    assert set(items) == {"item0", "item2"}
+    assert items["item2"]["title"] == "Item 2"
+    assert "extra" not in items["item2"]
+
+
+@pytest.mark.unit
+def test_iter_items_streams_results(mock_mongodb_client):
+    """Test that the iter_ variants stream the same items as the list getters."""
+    mock_mongodb_client.store_feed_items(
+        [
+            {
+                "id": f"item{i}",
+                "processing_status": "processed",
+                "published": i,
+                "llm_analysis": {"relevance_score": 0.9},
+            }
+            for i in range(3)
+        ]
+    )
+
+    items = mock_mongodb_client.iter_items_by_status("processed")
+    assert not isinstance(items, list)
+    assert [item["id"] for item in items] == ["item0", "item1", "item2"]
+    assert list(mock_mongodb_client.iter_filtered_items(limit=2)) == (
+        mock_mongodb_client.get_filtered_items(limit=2)
+    )
+
+
+@pytest.mark.unit
+def test_get_status_counts(mock_mongodb_client):
+    """Test status counts from a single aggregation."""
+    statuses = ["pending", "pending", "processed", "filtered_out", "published"]
+    mock_mongodb_client.store_feed_items(
+        [
+            {"id": f"item{i}", "title": f"Item {i}", "processing_status": status}
+            for i, status in enumerate(statuses)
+        ]
+    )
+
+    assert mock_mongodb_client.get_status_counts() == {
+        "total": 5,
+        "pending": 2,
+        "processed": 1,
+        "filtered": 1,
+        "published": 1,
+    }
+
+
+@pytest.mark.unit
+def test_get_dashboard_snapshot(mock_mongodb_client):
+    """Test counts and filtered items from a single $facet aggregation."""
+    items = [
+        {
+            "id": f"item{i}",
+            "processing_status": "processed",
+            "published": 100 - i,
+            "llm_analysis": {"relevance_score": score},
+        }
+        for i, score in enumerate([0.9, 0.5, 0.8])
+    ]
+    items.append({"id": "pending", "processing_status": "pending"})
+    mock_mongodb_client.store_feed_items(items)
+
+    snapshot = mock_mongodb_client.get_dashboard_snapshot(min_score=0.7, limit=5)
+
+    assert snapshot["counts"]["total"] == 4
+    assert snapshot["counts"]["processed"] == 3
+    assert snapshot["counts"]["pending"] == 1
+    assert [item["id"] for item in snapshot["filtered"]] == ["item2", "item0"]
+    assert snapshot["filtered"] == mock_mongodb_client.get_filtered_items(
+        min_score=0.7, limit=5
+    )
+
+
 @pytest.mark.unit
 def test_record_metric(mock_mongodb_client):
     """Test recording of processing metrics."""
     # Record test metric
     metadata = {"source": "test"}
     mock_mongodb_client.record_metric("items_processed", 5, metadata)
+    assert mock_mongodb_client.metrics.count_documents({}) == 0
+    mock_mongodb_client.flush_metrics()
 
     # Verify metric was recorded
     metrics = list(mock_mongodb_client.metrics.find({"metric_type": "items_processed"}))
@@ -193,6 +545,19 @@ def test_record_metric(mock_mongodb_client):
     assert isinstance(metrics[0]["timestamp"], datetime)
 
 
+@pytest.mark.unit
+def test_record_metric_flushes_full_buffer_and_on_close(mock_mongodb_client):
+    """Test that buffered metrics are written when full and on close."""
+    with patch("feed_aggregator.storage.mongodb_client.METRIC_FLUSH_SIZE", 2):
+        for value in range(3):
+            mock_mongodb_client.record_metric("items_processed", value)
+
+    metrics = mock_mongodb_client.metrics
+    assert metrics.count_documents({}) == 2
+    mock_mongodb_client.close()
+    assert metrics.count_documents({}) == 3
+
+
 @pytest.mark.unit
 def test_close_connection(mock_mongodb_client):
     """Test closing MongoDB connection."""
@@ -259,10 +624,38 @@ def test_store_feed_items_error_handling(
 ):
     """Test error handling during feed item storage."""
     with patch.object(
-        mock_mongodb_client.feed_items, "update_one", side_effect=error_type(error_msg)
+        mock_mongodb_client.feed_items, "bulk_write", side_effect=error_type(error_msg)
     ):
-        stored_count = mock_mongodb_client.store_feed_items([sample_feed_item])
+        stored_ids = set()
+        stored_count = mock_mongodb_client.store_feed_items(
+            [sample_feed_item], stored_ids
+        )
         assert stored_count == 0
+        assert stored_ids == set()
+
+
+@pytest.mark.unit
+def test_store_feed_items_partial_bulk_failure(mock_mongodb_client, caplog):
+    """Test that a partially failed bulk write counts the applied upserts."""
+    error = BulkWriteError(
+        {
+            "nUpserted": 1,
+            "nModified": 0,
+            "writeErrors": [
+                {"index": 1, "errmsg": "bad item", "op": {"q": {"id": "item1"}}}
+            ],
+        }
+    )
+    items = [{"id": "item0"}, {"id": "item1"}]
+
+    stored_ids = set()
+
+    with patch.object(mock_mongodb_client.feed_items, "bulk_write", side_effect=error):
+        stored_count = mock_mongodb_client.store_feed_items(items, stored_ids)
+
+    assert stored_count == 1
+    assert stored_ids == {"item0"}
+    assert "Error storing item item1: bad item" in caplog.text
 
 
 @pytest.mark.unit
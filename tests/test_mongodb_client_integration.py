@@ -1,4 +1,5 @@
 """Integration tests for MongoDB client using testcontainers."""
+import threading
 import time
 from datetime import UTC, datetime
 from typing import Generator
@@ -8,7 +9,7 @@ from pymongo import ASCENDING
 from pymongo.operations import UpdateOne
 from testcontainers.mongodb import MongoDbContainer
 
-from feed_aggregator.storage.mongodb_client import MongoDBClient
+from feed_aggregator.storage.mongodb_client import STATUS_PUBLISHED_INDEX, MongoDBClient
 
 
 def wait_for_mongodb(client, timeout=30, interval=1):
@@ -61,6 +62,12 @@ def mongodb_client(mongodb_container) -> Generator[MongoDBClient, None, None]:
             self.db = self.client[database_name]
             self.feed_items = self.db.feed_items
             self.metrics = self.db.processing_metrics
+            self._metric_buffer = []
+            self._item_cache_size = 0
+            self._item_cache = {}
+            self._write_semaphore = threading.BoundedSemaphore(4)
+            self._ensure_indexes()
+            self._status_index_hint = STATUS_PUBLISHED_INDEX
 
     client = TestMongoDBClient(pymongo_client)
     yield client
@@ -182,6 +189,7 @@ class TestMongoDBClientIntegration:
 
         for metric_type, value, metadata in metrics_data:
             mongodb_client.record_metric(metric_type, value, metadata)
+        mongodb_client.flush_metrics()
 
         # Query metrics
         all_metrics = list(mongodb_client.metrics.find({}))
@@ -208,6 +216,8 @@ class TestMongoDBClientIntegration:
             # Record metric
             mongodb_client.record_metric("item_processed", 1, {"item_id": item["id"]})
 
+        mongodb_client.flush_metrics()
+
         # Verify all operations completed
         processed_items = list(
             mongodb_client.feed_items.find(
@@ -278,6 +288,20 @@ class TestMongoDBClientIntegration:
             assert "avg_score" in result
             assert "_id" in result and "category" in result["_id"]
 
+    def test_pending_items_use_status_index(self, mongodb_client, sample_feed_items):
+        """Test that pending item queries scan the hinted compound index."""
+        mongodb_client.store_feed_items(sample_feed_items)
+
+        explanation = mongodb_client.iter_items_by_status(
+            mongodb_client.STATUS_PENDING, limit=10
+        ).explain()
+
+        plan = explanation["queryPlanner"]["winningPlan"]
+        while "inputStage" in plan:
+            plan = plan["inputStage"]
+        assert plan["stage"] == "IXSCAN"
+        assert plan["indexName"] == "processing_status_1_published_1"
+
     def test_index_performance(self, mongodb_client):
         """Test index usage and performance."""
         # Create compound index
@@ -69,7 +69,7 @@ It should be ignored by the improved parsing logic."""
     }
 
     with patch("feed_aggregator.processing.llm_filter.ollama.chat") as mock_chat:
-        mock_chat.return_value = response_with_extra_content
+        mock_chat.return_value = iter([response_with_extra_content])
 
         llm_filter = LLMFilter(provider="ollama", config_path=tech_config_file)
 
@@ -108,7 +108,7 @@ Additional text after the JSON that causes parsing to fail."""
     }
 
     with patch("feed_aggregator.processing.llm_filter.ollama.chat") as mock_chat:
-        mock_chat.return_value = problematic_response
+        mock_chat.return_value = iter([problematic_response])
 
         llm_filter = LLMFilter(provider="ollama", config_path=tech_config_file)
 
@@ -141,7 +141,7 @@ This is some additional explanation text."""
     }
 
     with patch("feed_aggregator.processing.llm_filter.ollama.chat") as mock_chat:
-        mock_chat.return_value = markdown_response
+        mock_chat.return_value = iter([markdown_response])
 
         llm_filter = LLMFilter(provider="ollama", config_path=tech_config_file)
 
@@ -169,7 +169,7 @@ def test_ollama_json_parsing_clean_response(tech_config_file, sample_tech_item):
     }
 
     with patch("feed_aggregator.processing.llm_filter.ollama.chat") as mock_chat:
-        mock_chat.return_value = clean_response
+        mock_chat.return_value = iter([clean_response])
 
         llm_filter = LLMFilter(provider="ollama", config_path=tech_config_file)
 
@@ -1,5 +1,7 @@
 import os
 import sys
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
@@ -10,8 +12,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 # Import after path modification
 from scripts.process_categories_runner import (  # noqa: E402
+    _category_config,
+    _get_processed_articles,
+    handle_list_categories,
     main_runner,
+    process_specific_categories,
     reconcile_processed_articles,
+    validate_categories,
 )
 
 
@@ -31,7 +38,9 @@ def mock_category_config():
             "default_quality_threshold": 0.6
         }
         mock_config_class.return_value = mock_config_instance
+        _category_config.cache_clear()
         yield mock_config_instance
+    _category_config.cache_clear()
 
 
 @pytest.fixture
@@ -52,6 +61,13 @@ def mock_defused_xml():
         yield mock_xml
 
 
+def write_feed_xml(directory, guids):
+    """Write a minimal RSS feed.xml containing the given item guids."""
+    items = "".join(f"<item><guid>{guid}</guid></item>" for guid in guids)
+    feed = f"<rss><channel><title>Feed</title>{items}</channel></rss>"
+    (directory / "feed.xml").write_text(feed)
+
+
 @pytest.fixture
 def sample_processed_articles():
     """Sample processed articles from yesterday."""
@@ -84,7 +100,7 @@ def sample_processed_articles():
 
 
 def test_reconcile_no_processed_articles(
-    mock_mongo_client, mock_category_config, mock_update_feed, mock_git_commit
+    mock_mongo_client, mock_category_config, mock_update_feed, mock_git_commit, capsys
 ):
     """Test reconcile when no processed articles found."""
     # Mock no articles found
@@ -92,6 +108,12 @@ def test_reconcile_no_processed_articles(
 
     reconcile_processed_articles()
 
+    # The XML feed is not read when there is nothing to reconcile
+    output = capsys.readouterr().out
+    assert "Found 0 high-quality processed articles" in output
+    assert "feed.xml" not in output
+    assert "already in XML feed" not in output
+
     # Should not call update_feed or git_commit
     mock_update_feed.assert_not_called()
     mock_git_commit.assert_not_called()
@@ -103,34 +125,26 @@ def test_reconcile_no_missing_articles(
     mock_category_config,
     mock_update_feed,
     mock_git_commit,
-    mock_defused_xml,
     sample_processed_articles,
+    tmp_path,
+    monkeypatch,
 ):
     """Test reconcile when all processed articles are already in XML."""
     # Mock processed articles found
     mock_mongo_client.feed_items.find.return_value = sample_processed_articles
 
-    # Mock XML parsing - all articles already in feed
-    mock_tree = MagicMock()
-    mock_root = MagicMock()
-    mock_channel = MagicMock()
-
-    # Create mock XML items with same IDs as processed articles
-    mock_items = []
-    for article in sample_processed_articles:
-        mock_item = MagicMock()
-        mock_guid = MagicMock()
-        mock_guid.text = article["id"]
-        mock_item.find.return_value = mock_guid
-        mock_items.append(mock_item)
-
-    mock_channel.findall.return_value = mock_items
-    mock_root.find.return_value = mock_channel
-    mock_tree.getroot.return_value = mock_root
-    mock_defused_xml.parse.return_value = mock_tree
+    # All articles already in feed
+    write_feed_xml(tmp_path, [a["id"] for a in sample_processed_articles])
+    monkeypatch.chdir(tmp_path)
 
-    with patch("os.path.exists", return_value=True):
-        reconcile_processed_articles()
+    reconcile_processed_articles()
+
+    assert mock_mongo_client.feed_items.find.call_args[0][1] == {
+        "_id": 0,
+        "id": 1,
+        "title": 1,
+        "llm_analysis.relevance_score": 1,
+    }
 
     # Should not call update_feed or git_commit since no missing articles
     mock_update_feed.assert_not_called()
@@ -143,36 +157,33 @@ def test_reconcile_with_missing_articles(
     mock_category_config,
     mock_update_feed,
     mock_git_commit,
-    mock_defused_xml,
     sample_processed_articles,
+    tmp_path,
+    monkeypatch,
+    capsys,
 ):
     """Test reconcile when some processed articles are missing from XML."""
     # Mock processed articles found
     mock_mongo_client.feed_items.find.return_value = sample_processed_articles
 
-    # Mock XML parsing - only first article in feed, others missing
-    mock_tree = MagicMock()
-    mock_root = MagicMock()
-    mock_channel = MagicMock()
-
-    # Only include first article in XML
-    mock_item = MagicMock()
-    mock_guid = MagicMock()
-    mock_guid.text = sample_processed_articles[0]["id"]  # "article_1"
-    mock_item.find.return_value = mock_guid
-    mock_channel.findall.return_value = [mock_item]
-
-    mock_root.find.return_value = mock_channel
-    mock_tree.getroot.return_value = mock_root
-    mock_defused_xml.parse.return_value = mock_tree
+    # Only first article in feed, others missing
+    write_feed_xml(tmp_path, [sample_processed_articles[0]["id"]])
+    monkeypatch.chdir(tmp_path)
 
     # Mock update_many result
     mock_update_result = MagicMock()
     mock_update_result.modified_count = 2  # 2 articles marked for publishing
     mock_mongo_client.feed_items.update_many.return_value = mock_update_result
 
-    with patch("os.path.exists", return_value=True):
-        reconcile_processed_articles()
+    reconcile_processed_articles()
+
+    # Missing articles are listed under the count headers
+    output = capsys.readouterr().out
+    assert (
+        output.index("Found 3 high-quality")
+        < output.index("Found 2 processed articles missing")
+        < output.index("Missing: Test Article 2")
+    )
 
     # Should mark missing articles for publishing
     mock_mongo_client.feed_items.update_many.assert_called_once_with(
@@ -230,7 +241,7 @@ def test_reconcile_xml_parse_error(
     mock_mongo_client.feed_items.find.return_value = sample_processed_articles
 
     # Mock XML parsing error
-    mock_defused_xml.parse.side_effect = Exception("XML parse error")
+    mock_defused_xml.iterparse.side_effect = Exception("XML parse error")
 
     # Mock update_many result
     mock_update_result = MagicMock()
@@ -289,3 +300,82 @@ def test_main_runner_reconcile_with_all_error():
 
         mock_exit.assert_called_once_with(1)
         mock_reconcile.assert_not_called()
+
+
+def test_process_specific_categories_runs_concurrently():
+    """Test that categories overlap and split the OLLAMA_NUM_PARALLEL budget."""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    budgets = []
+
+    def process(category_key, max_concurrency):
+        with lock:
+            budgets.append(max_concurrency)
+            active.append(category_key)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(category_key)
+        return category_key != "Bad"
+
+    with patch.dict(os.environ, {"OLLAMA_NUM_PARALLEL": "5"}), patch(
+        "scripts.process_categories_runner.process_single_category",
+        side_effect=process,
+    ), patch("sys.exit", side_effect=SystemExit) as mock_exit:
+        with pytest.raises(SystemExit):
+            process_specific_categories(["ML", "Tech", "Bad"])
+
+    assert max(peak) == 3
+    assert budgets == [1, 1, 1]
+    mock_exit.assert_called_once_with(1)
+
+
+def test_category_config_loaded_once(mock_category_config):
+    """Test that subcommands share one parsed category configuration."""
+    mock_category_config.get_all_categories.return_value = ["ML"]
+    mock_category_config.get_category_config.return_value = {
+        "name": "ML",
+        "description": "Machine learning",
+    }
+
+    handle_list_categories()
+    validate_categories(["ML"])
+
+    with patch("scripts.process_categories_runner.CategoryConfig") as config_class:
+        _category_config()
+    config_class.assert_not_called()
+
+
+def test_get_processed_articles_unions_windows():
+    """Test that published and crawled windows are queried apart and merged."""
+    mongo_client = MagicMock()
+    mongo_client.feed_items.find.side_effect = [
+        [{"id": "a"}, {"id": "b"}],
+        [{"id": "b"}, {"id": "c"}],
+    ]
+
+    articles = list(_get_processed_articles(mongo_client, 100, 200, 0.6))
+
+    assert [article["id"] for article in articles] == ["a", "b", "c"]
+    queries = [call[0][0] for call in mongo_client.feed_items.find.call_args_list]
+    assert queries[0]["published"] == {"$gte": 100, "$lt": 200}
+    assert "crawled" not in queries[0]
+    assert queries[1]["crawled"] == {"$gte": 100, "$lt": 200}
+    assert all("$or" not in query for query in queries)
+
+
+def test_validate_categories_reports_all_unknown(mock_category_config, capsys):
+    """Test that every unknown category is reported before exiting once."""
+    mock_category_config.get_all_categories.return_value = ["ML", "Tech"]
+
+    validate_categories(["ML", "Tech"])
+    with patch("sys.exit", side_effect=SystemExit) as mock_exit:
+        with pytest.raises(SystemExit):
+            validate_categories(["ML", "Bad", "Worse"])
+
+    mock_exit.assert_called_once_with(1)
+    output = capsys.readouterr().out
+    assert "'Bad' not found" in output
+    assert "'Worse' not found" in output
@@ -1,7 +1,8 @@
+import asyncio
 import os
 import subprocess
 from datetime import datetime
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 import responses
@@ -138,13 +139,13 @@ def mock_dependencies(mock_feedly_session):
 
         # Setup mock LLM
         mock_llm_instance = mock_llm.return_value
-        mock_llm_instance.analyze_item = MagicMock()
-        mock_llm_instance.analyze_item.return_value = {"relevance_score": 0.5}
+        mock_llm_instance.aanalyze_item = AsyncMock()
+        mock_llm_instance.aanalyze_item.return_value = {"relevance_score": 0.5}
 
         # Setup mock mongo
         mock_mongo_instance = mock_mongo.return_value
-        mock_mongo_instance.get_item.return_value = None
-        mock_mongo_instance.item_exists.return_value = False
+        mock_mongo_instance.get_analyzed_ids.return_value = set()
+        mock_mongo_instance.get_existing_ids.return_value = set()
         mock_mongo_instance.store_feed_items = MagicMock()
         mock_mongo_instance.update_item = MagicMock()
         mock_mongo_instance.get_items_by_status.return_value = (
@@ -185,19 +186,19 @@ def test_main_high_quality_articles(
     mock_dependencies["fetcher"].get_stream_contents.return_value = {"items": items}
 
     # Mock MongoDB behavior for the new flow:
-    # 1. First, item_exists returns False for all items (they don't exist yet)
+    # 1. First, none of the items exist yet
     # 2. Then, get_items_by_status returns the items as pending for processing
     pending_items = [
         {**item, "category": "ML", "processing_status": "pending"} for item in items
     ]
 
     # Mock MongoDB methods properly for the 3-step flow
-    mock_dependencies["mongo"].item_exists.return_value = False  # Items don't exist yet
+    mock_dependencies["mongo"].get_existing_ids.return_value = set()
     mock_dependencies["mongo"].get_items_by_status.return_value = pending_items
     mock_dependencies["mongo"].get_filtered_items.return_value = []
 
     # Make first 12 items high quality (>= 0.6 relevance)
-    mock_dependencies["llm"].analyze_item.side_effect = [
+    mock_dependencies["llm"].aanalyze_item.side_effect = [
         {"relevance_score": 0.8}
         if i < 12
         else {"relevance_score": 0.4, "filtered_reason": "low quality"}
@@ -213,8 +214,9 @@ def test_main_high_quality_articles(
     # Should have called git_commit_and_push once after update_feed
     mock_git_commit.assert_called_once()
 
-    # Verify items were stored during fetch phase (called once for each item)
-    assert mock_dependencies["mongo"].store_feed_items.call_count == 15
+    # Verify items were stored in one bulk write during fetch phase
+    mock_dependencies["mongo"].store_feed_items.assert_called_once()
+    assert len(mock_dependencies["mongo"].store_feed_items.call_args[0][0]) == 15
 
 
 def test_main_no_high_quality_articles(
@@ -230,19 +232,19 @@ def test_main_no_high_quality_articles(
     mock_dependencies["fetcher"].get_stream_contents.return_value = {"items": items}
 
     # Mock MongoDB behavior for the new flow:
-    # 1. First, item_exists returns False for all items (they don't exist yet)
+    # 1. First, none of the items exist yet
     # 2. Then, get_items_by_status returns the items as pending for processing
     pending_items = [
         {**item, "category": "ML", "processing_status": "pending"} for item in items
     ]
 
     # Mock MongoDB methods properly for the 3-step flow
-    mock_dependencies["mongo"].item_exists.return_value = False  # Items don't exist yet
+    mock_dependencies["mongo"].get_existing_ids.return_value = set()
     mock_dependencies["mongo"].get_items_by_status.return_value = pending_items
     mock_dependencies["mongo"].get_filtered_items.return_value = []
 
     # Make all items low quality (< 0.6 relevance)
-    mock_dependencies["llm"].analyze_item.return_value = {
+    mock_dependencies["llm"].aanalyze_item.return_value = {
         "relevance_score": 0.4,
         "filtered_reason": "low quality",
     }
@@ -256,8 +258,9 @@ def test_main_no_high_quality_articles(
     # Should not have called git_commit_and_push
     mock_git_commit.assert_not_called()
 
-    # Verify items were stored during fetch phase (called once for each item)
-    assert mock_dependencies["mongo"].store_feed_items.call_count == 5
+    # Verify items were stored in one bulk write during fetch phase
+    mock_dependencies["mongo"].store_feed_items.assert_called_once()
+    assert len(mock_dependencies["mongo"].store_feed_items.call_args[0][0]) == 5
 
 
 @responses.activate
@@ -312,6 +315,21 @@ def test_clean_item_data_url_fetch_failure():
     assert item["leoSummary"]["sentences"] == ["test"]
 
 
+def test_clean_item_data_reuses_url_fetcher():
+    """Test that a shared URL fetcher is used and left open."""
+    url_fetcher = MagicMock()
+    url_fetcher.fetch_url_content.return_value = {"title": "Shared"}
+    item = {"alternate": [{"href": "http://example.com/a"}]}
+
+    with patch("feed_aggregator.etl.process_category.URLFetcher") as mock_class:
+        _clean_item_data(item, url_fetcher)
+
+    mock_class.assert_not_called()
+    url_fetcher.fetch_url_content.assert_called_once_with("http://example.com/a")
+    url_fetcher.close.assert_not_called()
+    assert item["url_content"] == {"title": "Shared"}
+
+
 def test_clean_item_data_no_url():
     """Test handling of items without URLs."""
     item = {"leoSummary": {"sentences": [{"text": "test"}]}}
@@ -353,12 +371,12 @@ def test_main_unpublished_articles_trigger_feed_update(
     ]
 
     # Mock MongoDB methods properly for the 3-step flow
-    mock_dependencies["mongo"].item_exists.return_value = False  # Items don't exist yet
+    mock_dependencies["mongo"].get_existing_ids.return_value = set()
     mock_dependencies["mongo"].get_items_by_status.return_value = pending_items
     mock_dependencies["mongo"].get_filtered_items.return_value = unpublished_articles
 
     # Make all new items high quality but below threshold (3 < 10)
-    mock_dependencies["llm"].analyze_item.return_value = {"relevance_score": 0.8}
+    mock_dependencies["llm"].aanalyze_item.return_value = {"relevance_score": 0.8}
 
     # Run main function
     main()
@@ -370,4 +388,96 @@ def test_main_unpublished_articles_trigger_feed_update(
     mock_git_commit.assert_called_once()
 
     # Verify items were stored during fetch phase
-    assert mock_dependencies["mongo"].store_feed_items.call_count == 3
+    mock_dependencies["mongo"].store_feed_items.assert_called_once()
+    assert len(mock_dependencies["mongo"].store_feed_items.call_args[0][0]) == 3
+
+
+@pytest.fixture
+def llm_peak_concurrency(mock_dependencies):
+    """Record how many LLM requests are in flight as each one starts."""
+    in_flight = []
+    peak = []
+
+    async def analyze(item, client):
+        in_flight.append(item)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(item)
+        return {"relevance_score": 0.8}
+
+    mock_dependencies["llm"].aanalyze_item.side_effect = analyze
+    return peak
+
+
+def test_main_analyzes_pending_articles_concurrently(
+    mock_dependencies,
+    llm_peak_concurrency,
+    mock_update_feed,
+    mock_git_commit,
+    mock_feedly_session,
+    setup_env_vars,
+    test_items,
+):
+    """Test that LLM requests overlap, bounded by OLLAMA_NUM_PARALLEL."""
+    items = test_items(6)
+    mock_dependencies["mongo"].get_items_by_status.return_value = [
+        {**item, "category": "ML", "processing_status": "pending"} for item in items
+    ]
+    with patch.dict(os.environ, {"OLLAMA_NUM_PARALLEL": "3"}):
+        main()
+
+    assert max(llm_peak_concurrency) == 3
+    assert mock_dependencies["mongo"].update_item.call_count == 6
+    llm = mock_dependencies["llm"]
+    llm.async_client.assert_called_once()
+    shared_client = llm.async_client.return_value.__aenter__.return_value
+    assert all(c[0][1] is shared_client for c in llm.aanalyze_item.call_args_list)
+
+
+def test_main_limits_concurrency_to_budget(
+    mock_dependencies,
+    llm_peak_concurrency,
+    mock_update_feed,
+    mock_git_commit,
+    mock_feedly_session,
+    setup_env_vars,
+    test_items,
+):
+    """Test that an explicit budget overrides OLLAMA_NUM_PARALLEL."""
+    items = test_items(4)
+    mock_dependencies["mongo"].get_items_by_status.return_value = [
+        {**item, "category": "ML", "processing_status": "pending"} for item in items
+    ]
+    with patch.dict(os.environ, {"OLLAMA_NUM_PARALLEL": "4"}):
+        main(max_concurrency=1)
+
+    assert max(llm_peak_concurrency) == 1
+
+
+def test_main_skips_already_analyzed_articles(
+    mock_dependencies,
+    mock_update_feed,
+    mock_git_commit,
+    mock_feedly_session,
+    setup_env_vars,
+    test_items,
+):
+    """Test that analyzed articles are found in one query and not re-analyzed."""
+    items = test_items(4)
+    mock_dependencies["mongo"].get_items_by_status.return_value = [
+        {**item, "category": "ML", "processing_status": "pending"} for item in items
+    ]
+    mock_dependencies["mongo"].get_analyzed_ids.return_value = {
+        items[0]["id"],
+        items[2]["id"],
+    }
+
+    main()
+
+    mock_dependencies["mongo"].get_analyzed_ids.assert_called_once()
+    analyzed = [
+        call_args[0][0]["title"]
+        for call_args in mock_dependencies["llm"].aanalyze_item.call_args_list
+    ]
+    assert sorted(analyzed) == sorted([items[1]["title"], items[3]["title"]])
+    assert mock_dependencies["mongo"].update_item.call_count == 2
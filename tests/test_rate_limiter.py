@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from feed_aggregator.processing.rate_limiter import RateLimiter
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        # Yield so concurrent callers contend for the limiter's lock
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's time source and sleep."""
+    fake = FakeClock()
+    with patch(
+        "feed_aggregator.processing.rate_limiter.time.monotonic", fake.monotonic
+    ), patch("feed_aggregator.processing.rate_limiter.asyncio.sleep", fake.sleep):
+        yield fake
+
+
+@pytest.mark.unit
+def test_requests_per_minute(clock):
+    """Test that requests beyond the bucket wait for a refill."""
+    limiter = RateLimiter(rpm=2)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.unit
+def test_tokens_per_minute(clock):
+    """Test that the token bucket limits large requests."""
+    limiter = RateLimiter(rpm=100, tpm=1000)
+
+    async def run():
+        await limiter.acquire(800)
+        await limiter.acquire(800)
+
+    asyncio.run(run())
+
+    # 600 more tokens are needed at 1000 tokens per minute
+    assert clock.sleeps == [pytest.approx(36.0)]
+
+
+@pytest.mark.unit
+def test_oversized_request_is_admitted(clock):
+    """Test that a request above the token budget does not wait forever."""
+    limiter = RateLimiter(rpm=10, tpm=100)
+
+    asyncio.run(limiter.acquire(5000))
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.unit
+def test_invalid_limits():
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter(rpm=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rpm=10, tpm=-1)
+
+
+@pytest.mark.unit
+def test_limiter_reused_across_event_loops(clock):
+    """Test that a limiter still works after a throttled run in another loop."""
+    limiter = RateLimiter(rpm=2)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    asyncio.run(run())
+    asyncio.run(run())
+
+    assert clock.sleeps == [pytest.approx(30.0)] * 6
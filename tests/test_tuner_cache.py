@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+
+from feed_aggregator.processing.llm_cache import MemoryBackend
+from feed_aggregator.processing.tuner_cache import TunerCache, ollama_embedder
+
+CONFIG = {"version": "1.0", "system_prompt": "Score it", "ollama": {"model": "m"}}
+RECORD = {"title": "Title", "content": "Body", "target_score": 0.5}
+RESULT = {"relevance_score": 0.7, "summary": "S", "key_topics": ["A"]}
+
+
+@pytest.mark.unit
+def test_exact_hit_keeps_evaluation_fields():
+    """Test that an exact match returns the stored score and summary."""
+    cache = TunerCache(backend=MemoryBackend())
+    scope = TunerCache.scope_key("ollama", CONFIG)
+
+    assert cache.get(scope, RECORD) is None
+    cache.set(scope, RECORD, RESULT)
+
+    assert cache.get(scope, dict(RECORD, target_score=0.9)) == {
+        "relevance_score": 0.7,
+        "summary": "S",
+    }
+    assert cache.stats == {"hits": 1, "semantic_hits": 0, "misses": 1}
+
+
+@pytest.mark.unit
+def test_scope_ignores_version_and_whitespace():
+    """Test that relabelled or reformatted configs share a scope, edits do not."""
+    scope = TunerCache.scope_key("ollama", CONFIG)
+
+    assert TunerCache.scope_key("ollama", dict(CONFIG, version="1.0_var1")) == scope
+    assert (
+        TunerCache.scope_key("ollama", dict(CONFIG, system_prompt=" Score it  \r\n"))
+        == scope
+    )
+    assert TunerCache.scope_key("ollama", dict(CONFIG, system_prompt="x")) != scope
+    assert TunerCache.scope_key("openai", CONFIG) != scope
+
+
+@pytest.mark.unit
+def test_semantic_hit_for_similar_record():
+    """Test that a near-duplicate record reuses a score within the threshold."""
+    vectors = {"Title\x00Body": [1.0, 0.0], "Title\x00Body!": [0.99, 0.05]}
+    vectors["Other\x00Text"] = [0.0, 1.0]
+    calls = []
+
+    def embed(text):
+        calls.append(text)
+        return vectors[text]
+
+    cache = TunerCache(backend=MemoryBackend(), embed=embed)
+    scope = TunerCache.scope_key("ollama", CONFIG)
+    cache.set(scope, RECORD, RESULT)
+
+    assert cache.get(scope, dict(RECORD, content="Body!"))["relevance_score"] == 0.7
+    assert cache.get(scope, {"title": "Other", "content": "Text"}) is None
+    assert cache.get("other-scope", RECORD) is None
+    assert cache.stats["semantic_hits"] == 1
+    assert calls.count("Title\x00Body") == 1
+
+
+@pytest.mark.unit
+def test_embedding_failure_disables_semantic_lookup():
+    """Test that embedding errors fall back to exact matching."""
+
+    def embed(text):
+        raise RuntimeError("no model")
+
+    cache = TunerCache(backend=MemoryBackend(), embed=embed)
+    scope = TunerCache.scope_key("ollama", CONFIG)
+    cache.set(scope, RECORD, RESULT)
+
+    assert cache.get(scope, RECORD)["summary"] == "S"
+    assert cache.get(scope, dict(RECORD, content="Other")) is None
+
+
+@pytest.mark.unit
+def test_ollama_embedder():
+    """Test that the Ollama embedder returns the first embedding."""
+    with patch(
+        "feed_aggregator.processing.tuner_cache.ollama.embed",
+        return_value={"embeddings": [[0.1, 0.2]]},
+    ) as mock_embed:
+        assert ollama_embedder("emb")("text") == [0.1, 0.2]
+
+    mock_embed.assert_called_once_with(model="emb", input="text")
@@ -70,6 +70,30 @@ def test_fetch_url_content_failure(url_fetcher):
     assert content is None
 
 
+@responses.activate
+def test_fetch_url_content_skips_large_and_non_html(mock_html):
+    """Test that oversized or non-HTML responses are not parsed."""
+    fetcher = URLFetcher(max_bytes=len(mock_html) - 1)
+    responses.add(
+        responses.GET,
+        "http://example.com/large",
+        body=mock_html,
+        content_type="text/html",
+    )
+    responses.add(
+        responses.GET,
+        "http://example.com/report.pdf",
+        body=b"%PDF-1.4",
+        content_type="application/pdf",
+    )
+
+    assert fetcher.fetch_url_content("http://example.com/large") is None
+    assert fetcher.fetch_url_content("http://example.com/report.pdf") is None
+    fetcher.max_bytes = len(mock_html)
+    assert fetcher.fetch_url_content("http://example.com/large") is not None
+    fetcher.close()
+
+
 def test_extract_title_fallbacks(url_fetcher):
     """Test title extraction fallback behavior."""
     # Test regular title fallback